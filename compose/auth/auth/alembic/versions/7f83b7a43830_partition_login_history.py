@@ -44,7 +44,7 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    op.execute('DROP TABLE login_history_january')
-    op.execute('DROP TABLE login_history_february')
-    op.execute('DROP TABLE login_history_march')
-    op.execute('DROP TABLE login_history_april')
+    op.execute('DROP TABLE IF EXISTS login_history_january')
+    op.execute('DROP TABLE IF EXISTS login_history_february')
+    op.execute('DROP TABLE IF EXISTS login_history_march')
+    op.execute('DROP TABLE IF EXISTS login_history_april')
@@ -19,3 +19,4 @@ class ErrorCode(str, Enum):
     OAUTH_INVALID_STATE_TOKEN = 'OAUTH_INVALID_STATE_TOKEN'
     OAUTH_EMAIL_NOT_AVAILABLE = 'OAUTH_EMAIL_NOT_AVAILABLE'
     OAUTH_USER_ALREADY_EXISTS = 'OAUTH_USER_ALREADY_EXISTS'
+    INVALID_CURSOR = 'INVALID_CURSOR'
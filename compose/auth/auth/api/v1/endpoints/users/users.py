@@ -22,8 +22,9 @@ from .....services.users import (
     UserUpdate,
     ExtendedUserRead,
 )
-from .....services.users.authentication.login_history.dependencies import PageDep
-from .....services.users.authentication.login_history.models import LoginHistoryInDb
+from .....services.base.exceptions import InvalidCursor
+from .....services.users.authentication.login_history.dependencies import CursorPageDep, PageDep
+from .....services.users.authentication.login_history.models import LoginHistoryInDb, LoginHistoryPage
 from .....services.users.authentication.login_history.service import LoginHistoryServiceDep
 
 router = APIRouter()
@@ -140,6 +141,7 @@ async def get_users_list(*,
     name='users:history_login_current_user',
     response_model=list[LoginHistoryInDb],
     status_code=status.HTTP_200_OK,
+    deprecated=True,
 )
 async def get_login_history(
         login_history_service: LoginHistoryServiceDep,
@@ -151,3 +153,48 @@ async def get_login_history(
         LoginHistoryInDb.model_validate(login_history, from_attributes=True)
         for login_history in login_history_list
     ]
+
+
+@router.get(
+    '/me/login-history',
+    name='users:login_history_current_user',
+    response_model=LoginHistoryPage,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            'description': 'Token is invalid or missing.',
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            'model': ErrorModel,
+            'content': {
+                'application/json': {
+                    'examples': {
+                        ErrorCode.INVALID_CURSOR: {
+                            'summary': 'The cursor is not the next_cursor of a page.',
+                            'value': {
+                                'detail': ErrorCode.INVALID_CURSOR
+                            },
+                        },
+                    }
+                }
+            },
+        },
+    },
+)
+async def get_login_history_page(login_history_service: LoginHistoryServiceDep,
+                                 cursor_page: CursorPageDep,
+                                 user: CurrentUserDep) -> LoginHistoryPage:
+    try:
+        page = await login_history_service.get_page(user.id, cursor_page)
+    except InvalidCursor:
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST,
+            detail=ErrorCode.INVALID_CURSOR,
+        )
+
+    return LoginHistoryPage(
+        items=[
+            LoginHistoryInDb.model_validate(login_history, from_attributes=True)
+            for login_history in page.items
+        ],
+        next_cursor=page.next_cursor.encode() if page.next_cursor is not None else None,
+    )
@@ -14,6 +14,9 @@ class AuthConfig(BaseSettings):
     access_jwt_lifetime: int = 60 * 60
     refresh_jwt_lifetime: int = 24 * 60 * 60
     sql_echo: bool = False
+    user_cache_size: int = 10_000
+    user_cache_local_timeout: float = 5.0
+    user_cache_timeout: int = 60 * 5
 
     @property
     def oauth2_token_url(self) -> str:
@@ -63,6 +66,31 @@ class CacheConfig(BaseSettings):
     timeout: int = 60 * 5
 
 
+class PasswordConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='password_')
+
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 64 * 1024
+    argon2_parallelism: int = 4
+    bcrypt_rounds: int = 12
+    hash_workers: int | None = None
+    hash_max_waiting: int | None = 100
+
+
+class LoginHistoryConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='login_history_', env_parse_none_str='')
+
+    buffered: bool = True
+    batch_size: int = 500
+    flush_interval: float = 1.0
+    max_pending: int = 10_000
+    partition_months_ahead: int = 3
+    # Login history is kept unless retention is set, expired partitions are archived unless the schema is empty.
+    retention_months: int | None = None
+    archive_schema: str | None = 'auth_archive'
+    partition_maintenance_interval: float | None = 6 * 60 * 60
+
+
 class RateLimiterConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix='ratelimiter_')
 
@@ -87,6 +115,8 @@ class Settings(BaseSettings):
     postgresql: PostgreSQLConfig = PostgreSQLConfig()  # type: ignore[call-arg]
     redis: RedisConfig = RedisConfig()
     cache: CacheConfig = CacheConfig()
+    password: PasswordConfig = PasswordConfig()
+    login_history: LoginHistoryConfig = LoginHistoryConfig()
     ratelimiter: RateLimiterConfig = RateLimiterConfig()
     otel: OpenTelemetryConfig = OpenTelemetryConfig()
     sentry: SentryConfig = SentryConfig()
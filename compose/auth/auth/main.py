@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import dataclasses
 import logging.config
 from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
@@ -32,6 +33,13 @@ from .api.v1.endpoints.users import (
     users,
 )
 from .core import settings, LOGGING
+from .db.sqlalchemy import async_session_maker, engine
+from .services.users import PasswordHashingBusy, password_hash_pool
+from .services.users.authentication.login_history.partitions import (
+    LoginHistoryPartitionMaintainer,
+    LoginHistoryPartitionManager,
+)
+from .services.users.authentication.login_history.writer import LoginHistoryWriter
 
 logging.config.dictConfig(LOGGING)
 
@@ -66,17 +74,64 @@ def configure_otel() -> None:
     ]))
 
 
+def create_login_history_writer() -> LoginHistoryWriter | None:
+    if not settings.login_history.buffered:
+        return None
+
+    return LoginHistoryWriter(
+        session_maker=async_session_maker,
+        batch_size=settings.login_history.batch_size,
+        flush_interval=settings.login_history.flush_interval,
+        max_pending=settings.login_history.max_pending,
+    )
+
+
+def create_login_history_partition_maintainer() -> LoginHistoryPartitionMaintainer | None:
+    if settings.login_history.partition_maintenance_interval is None:
+        return None
+
+    return LoginHistoryPartitionMaintainer(
+        manager=LoginHistoryPartitionManager(
+            engine=engine,
+            months_ahead=settings.login_history.partition_months_ahead,
+            retention_months=settings.login_history.retention_months,
+            archive_schema=settings.login_history.archive_schema,
+        ),
+        interval=settings.login_history.partition_maintenance_interval,
+    )
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[dict]:
     configure_otel()
+    login_history_writer = create_login_history_writer()
+    login_history_partition_maintainer = create_login_history_partition_maintainer()
 
-    async with (
-        redis.Redis(host=settings.redis.host, port=settings.redis.port) as redis_client,
-    ):
-        await FastAPILimiter.init(redis_client)
-        yield {
-            'redis_client': redis_client,
-        }
+    if login_history_writer is not None:
+        login_history_writer.start()
+
+    if login_history_partition_maintainer is not None:
+        login_history_partition_maintainer.start()
+
+    try:
+        async with (
+            redis.Redis(host=settings.redis.host, port=settings.redis.port) as redis_client,
+        ):
+            await FastAPILimiter.init(redis_client)
+            yield {
+                'redis_client': redis_client,
+                'login_history_writer': login_history_writer,
+            }
+
+    finally:
+        if login_history_partition_maintainer is not None:
+            await login_history_partition_maintainer.stop()
+
+        # Buffered logins are written before the process exits.
+        if login_history_writer is not None:
+            await login_history_writer.stop()
+
+        password_hash_pool.shutdown()
 
 
 base_api_prefix = '/auth/api'
@@ -89,7 +144,7 @@ app = FastAPI(
 )
 FastAPIInstrumentor.instrument_app(
     app,
-    excluded_urls=f'{base_api_prefix}/_health',
+    excluded_urls=f'{base_api_prefix}/_health,{base_api_prefix}/_metrics',
     http_capture_headers_server_request=['X-Request-Id'],
 )
 
@@ -107,11 +162,28 @@ async def check_request_id(request: Request, call_next: Callable[[Request], Awai
     return await call_next(request)
 
 
+@app.exception_handler(PasswordHashingBusy)
+async def password_hashing_busy_handler(_request: Request, _exc: PasswordHashingBusy) -> Response:
+    return JSONResponse({
+        'detail': 'Too many password checks in progress, retry later',
+    }, status_code=status.HTTP_503_SERVICE_UNAVAILABLE, headers={'Retry-After': '1'})
+
+
 @app.get(f'{base_api_prefix}/_health')
 async def healthcheck():
     return {}
 
 
+@app.get(f'{base_api_prefix}/_metrics')
+async def metrics():
+    return {
+        'password_hash_pool': {
+            'max_workers': password_hash_pool.max_workers,
+            **dataclasses.asdict(password_hash_pool.stats),
+        },
+    }
+
+
 auth_api_prefix = f'{base_api_prefix}/v1'
 
 app.include_router(
@@ -11,3 +11,7 @@ class AddError(Exception):
 
 class DeleteError(Exception):
     ...
+
+
+class InvalidCursor(Exception):
+    ...
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import dataclasses
+import datetime
+import json
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, and_, literal, tuple_
+from sqlalchemy.orm import QueryableAttribute
+
+from .exceptions import InvalidCursor
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class Cursor:
+    created: datetime.datetime
+    id: uuid.UUID | None = None
+
+    def encode(self) -> str:
+        data = json.dumps([self.created.isoformat(), str(self.id) if self.id is not None else None])
+        return base64.urlsafe_b64encode(data.encode()).rstrip(b'=').decode()
+
+    @classmethod
+    def decode(cls, value: str) -> Cursor:
+        """
+        :raises InvalidCursor: The value is not a cursor.
+        """
+        try:
+            created, id = json.loads(base64.urlsafe_b64decode(value + '=' * (-len(value) % 4)))
+
+            if not isinstance(created, str) or not isinstance(id, str | None):
+                raise InvalidCursor
+
+            return cls(
+                created=datetime.datetime.fromisoformat(created),
+                id=uuid.UUID(id) if id is not None else None,
+            )
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+            raise InvalidCursor from e
+
+
+@dataclasses.dataclass(kw_only=True)
+class KeysetPage[TItem]:
+    items: Sequence[TItem]
+    next_cursor: Cursor | None = None
+
+
+class KeysetPaginator:
+    """
+    Pages through the rows in the order of (created, id), the position is the last row of the previous page.
+
+    Unlike OFFSET, reading a page costs the same at any depth and rows inserted meanwhile do not shift the pages.
+    """
+
+    descending: bool
+
+    def __init__(self,
+                 *,
+                 created_column: QueryableAttribute[datetime.datetime],
+                 id_column: QueryableAttribute[uuid.UUID],
+                 descending: bool = False) -> None:
+        # Declared here, as class attributes the descriptors would be typed as their values.
+        self.created_column: QueryableAttribute[datetime.datetime] = created_column
+        self.id_column: QueryableAttribute[uuid.UUID] = id_column
+        self.descending = descending
+
+    def paginate[TSelect: Select[Any]](self, statement: TSelect, *, after: Cursor | None, count: int) -> TSelect:
+        if after is not None:
+            statement = statement.where(self._create_after_condition(after))
+
+        if self.descending:
+            statement = statement.order_by(self.created_column.desc(), self.id_column.desc())
+        else:
+            statement = statement.order_by(self.created_column, self.id_column)
+
+        return statement.limit(count)
+
+    def paginate_page[TSelect: Select[Any]](self, statement: TSelect, *, after: Cursor | None, count: int) -> TSelect:
+        # One more row tells whether there is a next page.
+        return self.paginate(statement, after=after, count=count + 1)
+
+    def create_page[TItem](self, items: Sequence[TItem], *, count: int) -> KeysetPage[TItem]:
+        if len(items) <= count:
+            return KeysetPage(items=items)
+
+        items = items[:count]
+        last_item = items[-1]
+
+        return KeysetPage(items=items, next_cursor=Cursor(
+            created=getattr(last_item, self.created_column.key),
+            id=getattr(last_item, self.id_column.key),
+        ))
+
+    def _create_after_condition(self, after: Cursor) -> ColumnElement[bool]:
+        if after.id is None:
+            if self.descending:
+                return self.created_column < after.created
+
+            return self.created_column > after.created
+
+        key = tuple_(self.created_column, self.id_column)
+        after_key = tuple_(
+            literal(after.created, self.created_column.type),
+            literal(after.id, self.id_column.type),
+        )
+
+        # The created bound on its own lets PostgreSQL prune partitions, it does not for the row comparison.
+        if self.descending:
+            return and_(self.created_column <= after.created, key < after_key)
+
+        return and_(self.created_column >= after.created, key > after_key)
@@ -10,12 +10,17 @@ from .authentication.backend import (
 from .exceptions import (
     UserDoesNotExist,
     UserAlreadyExists,
-    BadEmailException
+    BadEmailException,
+    PasswordHashingBusy,
 )
 from .manager import (
     UserManager,
     UserManagerDep,
 )
+from .password import (
+    PasswordHelper,
+    password_hash_pool,
+)
 from .oauth import (
     OAuthService,
     OAuthServiceDep,
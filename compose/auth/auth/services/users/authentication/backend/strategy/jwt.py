@@ -86,14 +86,15 @@ class JWTStrategy(Strategy):
         except exceptions.InvalidID:
             return None
 
+        # Revoked tokens are rejected before the user is looked up.
         try:
-            user = await user_manager.get(parsed_id)
-        except exceptions.UserDoesNotExist:
+            await self._validate_token(token_data.token_id)
+        except InvalidToken:
             return None
 
         try:
-            await self._validate_token(token_data.token_id)
-        except InvalidToken:
+            user = await user_manager.get_cached(parsed_id)
+        except exceptions.UserDoesNotExist:
             return None
 
         return user
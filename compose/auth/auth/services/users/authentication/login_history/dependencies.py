@@ -15,3 +15,15 @@ class Page:
 
 
 PageDep = Annotated[Page, Depends()]
+
+
+class CursorPage:
+    size: int
+    cursor: str | None
+
+    def __init__(self, *, page_size: int = 50, cursor: str | None = None) -> None:
+        self.size = min(max(page_size, 1), 50)
+        self.cursor = cursor
+
+
+CursorPageDep = Annotated[CursorPage, Depends()]
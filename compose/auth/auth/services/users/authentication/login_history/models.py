@@ -15,3 +15,8 @@ class LoginHistoryInDb(BaseModel):
     id: uuid.UUID
     user_agent: str
     created: datetime
+
+
+class LoginHistoryPage(BaseModel):
+    items: list[LoginHistoryInDb]
+    next_cursor: str | None = None
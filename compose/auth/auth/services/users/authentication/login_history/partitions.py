@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import datetime
+import logging
+import re
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+PARENT_SCHEMA = 'auth'
+PARENT_TABLE = 'login_history'
+# Serializes the maintenance of the service processes.
+MAINTENANCE_LOCK_ID = 7_238_411_502
+
+PARTITION_BOUND_RE = re.compile(r"FROM \((?P<start>[^)]+)\) TO \((?P<end>[^)]+)\)")
+
+
+@dataclasses.dataclass(kw_only=True)
+class LoginHistoryPartition:
+    schema: str
+    name: str
+    default: bool
+    start: datetime.datetime | None
+    end: datetime.datetime | None
+    size_bytes: int
+    rows_estimate: int
+
+    @property
+    def qualified_name(self) -> str:
+        return f'"{self.schema}"."{self.name}"'
+
+
+@dataclasses.dataclass(kw_only=True)
+class PartitionMaintenanceReport:
+    created: list[str] = dataclasses.field(default_factory=list)
+    dropped: list[str] = dataclasses.field(default_factory=list)
+    archived: list[str] = dataclasses.field(default_factory=list)
+    partitions: list[LoginHistoryPartition] = dataclasses.field(default_factory=list)
+
+
+def get_month_start(value: datetime.datetime, months: int = 0) -> datetime.datetime:
+    month_index = value.year * 12 + value.month - 1 + months
+    return datetime.datetime(month_index // 12, month_index % 12 + 1, 1, tzinfo=datetime.UTC)
+
+
+def parse_partition_bound(value: str) -> datetime.datetime | None:
+    try:
+        return datetime.datetime.fromisoformat(value.strip("'"))
+    except ValueError:
+        # MINVALUE and MAXVALUE.
+        return None
+
+
+class LoginHistoryPartitionManager:
+    """
+    Keeps the monthly partitions of auth.login_history.
+
+    :param months_ahead: Months after the current one to create partitions for.
+    :param retention_months: Months before the current one to keep, all of them are kept when None or 0.
+    :param archive_schema: Schema the expired partitions are moved to instead of being dropped.
+    """
+
+    engine: AsyncEngine
+    months_ahead: int
+    retention_months: int | None
+    archive_schema: str | None
+
+    def __init__(self,
+                 *,
+                 engine: AsyncEngine,
+                 months_ahead: int = 3,
+                 retention_months: int | None = None,
+                 archive_schema: str | None = None) -> None:
+        self.engine = engine
+        self.months_ahead = months_ahead
+        self.retention_months = retention_months
+        self.archive_schema = archive_schema
+
+    async def get_partitions(self) -> list[LoginHistoryPartition]:
+        async with self.engine.connect() as connection:
+            return await self._get_partitions(connection)
+
+    async def maintain(self, *, now: datetime.datetime | None = None) -> PartitionMaintenanceReport:
+        now = now or datetime.datetime.now(datetime.UTC)
+        report = PartitionMaintenanceReport()
+
+        async with self.engine.begin() as connection:
+            locked: bool = (await connection.execute(
+                text('SELECT pg_try_advisory_xact_lock(:lock_id)'),
+                {'lock_id': MAINTENANCE_LOCK_ID},
+            )).scalar_one()
+
+            if not locked:
+                logger.info('The login history partitions are maintained by another process')
+                return report
+
+            partitions = await self._get_partitions(connection)
+            await self._create_partitions(connection, partitions=partitions, now=now, report=report)
+            await self._expire_partitions(connection, partitions=partitions, now=now, report=report)
+
+            report.partitions = await self._get_partitions(connection)
+
+        return report
+
+    async def _create_partitions(self,
+                                 connection: AsyncConnection,
+                                 *,
+                                 partitions: list[LoginHistoryPartition],
+                                 now: datetime.datetime,
+                                 report: PartitionMaintenanceReport) -> None:
+        for months in range(self.months_ahead + 1):
+            start = get_month_start(now, months)
+            end = get_month_start(now, months + 1)
+
+            # Ranges created by hand or by the initial migration are left as they are.
+            if any(
+                    (partition.start is None or partition.start < end)
+                    and (partition.end is None or partition.end > start)
+                    for partition in partitions
+                    if not partition.default
+            ):
+                continue
+
+            name = f'{PARENT_TABLE}_y{start.year}m{start.month:02d}'
+            await connection.execute(text(
+                f'CREATE TABLE "{PARENT_SCHEMA}"."{name}" PARTITION OF "{PARENT_SCHEMA}"."{PARENT_TABLE}" '
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+            report.created.append(name)
+
+    async def _expire_partitions(self,
+                                 connection: AsyncConnection,
+                                 *,
+                                 partitions: list[LoginHistoryPartition],
+                                 now: datetime.datetime,
+                                 report: PartitionMaintenanceReport) -> None:
+        if not self.retention_months:
+            return
+
+        expires_before = get_month_start(now, -self.retention_months)
+
+        for partition in partitions:
+            if partition.default or partition.end is None or partition.end > expires_before:
+                continue
+
+            await connection.execute(text(
+                f'ALTER TABLE "{PARENT_SCHEMA}"."{PARENT_TABLE}" DETACH PARTITION {partition.qualified_name}'
+            ))
+
+            if self.archive_schema is None:
+                await connection.execute(text(f'DROP TABLE {partition.qualified_name}'))
+                report.dropped.append(partition.name)
+                continue
+
+            await connection.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{self.archive_schema}"'))
+            await connection.execute(text(
+                f'ALTER TABLE {partition.qualified_name} SET SCHEMA "{self.archive_schema}"'
+            ))
+            report.archived.append(partition.name)
+
+    async def _get_partitions(self, connection: AsyncConnection) -> list[LoginHistoryPartition]:
+        result = await connection.execute(text('''
+            SELECT
+                child_namespace.nspname AS schema,
+                child.relname AS name,
+                pg_get_expr(child.relpartbound, child.oid) AS bound,
+                pg_total_relation_size(child.oid) AS size_bytes,
+                greatest(child.reltuples, 0)::bigint AS rows_estimate
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_namespace parent_namespace ON parent_namespace.oid = parent.relnamespace
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            JOIN pg_namespace child_namespace ON child_namespace.oid = child.relnamespace
+            WHERE parent_namespace.nspname = :schema AND parent.relname = :table
+        '''), {'schema': PARENT_SCHEMA, 'table': PARENT_TABLE})
+
+        partitions = []
+
+        for row in result.mappings():
+            start = end = None
+
+            if (match := PARTITION_BOUND_RE.search(row['bound'])) is not None:
+                start = parse_partition_bound(match['start'])
+                end = parse_partition_bound(match['end'])
+
+            partitions.append(LoginHistoryPartition(
+                schema=row['schema'],
+                name=row['name'],
+                default=row['bound'] == 'DEFAULT',
+                start=start,
+                end=end,
+                size_bytes=row['size_bytes'],
+                rows_estimate=row['rows_estimate'],
+            ))
+
+        partitions.sort(key=lambda partition: partition.start or datetime.datetime.min.replace(tzinfo=datetime.UTC))
+
+        return partitions
+
+
+class LoginHistoryPartitionMaintainer:
+    manager: LoginHistoryPartitionManager
+    interval: float
+    task: asyncio.Task[None] | None
+
+    def __init__(self, *, manager: LoginHistoryPartitionManager, interval: float) -> None:
+        self.manager = manager
+        self.interval = interval
+        self.task = None
+
+    def start(self) -> None:
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self.task is None:
+            return
+
+        self.task.cancel()
+
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+
+        self.task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                report = await self.manager.maintain()
+            except Exception as e:
+                logger.exception(e)
+            else:
+                if report.created or report.dropped or report.archived:
+                    logger.info(
+                        'Login history partitions created: %s, dropped: %s, archived: %s',
+                        report.created,
+                        report.dropped,
+                        report.archived,
+                    )
+
+            await asyncio.sleep(self.interval)
@@ -13,6 +13,7 @@ from .dependencies import Page
 from .models import (
     LoginHistoryCreate,
 )
+from ....base.pagination import Cursor, KeysetPage, KeysetPaginator
 from .....db.sqlalchemy import (
     AsyncSessionDep,
     AsyncSession
@@ -22,9 +23,15 @@ from .....models.sqlalchemy import LoginHistory
 
 class LoginHistoryRepository:
     _db: AsyncSession
+    _paginator: KeysetPaginator
 
     def __init__(self, db: AsyncSession):
         self._db = db
+        self._paginator = KeysetPaginator(
+            created_column=LoginHistory.created,
+            id_column=LoginHistory.id,
+            descending=True,
+        )
 
     async def create(
             self,
@@ -50,6 +57,7 @@ class LoginHistoryRepository:
         statement = (
             select(LoginHistory)
             .where(LoginHistory.user_id == user_id)
+            .order_by(LoginHistory.created.desc(), LoginHistory.id.desc())
             .limit(page.size)
             .offset((page.number - 1) * page.size)
         )
@@ -57,6 +65,21 @@ class LoginHistoryRepository:
         result = await self._db.execute(statement)
         return result.scalars().all()
 
+    async def get_page_by_user(
+            self,
+            user_id: uuid.UUID,
+            after: Cursor | None,
+            count: int
+    ) -> KeysetPage[LoginHistory]:
+        statement = self._paginator.paginate_page(
+            select(LoginHistory).where(LoginHistory.user_id == user_id),
+            after=after,
+            count=count,
+        )
+
+        result = await self._db.execute(statement)
+        return self._paginator.create_page(result.scalars().all(), count=count)
+
 
 async def get_login_history_repository(
         db: AsyncSessionDep
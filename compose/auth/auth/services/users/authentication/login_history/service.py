@@ -6,32 +6,56 @@ from typing import Annotated
 
 from fastapi import Depends
 
-from .dependencies import Page
+from .dependencies import CursorPage, Page
 from .models import LoginHistoryCreate
 from .repository import (
     LoginHistoryRepositoryDep,
     LoginHistoryRepository
 )
+from .writer import LoginHistoryWriter, LoginHistoryWriterDep
+from ....base.pagination import Cursor, KeysetPage
 from .....models.sqlalchemy import LoginHistory
 
 
 class LoginHistoryService:
     _repository: LoginHistoryRepository
+    _writer: LoginHistoryWriter | None
 
-    def __init__(self, repository: LoginHistoryRepository):
+    def __init__(self, repository: LoginHistoryRepository, writer: LoginHistoryWriter | None = None):
         self._repository = repository
+        self._writer = writer
 
     async def record_to_log(self, row: LoginHistoryCreate):
+        if self._writer is not None:
+            await self._writer.record(row)
+            return
+
         await self._repository.create(row)
 
     async def get_list(self, user_id: uuid.UUID, page: Page) -> Sequence[LoginHistory]:
+        # Logins buffered by this process are listed as well.
+        if self._writer is not None:
+            await self._writer.flush()
+
         return await self._repository.get_list_by_user(user_id, page)
 
+    async def get_page(self, user_id: uuid.UUID, cursor_page: CursorPage) -> KeysetPage[LoginHistory]:
+        """
+        :raises InvalidCursor: The cursor was not returned by a previous page.
+        """
+        after = Cursor.decode(cursor_page.cursor) if cursor_page.cursor is not None else None
+
+        if self._writer is not None:
+            await self._writer.flush()
+
+        return await self._repository.get_page_by_user(user_id, after, cursor_page.size)
+
 
 async def get_login_history_service(
-        db: LoginHistoryRepositoryDep
+        db: LoginHistoryRepositoryDep,
+        writer: LoginHistoryWriterDep,
 ) -> LoginHistoryService:
-    return LoginHistoryService(db)
+    return LoginHistoryService(db, writer)
 
 
 LoginHistoryServiceDep = Annotated[
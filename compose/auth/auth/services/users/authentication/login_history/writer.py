@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import uuid
+from typing import Annotated, Any
+
+from fastapi import Depends, Request
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from .models import LoginHistoryCreate
+from .....models.sqlalchemy import LoginHistory
+
+logger = logging.getLogger(__name__)
+
+
+class LoginHistoryWriter:
+    """
+    Buffers login history rows and inserts them in batches.
+
+    A batch is written once batch_size rows are pending or flush_interval seconds passed.
+    Past max_pending rows, recording waits for the backlog to be written.
+    """
+
+    session_maker: async_sessionmaker[AsyncSession]
+    batch_size: int
+    flush_interval: float
+    max_pending: int
+
+    rows: list[dict[str, Any]]
+    flush_lock: asyncio.Lock
+    batch_ready: asyncio.Event
+    task: asyncio.Task[None] | None
+
+    def __init__(self,
+                 *,
+                 session_maker: async_sessionmaker[AsyncSession],
+                 batch_size: int = 500,
+                 flush_interval: float = 1.0,
+                 max_pending: int = 10_000) -> None:
+        self.session_maker = session_maker
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self.rows = []
+        self.flush_lock = asyncio.Lock()
+        self.batch_ready = asyncio.Event()
+        self.task = None
+
+    def start(self) -> None:
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+            self.task = None
+
+        await self.flush()
+
+    async def record(self, row: LoginHistoryCreate) -> None:
+        while len(self.rows) >= self.max_pending:
+            await self.flush()
+
+        self.rows.append({
+            'id': uuid.uuid4(),
+            'user_id': row.user_id,
+            'user_agent': row.user_agent,
+            'created': datetime.datetime.now(datetime.UTC),
+        })
+
+        if len(self.rows) >= self.batch_size:
+            self.batch_ready.set()
+
+    async def flush(self) -> None:
+        async with self.flush_lock:
+            while self.rows:
+                rows = self.rows[:self.batch_size]
+                del self.rows[:self.batch_size]
+                await self._insert(rows)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self.batch_ready.wait(), timeout=self.flush_interval)
+            except TimeoutError:
+                pass
+
+            self.batch_ready.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.exception(e)
+
+    async def _insert(self, rows: list[dict[str, Any]]) -> None:
+        try:
+            await self._execute(rows)
+            return
+
+        except IntegrityError:
+            # A row of a deleted user fails the whole batch, the others are inserted one by one.
+            pass
+
+        except SQLAlchemyError as e:
+            logger.exception(e)
+            logger.error('%d login history rows are lost', len(rows))
+            return
+
+        for row in rows:
+            try:
+                await self._execute([row])
+            except SQLAlchemyError as e:
+                logger.warning('Login history row of user %s is lost: %s', row['user_id'], e)
+
+    async def _execute(self, rows: list[dict[str, Any]]) -> None:
+        async with self.session_maker() as session, session.begin():
+            await session.execute(insert(LoginHistory).values(rows))
+
+
+async def get_login_history_writer(request: Request) -> LoginHistoryWriter | None:
+    return request.state.login_history_writer
+
+
+LoginHistoryWriterDep = Annotated[LoginHistoryWriter | None, Depends(get_login_history_writer)]
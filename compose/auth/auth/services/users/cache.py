@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import datetime
+import time
+import uuid
+from collections import OrderedDict
+from typing import Annotated
+
+from fastapi import Depends
+from pydantic import BaseModel, ConfigDict
+
+from ..cache import (
+    AbstractCache,
+    CacheServiceDep,
+)
+from ...core import settings
+from ...models.sqlalchemy import User
+
+
+class UserSnapshot(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: uuid.UUID
+    login: str | None = None
+    email: str | None = None
+    is_superuser: bool = False
+    created: datetime.datetime
+    modified: datetime.datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> UserSnapshot:
+        return cls(
+            id=user.id,
+            login=user.login,
+            email=user.email,
+            is_superuser=user.is_superuser,
+            created=user.created,
+            modified=user.modified,
+        )
+
+
+class LocalUserCache:
+    max_size: int
+    timeout: float
+    snapshots: OrderedDict[uuid.UUID, tuple[float, UserSnapshot]]
+
+    def __init__(self, *, max_size: int, timeout: float) -> None:
+        self.max_size = max_size
+        self.timeout = timeout
+        self.snapshots = OrderedDict()
+
+    def get(self, id: uuid.UUID) -> UserSnapshot | None:
+        item = self.snapshots.get(id)
+
+        if item is None:
+            return None
+
+        expires_at, snapshot = item
+
+        if expires_at < time.monotonic():
+            del self.snapshots[id]
+            return None
+
+        self.snapshots.move_to_end(id)
+        return snapshot
+
+    def set(self, snapshot: UserSnapshot) -> None:
+        if not self.max_size:
+            return
+
+        self.snapshots[snapshot.id] = time.monotonic() + self.timeout, snapshot
+        self.snapshots.move_to_end(snapshot.id)
+
+        while len(self.snapshots) > self.max_size:
+            self.snapshots.popitem(last=False)
+
+    def delete(self, id: uuid.UUID) -> None:
+        self.snapshots.pop(id, None)
+
+
+# Shared by the requests of a worker, other workers see a change once their copy expires.
+local_user_cache = LocalUserCache(
+    max_size=settings.auth.user_cache_size,
+    timeout=settings.auth.user_cache_local_timeout,
+)
+
+
+class UserCache:
+    cache: AbstractCache
+    local_cache: LocalUserCache
+    timeout: int
+
+    def __init__(self,
+                 *,
+                 cache: AbstractCache,
+                 local_cache: LocalUserCache,
+                 timeout: int) -> None:
+        self.cache = cache
+        self.local_cache = local_cache
+        self.timeout = timeout
+
+    async def get(self, id: uuid.UUID) -> UserSnapshot | None:
+        snapshot = self.local_cache.get(id)
+
+        if snapshot is not None:
+            return snapshot
+
+        data = await self.cache.get(str(id))
+
+        if data is None:
+            return None
+
+        snapshot = UserSnapshot.model_validate_json(data)
+        self.local_cache.set(snapshot)
+
+        return snapshot
+
+    async def set(self, user: User) -> UserSnapshot:
+        snapshot = UserSnapshot.from_user(user)
+        self.local_cache.set(snapshot)
+        await self.cache.set(str(snapshot.id), snapshot.model_dump_json(), timeout=self.timeout)
+
+        return snapshot
+
+    async def delete(self, id: uuid.UUID) -> None:
+        self.local_cache.delete(id)
+        await self.cache.delete(str(id))
+
+
+async def get_user_cache(cache_service: CacheServiceDep) -> UserCache:
+    return UserCache(
+        cache=cache_service.get_cache(key_prefix='users'),
+        local_cache=local_user_cache,
+        timeout=settings.auth.user_cache_timeout,
+    )
+
+
+UserCacheDep = Annotated[UserCache, Depends(get_user_cache)]
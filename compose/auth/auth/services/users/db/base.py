@@ -34,6 +34,9 @@ class BaseUserDatabase:
     async def create(self, create_dict: dict[str, Any]) -> User:
         raise NotImplementedError
 
+    async def restore(self, user_dict: dict[str, Any]) -> User:
+        raise NotImplementedError
+
     async def update(self, user: User, update_dict: dict[str, Any]) -> User:
         raise NotImplementedError
 
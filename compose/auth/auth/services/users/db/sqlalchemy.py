@@ -5,17 +5,13 @@ import uuid
 from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import (
-    select,
-    or_,
-    and_,
-    true,
-    ColumnElement,
-)
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 from sqlalchemy.sql import Select
 
 from ..db.base import BaseUserDatabase
+from ...base.pagination import Cursor, KeysetPaginator
 from ....models.sqlalchemy import (
     User,
     OAuthAccount,
@@ -26,6 +22,7 @@ class SQLAlchemyUserDatabase(BaseUserDatabase):
     session: AsyncSession
     user_table: type[User]
     oauth_account_table: type[OAuthAccount]
+    paginator: KeysetPaginator
 
     def __init__(self,
                  *,
@@ -35,6 +32,7 @@ class SQLAlchemyUserDatabase(BaseUserDatabase):
         self.session = session
         self.user_table = user_table
         self.oauth_account_table = oauth_account_table
+        self.paginator = KeysetPaginator(created_column=user_table.created, id_column=user_table.id)
 
     async def get(self, id: uuid.UUID) -> User | None:
         statement = select(self.user_table).where(self.user_table.id == id)
@@ -45,30 +43,10 @@ class SQLAlchemyUserDatabase(BaseUserDatabase):
                        id: uuid.UUID | None = None,
                        created: datetime.datetime | None = None,
                        count: int) -> Sequence[User]:
-        created_parts: list[ColumnElement[bool]] = []
-
-        if created is not None:
-            created_parts.append(
-                self.user_table.created > created,
-            )
-
-        if created is not None and id is not None:
-            created_parts.append(
-                and_(
-                    self.user_table.created == created,
-                    self.user_table.id > id,
-                ),
-            )
-
-        statement = select(
-            self.user_table,
-        ).where(
-            or_(*created_parts) if created_parts else true(),
-        ).limit(
-            count,
-        ).order_by(
-            self.user_table.created,
-            self.user_table.id,
+        statement = self.paginator.paginate(
+            select(self.user_table),
+            after=Cursor(created=created, id=id) if created is not None else None,
+            count=count,
         )
 
         return await self._get_users_list(statement)
@@ -97,6 +75,13 @@ class SQLAlchemyUserDatabase(BaseUserDatabase):
         await self.session.refresh(user)
         return user
 
+    async def restore(self, user_dict: dict[str, Any]) -> User:
+        # The user is attached as if it had been loaded, without a query, the attributes missing from the dict
+        # are expired and need a refresh before they are read.
+        user = self.user_table(**user_dict)
+        make_transient_to_detached(user)
+        return await self.session.merge(user, load=False)
+
     async def update(self, user: User, update_dict: dict[str, Any]) -> User:
         for key, value in update_dict.items():
             setattr(user, key, value)
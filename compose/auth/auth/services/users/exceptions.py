@@ -17,4 +17,8 @@ class UserAlreadyExists(UsersException):
     pass
 
 class BadEmailException(UsersException):
+    pass
+
+
+class PasswordHashingBusy(UsersException):
     pass
\ No newline at end of file
@@ -12,6 +12,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from . import exceptions
 from .authentication.login_history.models import LoginHistoryCreate
 from .authentication.login_history.service import LoginHistoryService, LoginHistoryServiceDep
+from .cache import UserCache, UserCacheDep
 from .db import (
     BaseUserDatabase,
     UserDatabaseDep,
@@ -26,20 +27,24 @@ class UserManager:
     User management logic.
 
     :param user_db: Database adapter instance.
+    :param user_cache: Cache of the users read by the token strategies.
     """
 
     user_db: BaseUserDatabase
     password_helper: PasswordHelperProtocol
     login_logger: LoginHistoryService
+    user_cache: UserCache | None
 
     def __init__(
             self,
             user_db: BaseUserDatabase,
             login_logger: LoginHistoryService,
             password_helper: Optional[PasswordHelperProtocol] = None,
+            user_cache: UserCache | None = None,
     ):
         self.user_db = user_db
         self.login_logger = login_logger
+        self.user_cache = user_cache
         if password_helper is None:
             self.password_helper = PasswordHelper()
         else:
@@ -68,6 +73,29 @@ class UserManager:
 
         return user
 
+    async def get_cached(self, id: uuid.UUID) -> User:
+        """
+        Get a user by id, from the cache if possible.
+
+        A cached user carries the columns of UserSnapshot only.
+
+        :param id: Id. of the user to retrieve.
+        :raises UserDoesNotExist: The user does not exist.
+        :return: A user.
+        """
+        if self.user_cache is None:
+            return await self.get(id)
+
+        snapshot = await self.user_cache.get(id)
+
+        if snapshot is not None:
+            return await self.user_db.restore(snapshot.model_dump())
+
+        user = await self.get(id)
+        await self.user_cache.set(user)
+
+        return user
+
     async def get_list(self,
                        *,
                        id: uuid.UUID | None = None,
@@ -124,7 +152,7 @@ class UserManager:
 
         user_dict = user_create.model_dump()
         password = user_dict.pop("password")
-        user_dict["password"] = self.password_helper.hash(password)
+        user_dict["password"] = await self.password_helper.hash(password)
 
         created_user = await self.user_db.create(user_dict)
 
@@ -160,10 +188,10 @@ class UserManager:
         except exceptions.UserDoesNotExist:
             # Run the hasher to mitigate timing attack
             # Inspired from Django: https://code.djangoproject.com/ticket/20760
-            self.password_helper.hash(credentials.password)
+            await self.password_helper.hash(credentials.password)
             return None
 
-        verified, updated_password_hash = self.password_helper.verify_and_update(
+        verified, updated_password_hash = await self.password_helper.verify_and_update(
             credentials.password, user.password
         )
         if not verified:
@@ -171,7 +199,8 @@ class UserManager:
 
         # Update password hash to a more robust one if needed
         if updated_password_hash is not None:
-            await self.user_db.update(user, {"password": updated_password_hash})
+            user = await self.user_db.update(user, {"password": updated_password_hash})
+            await self._on_after_change(user)
 
         await self._record_user_login(user, request)
 
@@ -200,12 +229,30 @@ class UserManager:
                     validated_update_dict["login"] = value
 
             elif field == "password" and value is not None:
-                validated_update_dict["password"] = self.password_helper.hash(value)
+                validated_update_dict["password"] = await self.password_helper.hash(value)
 
             else:
                 validated_update_dict[field] = value
 
-        return await self.user_db.update(user, validated_update_dict)
+        updated_user = await self.user_db.update(user, validated_update_dict)
+        await self._on_after_change(updated_user)
+
+        return updated_user
+
+    async def delete(self, user: User) -> None:
+        """
+        Delete a user.
+
+        :param user: The user to delete.
+        """
+        await self.user_db.delete(user)
+
+        if self.user_cache is not None:
+            await self.user_cache.delete(user.id)
+
+    async def _on_after_change(self, user: User) -> None:
+        if self.user_cache is not None:
+            await self.user_cache.set(user)
 
     async def oauth_callback(self,
                              *,
@@ -234,7 +281,7 @@ class UserManager:
                 password = self.password_helper.generate()
                 user_dict = {
                     'email': account_email,
-                    'password': self.password_helper.hash(password),
+                    'password': await self.password_helper.hash(password),
                 }
                 user = await self.user_db.create(user_dict)
 
@@ -257,8 +304,10 @@ class UserManager:
         return user
 
 
-async def get_user_manager(user_db: UserDatabaseDep, login_logger: LoginHistoryServiceDep) -> UserManager:
-    return UserManager(user_db=user_db, login_logger=login_logger)
+async def get_user_manager(user_db: UserDatabaseDep,
+                           login_logger: LoginHistoryServiceDep,
+                           user_cache: UserCacheDep) -> UserManager:
+    return UserManager(user_db=user_db, login_logger=login_logger, user_cache=user_cache)
 
 
 UserManagerDep = Annotated[UserManager, Depends(get_user_manager)]
@@ -1,42 +1,140 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import functools
+import os
 import secrets
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Protocol, Union
 
 from pwdlib import PasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher
 from pwdlib.hashers.bcrypt import BcryptHasher
 
+from .exceptions import PasswordHashingBusy
+from ...core import settings
+
 
 class PasswordHelperProtocol(Protocol):
-    def verify_and_update(
+    async def verify_and_update(
             self, plain_password: str, hashed_password: str
     ) -> tuple[bool, Union[str, None]]: ...
 
-    def hash(self, password: str) -> str: ...
+    async def hash(self, password: str) -> str: ...
 
     def generate(self) -> str: ...
 
 
+@dataclasses.dataclass(kw_only=True)
+class PasswordHashPoolStats:
+    running: int = 0
+    waiting: int = 0
+    max_waiting: int = 0
+    completed: int = 0
+    rejected: int = 0
+    wait_seconds: float = 0.0
+    run_seconds: float = 0.0
+
+
+class PasswordHashPool:
+    """
+    Runs password hashing in worker threads, so it does not block the event loop.
+
+    Argon2 and bcrypt release the GIL, the threads hash in parallel.
+
+    :param max_workers: Hashes computed at the same time, the CPU count by default.
+    :param max_waiting: Hashes allowed to wait for a worker, the others are rejected.
+    """
+
+    max_workers: int
+    max_waiting: int | None
+    executor: ThreadPoolExecutor
+    semaphore: asyncio.Semaphore
+    stats: PasswordHashPoolStats
+
+    def __init__(self, *, max_workers: int | None = None, max_waiting: int | None = None) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_waiting = max_waiting
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='password-hash')
+        self.semaphore = asyncio.Semaphore(self.max_workers)
+        self.stats = PasswordHashPoolStats()
+
+    async def run[TResult](self, function: Callable[..., TResult], *args: str) -> TResult:
+        """
+        :raises PasswordHashingBusy: Too many hashes are waiting for a worker.
+        """
+        if self.max_waiting is not None and self.stats.waiting >= self.max_waiting:
+            self.stats.rejected += 1
+            raise PasswordHashingBusy
+
+        queued_at = time.perf_counter()
+        self.stats.waiting += 1
+        self.stats.max_waiting = max(self.stats.max_waiting, self.stats.waiting)
+
+        try:
+            await self.semaphore.acquire()
+        finally:
+            self.stats.waiting -= 1
+
+        started_at = time.perf_counter()
+        self.stats.running += 1
+        self.stats.wait_seconds += started_at - queued_at
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, functools.partial(function, *args))
+        finally:
+            self.semaphore.release()
+            self.stats.running -= 1
+            self.stats.completed += 1
+            self.stats.run_seconds += time.perf_counter() - started_at
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.password.hash_workers,
+    max_waiting=settings.password.hash_max_waiting,
+)
+
+
+def create_password_hash() -> PasswordHash:
+    return PasswordHash(
+        (
+            Argon2Hasher(
+                time_cost=settings.password.argon2_time_cost,
+                memory_cost=settings.password.argon2_memory_cost,
+                parallelism=settings.password.argon2_parallelism,
+            ),
+            BcryptHasher(rounds=settings.password.bcrypt_rounds),
+        )
+    )
+
+
 class PasswordHelper(PasswordHelperProtocol):
-    def __init__(self, password_hash: Optional[PasswordHash] = None) -> None:
+    def __init__(self,
+                 password_hash: Optional[PasswordHash] = None,
+                 pool: Optional[PasswordHashPool] = None) -> None:
         if password_hash is None:
-            self.password_hash = PasswordHash(
-                (
-                    Argon2Hasher(),
-                    BcryptHasher(),
-                )
-            )
+            self.password_hash = create_password_hash()
         else:
             self.password_hash = password_hash
 
-    def verify_and_update(
+        if pool is None:
+            self.pool = password_hash_pool
+        else:
+            self.pool = pool
+
+    async def verify_and_update(
             self, plain_password: str, hashed_password: str
     ) -> tuple[bool, Union[str, None]]:
-        return self.password_hash.verify_and_update(plain_password, hashed_password)
+        return await self.pool.run(self.password_hash.verify_and_update, plain_password, hashed_password)
 
-    def hash(self, password: str) -> str:
-        return self.password_hash.hash(password)
+    async def hash(self, password: str) -> str:
+        return await self.pool.run(self.password_hash.hash, password)
 
     def generate(self) -> str:
         return secrets.token_urlsafe()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import sys
+import time
 from pathlib import Path
 
 from sqlalchemy import insert
@@ -12,8 +13,10 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(BASE_DIR))
 
 from auth.db.sqlalchemy import engine  # noqa: E402
+from auth.services.users.authentication.login_history.partitions import LoginHistoryPartitionManager  # noqa: E402
 from auth.models.sqlalchemy import User  # noqa: E402
-from auth.services.users.password import PasswordHelper  # noqa: E402
+from auth.core import settings  # noqa: E402
+from auth.services.users.password import PasswordHashPool, PasswordHelper  # noqa: E402
 
 app = Typer()
 
@@ -28,7 +31,7 @@ async def create_superuser_async(login: str, password: str):
 
         superuser = {
             "login": login,
-            "password": PasswordHelper().hash(password),
+            "password": await PasswordHelper().hash(password),
             "is_superuser": True
         }
 
@@ -45,5 +48,81 @@ async def create_superuser_async(login: str, password: str):
             await connection.close()
 
 
+@app.command()
+def benchmark_password_hash(count: int = 100, workers: int | None = None):
+    asyncio.run(benchmark_password_hash_async(count=count, workers=workers))
+
+
+async def benchmark_password_hash_async(count: int, workers: int | None):
+    pool = PasswordHashPool(max_workers=workers or settings.password.hash_workers)
+    password_helper = PasswordHelper(pool=pool)
+    print(f"argon2 time_cost={settings.password.argon2_time_cost} "
+          f"memory_cost={settings.password.argon2_memory_cost} "
+          f"parallelism={settings.password.argon2_parallelism}, {pool.max_workers} worker(s)")
+
+    try:
+        started_at = time.perf_counter()
+        hashed_password = await password_helper.hash('password')
+        print(f"hash: {(time.perf_counter() - started_at) * 1000:.1f}ms")
+
+        started_at = time.perf_counter()
+        await password_helper.verify_and_update('password', hashed_password)
+        print(f"verify: {(time.perf_counter() - started_at) * 1000:.1f}ms")
+
+        # A login verifies one password, the throughput is the login capacity of one auth process.
+        started_at = time.perf_counter()
+        await asyncio.gather(*(
+            password_helper.verify_and_update('password', hashed_password)
+            for _ in range(count)
+        ))
+        seconds = time.perf_counter() - started_at
+        print(f"{count} verifications in {seconds:.2f}s: {count / seconds:.1f} logins/s per process, "
+              f"mean wait {pool.stats.wait_seconds / pool.stats.completed * 1000:.1f}ms")
+    finally:
+        pool.shutdown()
+
+
+@app.command()
+def maintain_login_history_partitions(months_ahead: int = settings.login_history.partition_months_ahead,
+                                      retention_months: int | None = settings.login_history.retention_months,
+                                      archive_schema: str | None = settings.login_history.archive_schema,
+                                      report_only: bool = False):
+    asyncio.run(maintain_login_history_partitions_async(
+        months_ahead=months_ahead,
+        retention_months=retention_months,
+        archive_schema=archive_schema,
+        report_only=report_only,
+    ))
+
+
+async def maintain_login_history_partitions_async(months_ahead: int,
+                                                  retention_months: int | None,
+                                                  archive_schema: str | None,
+                                                  report_only: bool):
+    manager = LoginHistoryPartitionManager(
+        engine=engine,
+        months_ahead=months_ahead,
+        retention_months=retention_months,
+        archive_schema=archive_schema,
+    )
+
+    try:
+        if report_only:
+            partitions = await manager.get_partitions()
+        else:
+            report = await manager.maintain()
+            partitions = report.partitions
+            print(f"created: {report.created or '-'}, dropped: {report.dropped or '-'}, "
+                  f"archived: {report.archived or '-'}")
+
+        for partition in partitions:
+            start = partition.start or 'MINVALUE'
+            end = partition.end or 'MAXVALUE'
+            print(f"{partition.qualified_name:45} {start!s:26} {end!s:26} "
+                  f"{partition.size_bytes / 1024 / 1024:10.1f} MiB {partition.rows_estimate:>12,} rows")
+    finally:
+        await engine.dispose()
+
+
 if __name__ == '__main__':
     app()
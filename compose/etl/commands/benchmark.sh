@@ -0,0 +1,6 @@
+#!/usr/bin/env bash
+
+set -e
+
+cd /opt/app
+python -m etl.benchmarks.pipeline "$@"
@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import datetime
+import os
+import random
+import string
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from collections.abc import Iterable
+from pathlib import Path
+
+import elasticsearch
+import psycopg
+from psycopg import sql
+
+from ..settings import settings
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+INDEX_NAMES = ('films', 'genres', 'persons')
+ROLES = ('actor', 'director', 'writer')
+
+
+@dataclasses.dataclass(kw_only=True)
+class CatalogConfig:
+    films_count: int
+    persons_count: int
+    genres_count: int
+    chunk_size: int
+    seed: int
+
+
+@dataclasses.dataclass(kw_only=True)
+class SyncResult:
+    index_name: str
+    documents: int
+    seconds: float
+
+    @property
+    def documents_per_second(self) -> float:
+        if not self.seconds:
+            return 0.0
+
+        return self.documents / self.seconds
+
+
+class CatalogGenerator:
+    config: CatalogConfig
+    random: random.Random
+    now: datetime.datetime
+    words: list[str]
+
+    genre_ids: list[uuid.UUID]
+    person_ids: list[uuid.UUID]
+
+    def __init__(self, *, config: CatalogConfig) -> None:
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        self.words = [self.create_word() for _ in range(5000)]
+
+        self.genre_ids = []
+        self.person_ids = []
+
+    def create_word(self) -> str:
+        return ''.join(self.random.choices(string.ascii_lowercase, k=self.random.randint(3, 10))).capitalize()
+
+    def create_id(self) -> uuid.UUID:
+        return uuid.UUID(int=self.random.getrandbits(128), version=4)
+
+    def create_timestamp(self) -> datetime.datetime:
+        return self.now - datetime.timedelta(seconds=self.random.randrange(365 * 24 * 3600))
+
+    def create_genres(self) -> Iterable[tuple]:
+        for index in range(self.config.genres_count):
+            genre_id = self.create_id()
+            self.genre_ids.append(genre_id)
+            created = self.create_timestamp()
+
+            yield genre_id, f'{self.create_word()} {index}', None, created, created
+
+    def create_persons(self) -> Iterable[tuple]:
+        for _ in range(self.config.persons_count):
+            person_id = self.create_id()
+            self.person_ids.append(person_id)
+            created = self.create_timestamp()
+
+            yield person_id, ' '.join(self.random.choices(self.words, k=2)), created, created
+
+    def create_film_works(self) -> Iterable[tuple[list[tuple], list[tuple], list[tuple]]]:
+        for offset in range(0, self.config.films_count, self.config.chunk_size):
+            film_works: list[tuple] = []
+            genre_film_works: list[tuple] = []
+            person_film_works: list[tuple] = []
+
+            for _ in range(min(self.config.chunk_size, self.config.films_count - offset)):
+                film_work_id = self.create_id()
+                created = self.create_timestamp()
+                film_works.append((
+                    film_work_id,
+                    ' '.join(self.random.choices(self.words, k=3)),
+                    ' '.join(self.random.choices(self.words, k=20)).lower(),
+                    round(self.random.uniform(1.0, 10.0), 1),
+                    'movie',
+                    created,
+                    created,
+                ))
+
+                for genre_id in self.random.sample(self.genre_ids, min(len(self.genre_ids), self.random.randint(1, 2))):
+                    genre_film_works.append((self.create_id(), genre_id, film_work_id, created))
+
+                for role in ROLES:
+                    persons_count = self.random.randint(1, 6 if role == 'actor' else 2)
+
+                    for person_id in self.random.sample(self.person_ids, min(len(self.person_ids), persons_count)):
+                        person_film_works.append((self.create_id(), person_id, film_work_id, role, created))
+
+            yield film_works, genre_film_works, person_film_works
+
+
+def seed_catalog(*, connection: psycopg.Connection, config: CatalogConfig) -> None:
+    generator = CatalogGenerator(config=config)
+
+    with connection.cursor() as cursor:
+        copy_rows(cursor=cursor, table_name='genre', columns=(
+            'id', 'name', 'description', 'created', 'modified',
+        ), rows=generator.create_genres())
+        copy_rows(cursor=cursor, table_name='person', columns=(
+            'id', 'full_name', 'created', 'modified',
+        ), rows=generator.create_persons())
+        connection.commit()
+
+        for film_works, genre_film_works, person_film_works in generator.create_film_works():
+            copy_rows(cursor=cursor, table_name='film_work', columns=(
+                'id', 'title', 'description', 'rating', 'type', 'created', 'modified',
+            ), rows=film_works)
+            copy_rows(cursor=cursor, table_name='genre_film_work', columns=(
+                'id', 'genre_id', 'film_work_id', 'created',
+            ), rows=genre_film_works)
+            copy_rows(cursor=cursor, table_name='person_film_work', columns=(
+                'id', 'person_id', 'film_work_id', 'role', 'created',
+            ), rows=person_film_works)
+            connection.commit()
+
+
+def copy_rows(*, cursor: psycopg.Cursor, table_name: str, columns: tuple[str, ...], rows: Iterable[tuple]) -> None:
+    query = sql.SQL('COPY {table_name} ({columns}) FROM STDIN').format(
+        table_name=sql.Identifier('content', table_name),
+        columns=sql.SQL(', ').join(map(sql.Identifier, columns)),
+    )
+
+    with cursor.copy(query) as copy:
+        for row in rows:
+            copy.write_row(row)
+
+
+def count_documents(*, connection: psycopg.Connection) -> dict[str, int]:
+    return {
+        index_name: connection.execute(sql.SQL('SELECT count(*) FROM {table_name}').format(
+            table_name=sql.Identifier('content', table_name),
+        )).fetchone()[0]  # type: ignore[index]
+        for index_name, table_name in zip(INDEX_NAMES, ('film_work', 'genre', 'person'))
+    }
+
+
+def start_etl(*, data_dir: str) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, str(BASE_DIR / 'etl' / 'commands' / 'transfer_data.py')],
+        env={**os.environ, 'ETL_DATA_DIR': data_dir},
+    )
+
+
+def count_index(*, client: elasticsearch.Elasticsearch, index_name: str, query: dict | None = None) -> int:
+    try:
+        return client.count(index=index_name, query=query)['count']
+    except elasticsearch.NotFoundError:
+        return 0
+
+
+def wait_for_sync(*,
+                  client: elasticsearch.Elasticsearch,
+                  expected_counts: dict[str, int],
+                  started_at: float,
+                  etl_process: subprocess.Popen,
+                  timeout: float) -> list[SyncResult]:
+    results: dict[str, SyncResult] = {}
+
+    while len(results) < len(expected_counts):
+        if etl_process.poll() is not None:
+            raise RuntimeError(f'The ETL exited with code {etl_process.returncode}')
+
+        if time.perf_counter() - started_at > timeout:
+            raise TimeoutError(f'{sorted(set(expected_counts) - set(results))} not synced in {timeout:.0f}s')
+
+        for index_name, expected_count in expected_counts.items():
+            if index_name not in results and count_index(client=client, index_name=index_name) >= expected_count:
+                results[index_name] = SyncResult(
+                    index_name=index_name,
+                    documents=expected_count,
+                    seconds=time.perf_counter() - started_at,
+                )
+
+        time.sleep(0.5)
+
+    return list(results.values())
+
+
+def measure_visibility(*,
+                       connection: psycopg.Connection,
+                       client: elasticsearch.Elasticsearch,
+                       timeout: float) -> tuple[float, float]:
+    person_id, films_count = connection.execute('''
+        SELECT person_id, count(DISTINCT film_work_id)
+        FROM content.person_film_work
+        GROUP BY person_id
+        LIMIT 1
+    ''').fetchone()  # type: ignore[misc]
+    full_name = 'Benchmark ' + ''.join(random.choices(string.ascii_lowercase, k=12))
+    films_query = {'multi_match': {
+        'query': full_name,
+        'type': 'phrase',
+        'fields': ['directors_names', 'actors_names', 'writers_names'],
+    }}
+
+    connection.execute(
+        "UPDATE content.person SET full_name = %s, modified = timezone('utc', now()) WHERE id = %s",
+        (full_name, person_id),
+    )
+    connection.commit()
+    started_at = time.perf_counter()
+    person_seconds = films_seconds = None
+
+    # The person document and every film the person appears in have to show the new name.
+    while person_seconds is None or films_seconds is None:
+        elapsed = time.perf_counter() - started_at
+
+        if elapsed > timeout:
+            raise TimeoutError(f'The modified person was not visible in {timeout:.0f}s')
+
+        if person_seconds is None and count_index(client=client, index_name='persons', query={
+            'match_phrase': {'full_name': full_name},
+        }):
+            person_seconds = elapsed
+
+        if films_seconds is None and count_index(
+                client=client,
+                index_name='films',
+                query=films_query,
+        ) >= films_count:
+            films_seconds = elapsed
+
+        time.sleep(0.05)
+
+    return person_seconds, films_seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Seed a synthetic catalog, run transfer_data and measure its throughput and lag. '
+                    'Use a scratch database and a local Elasticsearch only.',
+    )
+    parser.add_argument('--films', type=int, default=100_000)
+    parser.add_argument('--persons', type=int, default=None, help='A tenth of the films by default.')
+    parser.add_argument('--genres', type=int, default=30)
+    parser.add_argument('--chunk-size', type=int, default=10_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=3600.0)
+    parser.add_argument('--skip-seed', action='store_true', help='Benchmark the catalog already in the database.')
+    parser.add_argument('--reset', action='store_true', help='Empty the content tables and delete the indices.')
+    args = parser.parse_args()
+
+    config = CatalogConfig(
+        films_count=args.films,
+        persons_count=args.persons or max(1, args.films // 10),
+        genres_count=args.genres,
+        chunk_size=args.chunk_size,
+        seed=args.seed,
+    )
+
+    with (
+        psycopg.connect(**settings.postgresql.connection_params) as connection,
+        elasticsearch.Elasticsearch(settings.elasticsearch.url) as client,
+        tempfile.TemporaryDirectory(prefix='etl-benchmark-') as data_dir,
+    ):
+        # The content schema is created by compose/postgresql/database_dump.sql, as for the movies database.
+        try:
+            content_counts = count_documents(connection=connection)
+        except psycopg.errors.UndefinedTable:
+            parser.error('The content tables are missing, load compose/postgresql/database_dump.sql first.')
+
+        if args.reset:
+            connection.execute('TRUNCATE content.film_work, content.genre, content.person CASCADE')
+            client.indices.delete(index=','.join(f'{index_name}_v*' for index_name in INDEX_NAMES))
+
+        elif not args.skip_seed and any(content_counts.values()):
+            parser.error('The content tables are not empty, pass --reset to empty them or --skip-seed to use them.')
+
+        elif any(count_index(client=client, index_name=index_name) for index_name in INDEX_NAMES):
+            parser.error('The indices are not empty, pass --reset to delete them.')
+
+        connection.commit()
+
+        if not args.skip_seed:
+            started_at = time.perf_counter()
+            seed_catalog(connection=connection, config=config)
+            print(f'seeded {config.films_count:,} films, {config.persons_count:,} persons, '
+                  f'{config.genres_count:,} genres in {time.perf_counter() - started_at:.1f}s')
+
+        expected_counts = count_documents(connection=connection)
+        started_at = time.perf_counter()
+        etl_process = start_etl(data_dir=data_dir)
+
+        try:
+            sync_results = wait_for_sync(
+                client=client,
+                expected_counts=expected_counts,
+                started_at=started_at,
+                etl_process=etl_process,
+                timeout=args.timeout,
+            )
+
+            for sync_result in sync_results:
+                print(f'{sync_result.index_name}: {sync_result.documents:,} documents in {sync_result.seconds:.1f}s '
+                      f'({sync_result.documents_per_second:,.0f} documents/s)')
+
+            print(f'full sync: {max(sync_result.seconds for sync_result in sync_results):.1f}s')
+
+            person_seconds, films_seconds = measure_visibility(
+                connection=connection,
+                client=client,
+                timeout=args.timeout,
+            )
+            print(f'modified person visible in persons after {person_seconds:.2f}s, '
+                  f'in all of its films after {films_seconds:.2f}s')
+
+        finally:
+            etl_process.terminate()
+            etl_process.wait()
+
+
+if __name__ == '__main__':
+    main()
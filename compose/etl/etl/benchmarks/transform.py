@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import argparse
+import datetime
+import hashlib
+import random
+import time
+import uuid
+from collections.abc import Callable
+
+from ..pipelines import (
+    DocumentsTransformExecutor,
+    FilmsTransformExecutor,
+    GenresTransformExecutor,
+    PersonsTransformExecutor,
+    SourcesTransformExecutor,
+)
+from ..transform import (
+    FilmSourcesBuilder,
+    GenreSourcesBuilder,
+    PersonSourcesBuilder,
+)
+
+ROLES = ('director', 'actor', 'writer')
+
+
+def create_timestamp(random_: random.Random) -> str:
+    return (datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC) + datetime.timedelta(
+        seconds=random_.randrange(365 * 24 * 3600),
+    )).isoformat()
+
+
+def create_film_works(random_: random.Random, *, count: int) -> list[dict]:
+    # Rows are shaped like psycopg returns them: top-level ids are UUIDs, jsonb ids are strings.
+    return [{
+        'id': uuid.uuid4(),
+        'modified': datetime.datetime.now(datetime.UTC),
+        'title': f'Film {index}',
+        'description': f'Description of film {index}' if random_.random() < 0.8 else None,
+        'rating': round(random_.uniform(0, 10), 1) if random_.random() < 0.9 else None,
+        'genres': [{
+            'id': str(uuid.uuid4()),
+            'modified': create_timestamp(random_),
+            'name': f'Genre {random_.randrange(30)}',
+        } for _ in range(random_.randint(1, 3))],
+        'persons': [{
+            'id': str(uuid.uuid4()),
+            'modified': create_timestamp(random_),
+            'full_name': f'Person {random_.randrange(100_000)}',
+            'role': random_.choice(ROLES),
+        } for _ in range(random_.randint(3, 15))],
+    } for index in range(count)]
+
+
+def create_genres(random_: random.Random, *, count: int) -> list[dict]:
+    return [{
+        'id': uuid.uuid4(),
+        'modified': datetime.datetime.now(datetime.UTC),
+        'name': f'Genre {index}',
+    } for index in range(count)]
+
+
+def create_persons(random_: random.Random, *, count: int) -> list[dict]:
+    persons = []
+
+    for index in range(count):
+        film_ids = [str(uuid.uuid4()) for _ in range(random_.randint(1, 10))]
+        persons.append({
+            'id': uuid.uuid4(),
+            'modified': datetime.datetime.now(datetime.UTC),
+            'full_name': f'Person {index}',
+            'film_works': [{
+                'id': film_id,
+                'modified': create_timestamp(random_),
+                'role': role,
+            } for film_id in film_ids for role in random_.sample(ROLES, random_.randint(1, 2))],
+        })
+
+    return persons
+
+
+def measure(*,
+            transform_executor: DocumentsTransformExecutor,
+            batches: list[list[dict]]) -> tuple[float, list[bytes]]:
+    hashes = []
+    started_at = time.perf_counter()
+
+    # Everything the pipeline does with a document: transform, hash and build the bulk action source.
+    for documents_data in batches:
+        for document in transform_executor.transform_documents(documents_data=documents_data).documents:
+            hashes.append(hashlib.blake2b(document.get_source_json(), digest_size=16).digest())
+            document.get_source()
+
+    return time.perf_counter() - started_at, hashes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare the models and the sources transform paths.')
+    parser.add_argument('--documents', type=int, default=20_000)
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--validate-every', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    random_ = random.Random(args.seed)
+    cases: list[tuple[str, Callable[..., list[dict]], DocumentsTransformExecutor, SourcesTransformExecutor]] = [
+        (
+            'films',
+            create_film_works,
+            FilmsTransformExecutor(),
+            SourcesTransformExecutor(sources_builder=FilmSourcesBuilder(validate_every=args.validate_every)),
+        ),
+        (
+            'genres',
+            create_genres,
+            GenresTransformExecutor(),
+            SourcesTransformExecutor(sources_builder=GenreSourcesBuilder(validate_every=args.validate_every)),
+        ),
+        (
+            'persons',
+            create_persons,
+            PersonsTransformExecutor(),
+            SourcesTransformExecutor(sources_builder=PersonSourcesBuilder(validate_every=args.validate_every)),
+        ),
+    ]
+
+    for name, create_rows, models_executor, sources_executor in cases:
+        rows = create_rows(random_, count=args.documents)
+        batches = [rows[offset:offset + args.batch_size] for offset in range(0, len(rows), args.batch_size)]
+
+        models_seconds, models_hashes = measure(transform_executor=models_executor, batches=batches)
+        sources_seconds, sources_hashes = measure(transform_executor=sources_executor, batches=batches)
+
+        print(
+            f'{name}: models {args.documents / models_seconds:,.0f} documents/s, '
+            f'sources {args.documents / sources_seconds:,.0f} documents/s '
+            f'({models_seconds / sources_seconds:.1f}x), '
+            f'identical output: {models_hashes == sources_hashes}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import elasticsearch
+import redis
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from etl.extract import (  # noqa: E402
+    FilmWorksExtractor,
+    GenresExtractor,
+    PersonsExtractor,
+)
+from etl.load import (  # noqa: E402
+    BulkOptions,
+    ElasticsearchIndexManager,
+    RedisChangesPublisher,
+)
+from etl.pipelines import (  # noqa: E402
+    Reindexer,
+    FilmsTransformExecutor,
+    GenresTransformExecutor,
+    PersonsTransformExecutor,
+    create_transform_executor,
+)
+from etl.settings import settings  # noqa: E402
+from etl.transform import (  # noqa: E402
+    Document,
+    FilmSourcesBuilder,
+    GenreSourcesBuilder,
+    PersonSourcesBuilder,
+    Film,
+    Genre,
+    Person,
+)
+from etl.utils import (  # noqa: E402
+    setup_logging,
+    load_index_file,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Rebuild Elasticsearch indices and switch their aliases.')
+    parser.add_argument(
+        '--index',
+        dest='index_names',
+        action='append',
+        choices=['films', 'genres', 'persons'],
+        help='Index to rebuild, all indices by default.',
+    )
+    args = parser.parse_args()
+
+    setup_logging(file_path=BASE_DIR / 'logs' / 'reindex.log')
+    postgresql_connection_params = settings.postgresql.connection_params
+    schema_dir = BASE_DIR / 'schema'
+
+    with (
+        elasticsearch.Elasticsearch(settings.elasticsearch.url) as elasticsearch_client,
+        redis.Redis(host=settings.redis.host, port=settings.redis.port) as redis_client,
+    ):
+        changes_publisher = None
+
+        if settings.redis.publish_changes:
+            changes_publisher = RedisChangesPublisher(
+                client=redis_client,
+                stream_name=settings.redis.changes_stream,
+                stream_max_length=settings.redis.changes_stream_max_length,
+                versions_key=settings.redis.versions_key,
+            )
+
+        index_manager = ElasticsearchIndexManager(client=elasticsearch_client)
+        bulk_options = BulkOptions(
+            mode=settings.elasticsearch.bulk_mode,
+            chunk_size=settings.elasticsearch.bulk_chunk_size,
+            max_chunk_bytes=settings.elasticsearch.bulk_max_chunk_bytes,
+            thread_count=settings.elasticsearch.bulk_thread_count,
+            max_retries=settings.elasticsearch.bulk_max_retries,
+            initial_backoff=settings.elasticsearch.bulk_initial_backoff,
+        )
+
+        reindexers: dict[str, Reindexer[Document]] = {
+            'films': Reindexer[Film](  # type: ignore[dict-item]
+                extractor=FilmWorksExtractor(
+                    connection_params=postgresql_connection_params,
+                    batch_size=settings.etl.batch_size,
+                ),
+                transform_executor=create_transform_executor(
+                    models_executor=FilmsTransformExecutor(),
+                    sources_builder=FilmSourcesBuilder(
+                        validate_every=settings.etl.validate_every,
+                    ) if settings.etl.transform_mode == 'sources' else None,
+                ),
+                index_manager=index_manager,
+                index_name='films',
+                index_data=load_index_file(schema_dir / 'films.json'),
+                bulk_options=bulk_options,
+                changes_publisher=changes_publisher,
+                grace_period=settings.etl.reindex_grace_period,
+            ),
+
+            'genres': Reindexer[Genre](  # type: ignore[dict-item]
+                extractor=GenresExtractor(
+                    connection_params=postgresql_connection_params,
+                    batch_size=settings.etl.batch_size,
+                ),
+                transform_executor=create_transform_executor(
+                    models_executor=GenresTransformExecutor(),
+                    sources_builder=GenreSourcesBuilder(
+                        validate_every=settings.etl.validate_every,
+                    ) if settings.etl.transform_mode == 'sources' else None,
+                ),
+                index_manager=index_manager,
+                index_name='genres',
+                index_data=load_index_file(schema_dir / 'genres.json'),
+                bulk_options=bulk_options,
+                changes_publisher=changes_publisher,
+                grace_period=settings.etl.reindex_grace_period,
+            ),
+
+            'persons': Reindexer[Person](  # type: ignore[dict-item]
+                extractor=PersonsExtractor(
+                    connection_params=postgresql_connection_params,
+                    batch_size=settings.etl.batch_size,
+                ),
+                transform_executor=create_transform_executor(
+                    models_executor=PersonsTransformExecutor(),
+                    sources_builder=PersonSourcesBuilder(
+                        validate_every=settings.etl.validate_every,
+                    ) if settings.etl.transform_mode == 'sources' else None,
+                ),
+                index_manager=index_manager,
+                index_name='persons',
+                index_data=load_index_file(schema_dir / 'persons.json'),
+                bulk_options=bulk_options,
+                changes_publisher=changes_publisher,
+                grace_period=settings.etl.reindex_grace_period,
+            ),
+        }
+
+        for index_name in args.index_names or reindexers:
+            reindexers[index_name].reindex()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import contextlib
+import datetime
+import logging
+import os
+import queue
 import sys
+import threading
 import time
 from pathlib import Path
 
 import elasticsearch
+import redis
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(BASE_DIR))
@@ -13,18 +20,43 @@ from etl.extract import (  # noqa: E402
     FilmWorksExtractor,
     GenresExtractor,
     PersonsExtractor,
+    FilmWorksChangesExtractor,
+    GenresChangesExtractor,
+    PersonsChangesExtractor,
+    PostgreSQLChangesCapture,
+)
+from etl.load import (  # noqa: E402
+    BulkOptions,
+    ElasticsearchLoader,
+    RedisChangesPublisher,
 )
-from etl.load import ElasticsearchLoader  # noqa: E402
 from etl.pipelines import (  # noqa: E402
+    ConcurrentETLRunner,
     ETLPipeline,
     FilmsTransformExecutor,
     GenresTransformExecutor,
     PersonsTransformExecutor,
+    ShardedLoadCoordinator,
+    create_transform_executor,
 )
 from etl.settings import settings  # noqa: E402
-from etl.state import JsonFileStorage  # noqa: E402
+from etl.state import (  # noqa: E402
+    JsonFileStorage,
+    DocumentHashStore,
+    SQLiteDocumentHashStore,
+    SQLiteStorage,
+    LastChange,
+    LastModified,
+    Shard,
+    State,
+    Storage,
+)
 from etl.transform import (  # noqa: E402
     Document,
+    FilmSourcesBuilder,
+    GenreSourcesBuilder,
+    PersonSourcesBuilder,
+    DocumentsHashFilter,
     Film,
     Genre,
     Person,
@@ -34,64 +66,357 @@ from etl.utils import (  # noqa: E402
     load_index_file,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def transfer_modified_data(*, etl_pipeline: ETLPipeline[Document], storage: Storage, state: State) -> None:
+    if settings.etl.extract_mode == 'stream':
+        for _documents_transform_result in etl_pipeline.stream_data():
+            storage.save(state)
+
+        return
+
+    while True:
+        documents_transform_result = etl_pipeline.transfer_data()
+
+        if not documents_transform_result.documents:
+            break
+
+        storage.save(state)
+
+
+def transfer_changed_data(*, etl_pipeline: ETLPipeline[Document], storage: Storage, state: State) -> None:
+    while etl_pipeline.transfer_changes() is not None:
+        storage.save(state)
+
+
+def start_capturing_changes(*, etl_pipeline: ETLPipeline[Document], storage: Storage, state: State) -> None:
+    assert etl_pipeline.changes_extractor is not None
+
+    # Changes made while catching up are captured as well, so they are transferred at least once.
+    last_change = etl_pipeline.changes_extractor.get_position()
+    transfer_modified_data(etl_pipeline=etl_pipeline, storage=storage, state=state)
+    etl_pipeline.extractor_state.last_change = last_change
+    storage.save(state)
+
+
+def run_sequentially(*, etl_pipelines: list[ETLPipeline[Document]], storage: Storage, state: State) -> None:
+    for etl_pipeline in etl_pipelines:
+        if etl_pipeline.captures_changes:
+            transfer_changed_data(etl_pipeline=etl_pipeline, storage=storage, state=state)
+        elif etl_pipeline.changes_extractor is not None:
+            start_capturing_changes(etl_pipeline=etl_pipeline, storage=storage, state=state)
+        else:
+            transfer_modified_data(etl_pipeline=etl_pipeline, storage=storage, state=state)
+
+        etl_pipeline.log_filter_stats()
+
+
+def get_processed_change(*, state: State) -> LastChange | None:
+    last_changes = [
+        state.extractors.film_works.last_change,
+        state.extractors.genres.last_change,
+        state.extractors.persons.last_change,
+    ]
+
+    if any(last_change.transaction_id is None for last_change in last_changes):
+        return None
+
+    return min(last_changes, key=lambda last_change: (last_change.transaction_id, last_change.id))
+
+
+def create_storage(*, data_dir: Path) -> Storage:
+    json_storage = JsonFileStorage(file_path=data_dir / 'state.json')
+
+    if settings.etl.state_storage == 'json':
+        return json_storage
+
+    storage = SQLiteStorage(
+        file_path=data_dir / 'state.sqlite3',
+        save_interval=settings.etl.state_save_interval,
+    )
+
+    if storage.is_empty() and os.path.exists(json_storage.file_path):
+        logger.info('Migrate the ETL state from %s', json_storage.file_path)
+        storage.save(json_storage.load())
+        storage.flush()
+
+    return storage
+
+
+def log_lag(*, etl_pipelines: list[ETLPipeline[Document]], storage: Storage) -> None:
+    now = time.time()
+
+    for etl_pipeline in etl_pipelines:
+        lag = etl_pipeline.measure_lag()
+
+        if lag.pending_changes is not None:
+            logger.info(
+                '%s lag: %d pending changes, oldest %s ago',
+                lag.index_name,
+                lag.pending_changes,
+                lag.oldest_change_age or datetime.timedelta(),
+            )
+        elif lag.modified_lag is not None:
+            logger.info('%s lag: %s behind the newest modification', lag.index_name, lag.modified_lag)
+
+    for name, saved_at in storage.get_checkpoint_times().items():
+        logger.info('%s checkpoint saved %.1fs ago', name, now - saved_at)
+
+
+def create_etl_pipelines(*,
+                         state: State,
+                         elasticsearch_client: elasticsearch.Elasticsearch,
+                         redis_client: redis.Redis,
+                         hash_store: DocumentHashStore | None) -> list[ETLPipeline[Document]]:
+    postgresql_connection_params = settings.postgresql.connection_params
+    schema_dir = BASE_DIR / 'schema'
+    changes_publisher = None
+
+    if settings.redis.publish_changes:
+        changes_publisher = RedisChangesPublisher(
+            client=redis_client,
+            stream_name=settings.redis.changes_stream,
+            stream_max_length=settings.redis.changes_stream_max_length,
+            versions_key=settings.redis.versions_key,
+        )
+
+    bulk_options = BulkOptions(
+        mode=settings.elasticsearch.bulk_mode,
+        chunk_size=settings.elasticsearch.bulk_chunk_size,
+        max_chunk_bytes=settings.elasticsearch.bulk_max_chunk_bytes,
+        thread_count=settings.elasticsearch.bulk_thread_count,
+        max_retries=settings.elasticsearch.bulk_max_retries,
+        initial_backoff=settings.elasticsearch.bulk_initial_backoff,
+    )
+
+    etl_pipelines: list[ETLPipeline[Document]] = [
+        ETLPipeline[Film](  # type: ignore[list-item]
+            extractor=FilmWorksExtractor(
+                connection_params=postgresql_connection_params,
+                batch_size=settings.etl.batch_size,
+            ),
+            extractor_state=state.extractors.film_works,
+            changes_extractor=FilmWorksChangesExtractor(
+                connection_params=postgresql_connection_params,
+                batch_size=settings.etl.changes_batch_size,
+            ) if settings.etl.capture_changes else None,
+            documents_filter=DocumentsHashFilter[Film](
+                store=hash_store,
+                index_name='films',
+            ) if hash_store is not None else None,
+            transform_executor=create_transform_executor(
+                models_executor=FilmsTransformExecutor(),
+                sources_builder=FilmSourcesBuilder(
+                    validate_every=settings.etl.validate_every,
+                ) if settings.etl.transform_mode == 'sources' else None,
+            ),
+            loader=ElasticsearchLoader[Film](
+                client=elasticsearch_client,
+                index_name='films',
+                index_data=load_index_file(schema_dir / 'films.json'),
+                changes_publisher=changes_publisher,
+                bulk_options=bulk_options,
+            ),
+        ),
+
+        ETLPipeline[Genre](  # type: ignore[list-item]
+            extractor=GenresExtractor(
+                connection_params=postgresql_connection_params,
+                batch_size=settings.etl.batch_size,
+            ),
+            extractor_state=state.extractors.genres,
+            changes_extractor=GenresChangesExtractor(
+                connection_params=postgresql_connection_params,
+                batch_size=settings.etl.changes_batch_size,
+            ) if settings.etl.capture_changes else None,
+            documents_filter=DocumentsHashFilter[Genre](
+                store=hash_store,
+                index_name='genres',
+            ) if hash_store is not None else None,
+            transform_executor=create_transform_executor(
+                models_executor=GenresTransformExecutor(),
+                sources_builder=GenreSourcesBuilder(
+                    validate_every=settings.etl.validate_every,
+                ) if settings.etl.transform_mode == 'sources' else None,
+            ),
+            loader=ElasticsearchLoader[Genre](
+                client=elasticsearch_client,
+                index_name='genres',
+                index_data=load_index_file(schema_dir / 'genres.json'),
+                changes_publisher=changes_publisher,
+                bulk_options=bulk_options,
+            ),
+        ),
+
+        ETLPipeline[Person](  # type: ignore[list-item]
+            extractor=PersonsExtractor(
+                connection_params=postgresql_connection_params,
+                batch_size=settings.etl.batch_size,
+            ),
+            extractor_state=state.extractors.persons,
+            changes_extractor=PersonsChangesExtractor(
+                connection_params=postgresql_connection_params,
+                batch_size=settings.etl.changes_batch_size,
+            ) if settings.etl.capture_changes else None,
+            documents_filter=DocumentsHashFilter[Person](
+                store=hash_store,
+                index_name='persons',
+            ) if hash_store is not None else None,
+            transform_executor=create_transform_executor(
+                models_executor=PersonsTransformExecutor(),
+                sources_builder=PersonSourcesBuilder(
+                    validate_every=settings.etl.validate_every,
+                ) if settings.etl.transform_mode == 'sources' else None,
+            ),
+            loader=ElasticsearchLoader[Person](
+                client=elasticsearch_client,
+                index_name='persons',
+                index_data=load_index_file(schema_dir / 'persons.json'),
+                changes_publisher=changes_publisher,
+                bulk_options=bulk_options,
+            ),
+        )
+    ]
+
+    return etl_pipelines
+
+
+def load_shard(*,
+               index_name: str,
+               shard: Shard,
+               last_modified: LastModified,
+               progress_queue: queue.Queue[tuple[str, int, LastModified]],
+               stop_event: threading.Event) -> int:
+    setup_logging(file_path=BASE_DIR / 'logs' / 'transfer_data.log')
+    data_dir = settings.etl.data_dir or BASE_DIR / 'data'
+    hash_store = None
+    documents = 0
+
+    if settings.etl.hash_documents:
+        hash_store = SQLiteDocumentHashStore(file_path=data_dir / 'hashes.sqlite3')
+
+    with (
+        contextlib.closing(hash_store) if hash_store is not None else contextlib.nullcontext(),
+        elasticsearch.Elasticsearch(settings.elasticsearch.url) as elasticsearch_client,
+        redis.Redis(host=settings.redis.host, port=settings.redis.port) as redis_client,
+    ):
+        etl_pipeline = next(
+            etl_pipeline
+            for etl_pipeline in create_etl_pipelines(
+                state=State(),
+                elasticsearch_client=elasticsearch_client,
+                redis_client=redis_client,
+                hash_store=hash_store,
+            )
+            if etl_pipeline.loader.index_name == index_name
+        )
+        # The coordinator holds the reindex profile of the index, refreshes are off until the load ends.
+        etl_pipeline.loader.reindexing = settings.elasticsearch.reindex_profile
+
+        for batch in etl_pipeline.extract_shard_batches(shard=shard, last_modified=last_modified):
+            etl_pipeline.load_batch(documents=etl_pipeline.transform_batch(batch=batch))
+            documents += len(batch.documents_data)
+
+            assert batch.last_modified is not None
+            progress_queue.put((index_name, shard.index, batch.last_modified))
+
+            if stop_event.is_set():
+                break
+
+        etl_pipeline.log_filter_stats()
+
+    return documents
+
 
 def main() -> None:
     setup_logging(file_path=BASE_DIR / 'logs' / 'transfer_data.log')
     postgresql_connection_params = settings.postgresql.connection_params
     schema_dir = BASE_DIR / 'schema'
 
-    storage = JsonFileStorage(file_path=BASE_DIR / 'data' / 'state.json')
+    data_dir = settings.etl.data_dir or BASE_DIR / 'data'
+    storage = create_storage(data_dir=data_dir)
     state = storage.load()
+    hash_store = None
+
+    if settings.etl.hash_documents:
+        hash_store = SQLiteDocumentHashStore(file_path=data_dir / 'hashes.sqlite3')
 
     with (
+        contextlib.closing(storage),
+        contextlib.closing(hash_store) if hash_store is not None else contextlib.nullcontext(),
         elasticsearch.Elasticsearch(settings.elasticsearch.url) as elasticsearch_client,
+        redis.Redis(host=settings.redis.host, port=settings.redis.port) as redis_client,
     ):
-        etl_pipelines: list[ETLPipeline[Document]] = [
-            ETLPipeline[Film](  # type: ignore[list-item]
-                extractor=FilmWorksExtractor(connection_params=postgresql_connection_params),
-                extractor_state=state.extractors.film_works,
-                transform_executor=FilmsTransformExecutor(),
-                loader=ElasticsearchLoader[Film](
-                    client=elasticsearch_client,
-                    index_name='films',
-                    index_data=load_index_file(schema_dir / 'films.json'),
-                ),
-            ),
+        etl_pipelines = create_etl_pipelines(
+            state=state,
+            elasticsearch_client=elasticsearch_client,
+            redis_client=redis_client,
+            hash_store=hash_store,
+        )
 
-            ETLPipeline[Genre](  # type: ignore[list-item]
-                extractor=GenresExtractor(connection_params=postgresql_connection_params),
-                extractor_state=state.extractors.genres,
-                transform_executor=GenresTransformExecutor(),
-                loader=ElasticsearchLoader[Genre](
-                    client=elasticsearch_client,
-                    index_name='genres',
-                    index_data=load_index_file(schema_dir / 'genres.json'),
-                ),
-            ),
+        changes_capture = None
 
-            ETLPipeline[Person](  # type: ignore[list-item]
-                extractor=PersonsExtractor(connection_params=postgresql_connection_params),
-                extractor_state=state.extractors.persons,
-                transform_executor=PersonsTransformExecutor(),
-                loader=ElasticsearchLoader[Person](
-                    client=elasticsearch_client,
-                    index_name='persons',
-                    index_data=load_index_file(schema_dir / 'persons.json'),
-                ),
-            )
-        ]
+        if settings.etl.capture_changes:
+            changes_capture = PostgreSQLChangesCapture(connection_params=postgresql_connection_params)
+            changes_capture.install(schema_sql=(schema_dir / 'changes.sql').read_text())
+
+        concurrent_runner = ConcurrentETLRunner(
+            etl_pipelines=etl_pipelines,
+            storage=storage,
+            state=state,
+            queue_size=settings.etl.queue_size,
+            stream=settings.etl.extract_mode == 'stream',
+        )
+
+        for etl_pipeline in etl_pipelines:
+            # The index may have been rebuilt from scratch, documents are sent again regardless of their hashes.
+            if (
+                    etl_pipeline.loads_from_scratch
+                    and not etl_pipeline.extractor_state.shards
+                    and etl_pipeline.documents_filter is not None
+            ):
+                etl_pipeline.documents_filter.clear()
+
+        sharded_load_coordinator = ShardedLoadCoordinator(
+            etl_pipelines=etl_pipelines,
+            storage=storage,
+            state=state,
+            shard_loader=load_shard,
+            shard_count=settings.etl.shards,
+            process_count=settings.etl.shard_processes,
+        )
+        lag_logged_at = 0.0
 
         while True:
-            for etl_pipeline in etl_pipelines:
-                while True:
-                    documents_transform_result = etl_pipeline.transfer_data()
+            with contextlib.ExitStack() as exit_stack:
+                if settings.elasticsearch.reindex_profile:
+                    for etl_pipeline in etl_pipelines:
+                        if etl_pipeline.loads_from_scratch:
+                            exit_stack.enter_context(etl_pipeline.loader.reindex_profile())
+
+                if settings.etl.shards > 1:
+                    sharded_load_coordinator.run()
+
+                if settings.etl.runner == 'concurrent':
+                    concurrent_runner.run()
+                else:
+                    run_sequentially(etl_pipelines=etl_pipelines, storage=storage, state=state)
+
+            storage.flush()
+
+            if time.monotonic() - lag_logged_at >= settings.etl.lag_interval:
+                log_lag(etl_pipelines=etl_pipelines, storage=storage)
+                lag_logged_at = time.monotonic()
 
-                    if not documents_transform_result.documents:
-                        break
+            if changes_capture is None:
+                time.sleep(settings.etl.poll_interval)
+                continue
 
-                    storage.save(state)
+            if (processed_change := get_processed_change(state=state)) is not None:
+                changes_capture.delete(last_change=processed_change)
 
-            time.sleep(10)
+            changes_capture.wait(timeout=settings.etl.poll_interval)
 
 
 if __name__ == '__main__':
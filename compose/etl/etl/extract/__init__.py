@@ -1,3 +1,12 @@
+from .changes import (
+    ExtractedChanges,
+    PendingChanges,
+    PostgreSQLChangesExtractor,
+    FilmWorksChangesExtractor,
+    GenresChangesExtractor,
+    PersonsChangesExtractor,
+    PostgreSQLChangesCapture,
+)
 from .extractors import (
     PostgreSQLExtractor,
     FilmWorksExtractor,
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import uuid
+from typing import ClassVar
+
+import backoff
+import psycopg
+from psycopg import sql
+
+from .extractors import PostgreSQLConnectionProvider
+from .query import (
+    DeleteChangesSQLStatement,
+    ExtractChangedIdsSQLStatement,
+    ExtractChangedFilmWorkIdsSQLStatement,
+    ExtractChangedGenreIdsSQLStatement,
+    ExtractChangedPersonIdsSQLStatement,
+    ExtractChangesPositionSQLStatement,
+    ExtractChangesSQLStatement,
+    ExtractPendingChangesSQLStatement,
+)
+from ..state import LastChange
+
+
+@dataclasses.dataclass(kw_only=True)
+class ExtractedChanges:
+    ids: list[uuid.UUID]
+    last_change: LastChange
+
+
+@dataclasses.dataclass(kw_only=True)
+class PendingChanges:
+    count: int
+    oldest_created: datetime.datetime | None
+
+
+class PostgreSQLChangesExtractor:
+    batch_size: int = 1000
+    extract_changed_ids_sql_statement_class: ClassVar[type[ExtractChangedIdsSQLStatement]]
+
+    connection_provider: PostgreSQLConnectionProvider
+    extract_changes_position_sql_statement: ExtractChangesPositionSQLStatement
+    extract_changes_sql_statement: ExtractChangesSQLStatement
+    extract_changed_ids_sql_statement: ExtractChangedIdsSQLStatement
+    extract_pending_changes_sql_statement: ExtractPendingChangesSQLStatement
+
+    def __init__(self, *, connection_params: dict, batch_size: int | None = None) -> None:
+        self.connection_provider = PostgreSQLConnectionProvider(connection_params=connection_params)
+        self.batch_size = batch_size or self.batch_size
+        self.extract_changes_position_sql_statement = ExtractChangesPositionSQLStatement()
+        self.extract_changes_sql_statement = ExtractChangesSQLStatement(batch_size=self.batch_size)
+        self.extract_changed_ids_sql_statement = self.extract_changed_ids_sql_statement_class()
+        self.extract_pending_changes_sql_statement = ExtractPendingChangesSQLStatement()
+
+    @backoff.on_exception(backoff.expo, psycopg.OperationalError)
+    def get_position(self) -> LastChange:
+        query = self.extract_changes_position_sql_statement.compile()
+        row = self.connection_provider.get().execute(query).fetchone()
+
+        return LastChange.model_validate(row)
+
+    @backoff.on_exception(backoff.expo, psycopg.OperationalError)
+    def extract(self, *, last_change: LastChange) -> ExtractedChanges | None:
+        connection = self.connection_provider.get()
+        row = connection.execute(self.extract_changes_sql_statement.compile(last_change=last_change)).fetchone()
+
+        if row is None:
+            return None
+
+        next_change = LastChange.model_validate(row)
+        query = self.extract_changed_ids_sql_statement.compile(last_change=last_change, next_change=next_change)
+
+        return ExtractedChanges(
+            ids=[row['id'] for row in connection.execute(query)],
+            last_change=next_change,
+        )
+
+    @backoff.on_exception(backoff.expo, psycopg.OperationalError)
+    def get_pending(self, *, last_change: LastChange) -> PendingChanges:
+        query = self.extract_pending_changes_sql_statement.compile(last_change=last_change)
+        row = self.connection_provider.get().execute(query).fetchone()
+        assert row is not None
+
+        return PendingChanges(count=row['count'], oldest_created=row['oldest_created'])
+
+    def close(self) -> None:
+        self.connection_provider.close()
+
+
+class FilmWorksChangesExtractor(PostgreSQLChangesExtractor):
+    extract_changed_ids_sql_statement_class = ExtractChangedFilmWorkIdsSQLStatement
+
+
+class GenresChangesExtractor(PostgreSQLChangesExtractor):
+    extract_changed_ids_sql_statement_class = ExtractChangedGenreIdsSQLStatement
+
+
+class PersonsChangesExtractor(PostgreSQLChangesExtractor):
+    extract_changed_ids_sql_statement_class = ExtractChangedPersonIdsSQLStatement
+
+
+class PostgreSQLChangesCapture:
+    channel: ClassVar[str] = 'content_changes'
+
+    connection_provider: PostgreSQLConnectionProvider
+    delete_changes_sql_statement: DeleteChangesSQLStatement
+    listening_connection: psycopg.Connection[dict] | None
+
+    def __init__(self, *, connection_params: dict) -> None:
+        self.connection_provider = PostgreSQLConnectionProvider(connection_params=connection_params)
+        self.delete_changes_sql_statement = DeleteChangesSQLStatement()
+        self.listening_connection = None
+
+    @backoff.on_exception(backoff.expo, psycopg.OperationalError)
+    def install(self, *, schema_sql: str) -> None:
+        self.connection_provider.get().execute(schema_sql.encode())
+
+    @backoff.on_exception(backoff.expo, psycopg.OperationalError)
+    def delete(self, *, last_change: LastChange) -> None:
+        self.connection_provider.get().execute(self.delete_changes_sql_statement.compile(last_change=last_change))
+
+    @backoff.on_exception(backoff.expo, psycopg.OperationalError)
+    def wait(self, *, timeout: float) -> bool:
+        connection = self.connection_provider.get()
+
+        if self.listening_connection is not connection:
+            connection.execute(sql.SQL('LISTEN {channel}').format(channel=sql.Identifier(self.channel)))
+            self.listening_connection = connection
+
+        for _notify in connection.notifies(timeout=timeout, stop_after=1):
+            return True
+
+        return False
+
+    def close(self) -> None:
+        self.connection_provider.close()
+        self.listening_connection = None
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import datetime
+import logging
+import uuid
 from collections.abc import Iterable
 from typing import ClassVar
 
@@ -9,12 +12,19 @@ import psycopg.abc
 import psycopg.rows
 
 from .query import (
+    CountSQLStatement,
+    ExtractNewestModifiedSQLStatement,
     ExtractSQLStatement,
     ExtractFilmWorksSQLStatement,
     ExtractGenresSQLStatement,
     ExtractPersonsSQLStatement,
 )
-from ..state import LastModified
+from ..state import (
+    LastModified,
+    Shard,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class PostgreSQLConnectionFactory:
@@ -28,6 +38,27 @@ class PostgreSQLConnectionFactory:
         return psycopg.connect(**self.connection_params, row_factory=psycopg.rows.dict_row)
 
 
+class PostgreSQLConnectionProvider:
+    connection_factory: PostgreSQLConnectionFactory
+    connection: psycopg.Connection[dict] | None
+
+    def __init__(self, *, connection_params: dict) -> None:
+        self.connection_factory = PostgreSQLConnectionFactory(connection_params=connection_params)
+        self.connection = None
+
+    def get(self) -> psycopg.Connection[dict]:
+        if self.connection is None or self.connection.closed:
+            self.connection = self.connection_factory.create()
+            self.connection.autocommit = True
+
+        return self.connection
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
 class PostgreSQLCursorExecutor:
     cursor: psycopg.Cursor[dict]
 
@@ -44,15 +75,28 @@ class PostgreSQLCursorExecutor:
 
 class PostgreSQLExtractor:
     batch_size: int = 100
+    stream_cursor_name: ClassVar[str] = 'etl_extract'
+    table_name: ClassVar[str]
+    modified_table_names: ClassVar[tuple[str, ...]]
     extract_sql_statement_class: ClassVar[type[ExtractSQLStatement]]
 
     connection_factory: PostgreSQLConnectionFactory
+    connection_provider: PostgreSQLConnectionProvider
     extract_sql_statement: ExtractSQLStatement
+    stream_sql_statement: ExtractSQLStatement
+    count_sql_statement: CountSQLStatement
+    extract_newest_modified_sql_statement: ExtractNewestModifiedSQLStatement
 
     def __init__(self, *, connection_params: dict, batch_size: int | None = None) -> None:
         self.connection_factory = PostgreSQLConnectionFactory(connection_params=connection_params)
+        self.connection_provider = PostgreSQLConnectionProvider(connection_params=connection_params)
         self.batch_size = batch_size or self.batch_size
         self.extract_sql_statement = self.extract_sql_statement_class(batch_size=self.batch_size)
+        self.stream_sql_statement = self.extract_sql_statement_class(batch_size=None)
+        self.count_sql_statement = CountSQLStatement(table_name=self.table_name)
+        self.extract_newest_modified_sql_statement = ExtractNewestModifiedSQLStatement(
+            table_names=self.modified_table_names,
+        )
 
     def extract(self, *, last_modified: LastModified) -> Iterable[dict]:
         with self.connection_factory.create() as connection:
@@ -61,14 +105,68 @@ class PostgreSQLExtractor:
                 query = self.extract_sql_statement.compile(last_modified=last_modified)
                 yield from cursor_executor.execute(query=query)
 
+    def stream(self, *, last_modified: LastModified, shard: Shard | None = None) -> Iterable[list[dict]]:
+        while True:
+            try:
+                for batch in self._stream_batches(last_modified=last_modified, shard=shard):
+                    last_row = batch[-1]
+                    last_modified = LastModified(modified=last_row['modified'], id=last_row['id'])
+                    yield batch
+
+                return
+
+            except psycopg.OperationalError:
+                logger.exception('Extraction stream interrupted, resuming after %s', last_modified)
+                self.close()
+
+    def extract_ids(self, *, ids: list[uuid.UUID]) -> Iterable[list[dict]]:
+        for offset in range(0, len(ids), self.batch_size):
+            query = self.extract_sql_statement.compile(
+                last_modified=LastModified(),
+                ids=ids[offset:offset + self.batch_size],
+            )
+
+            if batch := self._fetch_all(query=query):
+                yield batch
+
+    def count(self) -> int:
+        return self._fetch_all(query=self.count_sql_statement.compile())[0]['count']
+
+    def get_newest_modified(self) -> datetime.datetime | None:
+        return self._fetch_all(query=self.extract_newest_modified_sql_statement.compile())[0]['modified']
+
+    def close(self) -> None:
+        self.connection_provider.close()
+
+    @backoff.on_exception(backoff.expo, psycopg.OperationalError)
+    def _fetch_all(self, *, query: psycopg.abc.Query) -> list[dict]:
+        return self.connection_provider.get().execute(query).fetchall()
+
+    def _stream_batches(self, *, last_modified: LastModified, shard: Shard | None) -> Iterable[list[dict]]:
+        connection = self.connection_provider.get()
+        query = self.stream_sql_statement.compile(last_modified=last_modified, shard=shard)
+
+        with connection.transaction():
+            with connection.cursor(name=self.stream_cursor_name) as cursor:
+                cursor.execute(query)
+
+                while batch := cursor.fetchmany(self.batch_size):
+                    yield batch
+
 
 class FilmWorksExtractor(PostgreSQLExtractor):
+    table_name = 'film_work'
+    modified_table_names = ('film_work', 'genre', 'person')
     extract_sql_statement_class = ExtractFilmWorksSQLStatement
 
 
 class GenresExtractor(PostgreSQLExtractor):
+    table_name = 'genre'
+    modified_table_names = ('genre',)
     extract_sql_statement_class = ExtractGenresSQLStatement
 
 
 class PersonsExtractor(PostgreSQLExtractor):
+    table_name = 'person'
+    modified_table_names = ('person', 'film_work')
     extract_sql_statement_class = ExtractPersonsSQLStatement
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import uuid
+
 from psycopg import sql
 
-from ..state import LastModified
+from ..state import (
+    LastChange,
+    LastModified,
+    Shard,
+)
 
 
 class TableModifiedCondition:
@@ -37,25 +43,80 @@ class TableModifiedCondition:
         )
 
 
+class TableIdsCondition:
+    table_name: str
+
+    def __init__(self, *, table_name: str) -> None:
+        self.table_name = table_name
+
+    def compile(self, *, ids: list[uuid.UUID] | None) -> sql.Composable:
+        if ids is None:
+            return sql.Literal('true')
+
+        return sql.SQL('({table_name}.id = ANY({ids}))').format(
+            table_name=sql.Identifier(self.table_name),
+            ids=ids,
+        )
+
+
+class TableShardCondition:
+    table_name: str
+
+    def __init__(self, *, table_name: str) -> None:
+        self.table_name = table_name
+
+    def compile(self, *, shard: Shard | None) -> sql.Composable:
+        if shard is None:
+            return sql.Literal('true')
+
+        return sql.SQL('((hashtext({table_name}.id::text) & 2147483647) % {count} = {index})').format(
+            table_name=sql.Identifier(self.table_name),
+            count=shard.count,
+            index=shard.index,
+        )
+
+
 class ExtractSQLStatement:
-    batch_size: int
+    batch_size: int | None
 
-    def __init__(self, *, batch_size: int) -> None:
+    def __init__(self, *, batch_size: int | None) -> None:
         self.batch_size = batch_size
 
-    def compile(self, *, last_modified: LastModified) -> sql.Composed:
+    def compile(self,
+                *,
+                last_modified: LastModified,
+                ids: list[uuid.UUID] | None = None,
+                shard: Shard | None = None) -> sql.Composed:
         raise NotImplementedError
 
+    def _compile_limit(self) -> sql.Composable:
+        if self.batch_size is None:
+            return sql.SQL('ALL')
+
+        return sql.Literal(self.batch_size)
+
 
 class ExtractFilmWorksSQLStatement(ExtractSQLStatement):
     table_modified_condition: TableModifiedCondition
+    table_ids_condition: TableIdsCondition
+    table_shard_condition: TableShardCondition
 
-    def __init__(self, *, batch_size: int) -> None:
+    def __init__(self, *, batch_size: int | None) -> None:
         super().__init__(batch_size=batch_size)
         self.table_modified_condition = TableModifiedCondition(table_name='modified_film_work')
+        self.table_ids_condition = TableIdsCondition(table_name='film_work')
+        self.table_shard_condition = TableShardCondition(table_name='film_work')
 
-    def compile(self, *, last_modified: LastModified) -> sql.Composed:
+    def compile(self,
+                *,
+                last_modified: LastModified,
+                ids: list[uuid.UUID] | None = None,
+                shard: Shard | None = None) -> sql.Composed:
         where_condition = self.table_modified_condition.compile(last_modified=last_modified)
+        rows_condition = sql.SQL('{ids_condition} AND {shard_condition}').format(
+            ids_condition=self.table_ids_condition.compile(ids=ids),
+            shard_condition=self.table_shard_condition.compile(shard=shard),
+        )
 
         # noinspection SqlNoDataSourceInspection,SqlResolve
         return sql.SQL('''
@@ -98,33 +159,47 @@ class ExtractFilmWorksSQLStatement(ExtractSQLStatement):
                         ON person_film_work.film_work_id = film_work.id
                     LEFT JOIN content.person AS person
                         ON person_film_work.person_id = person.id
+                    WHERE {rows_condition}
                     GROUP BY
                         film_work.id
                 ) AS modified_film_work
                     ON film_work.id = modified_film_work.id
-            WHERE {where_condition}
+            WHERE {where_condition} AND {rows_condition}
             GROUP BY
                 film_work.id,
                 modified_film_work.modified
             ORDER BY
                 modified_film_work.modified,
                 film_work.id
-            LIMIT {batch_size}
+            LIMIT {limit}
         ''').format(
             where_condition=where_condition,
-            batch_size=self.batch_size,
+            rows_condition=rows_condition,
+            limit=self._compile_limit(),
         )
 
 
 class ExtractGenresSQLStatement(ExtractSQLStatement):
     table_modified_condition: TableModifiedCondition
+    table_ids_condition: TableIdsCondition
+    table_shard_condition: TableShardCondition
 
-    def __init__(self, *, batch_size: int) -> None:
+    def __init__(self, *, batch_size: int | None) -> None:
         super().__init__(batch_size=batch_size)
         self.table_modified_condition = TableModifiedCondition(table_name='genre')
+        self.table_ids_condition = TableIdsCondition(table_name='genre')
+        self.table_shard_condition = TableShardCondition(table_name='genre')
 
-    def compile(self, *, last_modified: LastModified) -> sql.Composed:
+    def compile(self,
+                *,
+                last_modified: LastModified,
+                ids: list[uuid.UUID] | None = None,
+                shard: Shard | None = None) -> sql.Composed:
         where_condition = self.table_modified_condition.compile(last_modified=last_modified)
+        rows_condition = sql.SQL('{ids_condition} AND {shard_condition}').format(
+            ids_condition=self.table_ids_condition.compile(ids=ids),
+            shard_condition=self.table_shard_condition.compile(shard=shard),
+        )
 
         # noinspection SqlNoDataSourceInspection,SqlResolve
         return sql.SQL('''
@@ -133,26 +208,39 @@ class ExtractGenresSQLStatement(ExtractSQLStatement):
                 genre.modified,
                 genre.name
             FROM content.genre AS genre
-            WHERE {where_condition}
+            WHERE {where_condition} AND {rows_condition}
             ORDER BY
                 genre.modified,
                 genre.id
-            LIMIT {batch_size}
+            LIMIT {limit}
         ''').format(
             where_condition=where_condition,
-            batch_size=self.batch_size,
+            rows_condition=rows_condition,
+            limit=self._compile_limit(),
         )
 
 
 class ExtractPersonsSQLStatement(ExtractSQLStatement):
     table_modified_condition: TableModifiedCondition
+    table_ids_condition: TableIdsCondition
+    table_shard_condition: TableShardCondition
 
-    def __init__(self, *, batch_size: int) -> None:
+    def __init__(self, *, batch_size: int | None) -> None:
         super().__init__(batch_size=batch_size)
         self.table_modified_condition = TableModifiedCondition(table_name='modified_person')
+        self.table_ids_condition = TableIdsCondition(table_name='person')
+        self.table_shard_condition = TableShardCondition(table_name='person')
 
-    def compile(self, *, last_modified: LastModified) -> sql.Composed:
+    def compile(self,
+                *,
+                last_modified: LastModified,
+                ids: list[uuid.UUID] | None = None,
+                shard: Shard | None = None) -> sql.Composed:
         where_condition = self.table_modified_condition.compile(last_modified=last_modified)
+        rows_condition = sql.SQL('{ids_condition} AND {shard_condition}').format(
+            ids_condition=self.table_ids_condition.compile(ids=ids),
+            shard_condition=self.table_shard_condition.compile(shard=shard),
+        )
 
         # noinspection SqlNoDataSourceInspection,SqlResolve
         return sql.SQL('''
@@ -179,19 +267,210 @@ class ExtractPersonsSQLStatement(ExtractSQLStatement):
                             ON person_film_work.person_id = person.id
                         LEFT JOIN content.film_work AS film_work
                             ON person_film_work.film_work_id = film_work.id
+                    WHERE {rows_condition}
                     GROUP BY
                         person.id
                 ) AS modified_person
                     ON person.id = modified_person.id
-            WHERE {where_condition}
+            WHERE {where_condition} AND {rows_condition}
             GROUP BY
                 person.id,
                 modified_person.modified
             ORDER BY
                 modified_person.modified,
                 person.id
-            LIMIT {batch_size}
+            LIMIT {limit}
         ''').format(
             where_condition=where_condition,
+            rows_condition=rows_condition,
+            limit=self._compile_limit(),
+        )
+
+
+class CountSQLStatement:
+    table_name: str
+
+    def __init__(self, *, table_name: str) -> None:
+        self.table_name = table_name
+
+    def compile(self) -> sql.Composed:
+        # noinspection SqlNoDataSourceInspection,SqlResolve
+        return sql.SQL('''
+            SELECT count(*) AS count
+            FROM {table_name}
+        ''').format(
+            table_name=sql.Identifier('content', self.table_name),
+        )
+
+
+class ExtractNewestModifiedSQLStatement:
+    table_names: tuple[str, ...]
+
+    def __init__(self, *, table_names: tuple[str, ...]) -> None:
+        self.table_names = table_names
+
+    def compile(self) -> sql.Composed:
+        # noinspection SqlNoDataSourceInspection,SqlResolve
+        return sql.SQL('''
+            SELECT GREATEST({newest_modified}) AS modified
+        ''').format(
+            newest_modified=sql.SQL(', ').join(
+                sql.SQL('(SELECT max(modified) FROM {table_name})').format(
+                    table_name=sql.Identifier('content', table_name),
+                )
+                for table_name in self.table_names
+            ),
+        )
+
+
+class ExtractChangesPositionSQLStatement:
+    def compile(self) -> sql.Composed:
+        # noinspection SqlNoDataSourceInspection,SqlResolve
+        return sql.SQL('''
+            SELECT
+                pg_snapshot_xmin(pg_current_snapshot())::text::bigint AS transaction_id,
+                0 AS id
+        ''').format()
+
+
+class ExtractChangesSQLStatement:
+    batch_size: int
+
+    def __init__(self, *, batch_size: int) -> None:
+        self.batch_size = batch_size
+
+    def compile(self, *, last_change: LastChange) -> sql.Composed:
+        # Only changes of transactions older than the oldest running one are read: those can no longer
+        # be followed by a change with a lower (transaction_id, id) position.
+        # noinspection SqlNoDataSourceInspection,SqlResolve
+        return sql.SQL('''
+            SELECT
+                changes.transaction_id,
+                changes.id
+            FROM (
+                SELECT
+                    changes.transaction_id,
+                    changes.id
+                FROM content.changes AS changes
+                WHERE (changes.transaction_id, changes.id) > ({last_transaction_id}, {last_id})
+                    AND changes.transaction_id < pg_snapshot_xmin(pg_current_snapshot())::text::bigint
+                ORDER BY
+                    changes.transaction_id,
+                    changes.id
+                LIMIT {batch_size}
+            ) AS changes
+            ORDER BY
+                changes.transaction_id DESC,
+                changes.id DESC
+            LIMIT 1
+        ''').format(
+            last_transaction_id=last_change.transaction_id or 0,
+            last_id=last_change.id or 0,
             batch_size=self.batch_size,
         )
+
+
+class ExtractPendingChangesSQLStatement:
+    def compile(self, *, last_change: LastChange) -> sql.Composed:
+        # noinspection SqlNoDataSourceInspection,SqlResolve
+        return sql.SQL('''
+            SELECT
+                count(*) AS count,
+                min(changes.created) AS oldest_created
+            FROM content.changes AS changes
+            WHERE (changes.transaction_id, changes.id) > ({last_transaction_id}, {last_id})
+        ''').format(
+            last_transaction_id=last_change.transaction_id or 0,
+            last_id=last_change.id or 0,
+        )
+
+
+class DeleteChangesSQLStatement:
+    def compile(self, *, last_change: LastChange) -> sql.Composed:
+        # noinspection SqlNoDataSourceInspection,SqlResolve
+        return sql.SQL('''
+            DELETE FROM content.changes AS changes
+            WHERE (changes.transaction_id, changes.id) <= ({last_transaction_id}, {last_id})
+        ''').format(
+            last_transaction_id=last_change.transaction_id or 0,
+            last_id=last_change.id or 0,
+        )
+
+
+class ExtractChangedIdsSQLStatement:
+    def compile(self, *, last_change: LastChange, next_change: LastChange) -> sql.Composed:
+        raise NotImplementedError
+
+    def _compile_changes(self, *, last_change: LastChange, next_change: LastChange) -> sql.Composed:
+        # noinspection SqlNoDataSourceInspection,SqlResolve
+        return sql.SQL('''
+            SELECT
+                changes.entity,
+                changes.entity_id,
+                changes.cascade
+            FROM content.changes AS changes
+            WHERE (changes.transaction_id, changes.id) > ({last_transaction_id}, {last_id})
+                AND (changes.transaction_id, changes.id) <= ({next_transaction_id}, {next_id})
+        ''').format(
+            last_transaction_id=last_change.transaction_id or 0,
+            last_id=last_change.id or 0,
+            next_transaction_id=next_change.transaction_id,
+            next_id=next_change.id,
+        )
+
+
+class ExtractChangedFilmWorkIdsSQLStatement(ExtractChangedIdsSQLStatement):
+    def compile(self, *, last_change: LastChange, next_change: LastChange) -> sql.Composed:
+        # noinspection SqlNoDataSourceInspection,SqlResolve
+        return sql.SQL('''
+            WITH changes AS ({changes})
+            SELECT changes.entity_id AS id
+            FROM changes
+            WHERE changes.entity = 'film_work'
+            UNION
+            SELECT genre_film_work.film_work_id AS id
+            FROM changes
+                INNER JOIN content.genre_film_work AS genre_film_work
+                    ON genre_film_work.genre_id = changes.entity_id
+            WHERE changes.entity = 'genre' AND changes.cascade
+            UNION
+            SELECT person_film_work.film_work_id AS id
+            FROM changes
+                INNER JOIN content.person_film_work AS person_film_work
+                    ON person_film_work.person_id = changes.entity_id
+            WHERE changes.entity = 'person' AND changes.cascade
+        ''').format(
+            changes=self._compile_changes(last_change=last_change, next_change=next_change),
+        )
+
+
+class ExtractChangedGenreIdsSQLStatement(ExtractChangedIdsSQLStatement):
+    def compile(self, *, last_change: LastChange, next_change: LastChange) -> sql.Composed:
+        # noinspection SqlNoDataSourceInspection,SqlResolve
+        return sql.SQL('''
+            WITH changes AS ({changes})
+            SELECT DISTINCT changes.entity_id AS id
+            FROM changes
+            WHERE changes.entity = 'genre'
+        ''').format(
+            changes=self._compile_changes(last_change=last_change, next_change=next_change),
+        )
+
+
+class ExtractChangedPersonIdsSQLStatement(ExtractChangedIdsSQLStatement):
+    def compile(self, *, last_change: LastChange, next_change: LastChange) -> sql.Composed:
+        # noinspection SqlNoDataSourceInspection,SqlResolve
+        return sql.SQL('''
+            WITH changes AS ({changes})
+            SELECT changes.entity_id AS id
+            FROM changes
+            WHERE changes.entity = 'person'
+            UNION
+            SELECT person_film_work.person_id AS id
+            FROM changes
+                INNER JOIN content.person_film_work AS person_film_work
+                    ON person_film_work.film_work_id = changes.entity_id
+            WHERE changes.entity = 'film_work' AND changes.cascade
+        ''').format(
+            changes=self._compile_changes(last_change=last_change, next_change=next_change),
+        )
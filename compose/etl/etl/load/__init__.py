@@ -1 +1,9 @@
-from .loaders import ElasticsearchLoader
+from .indices import (
+    REINDEX_ALIAS_SUFFIX,
+    ElasticsearchIndexManager,
+)
+from .loaders import (
+    BulkOptions,
+    ElasticsearchLoader,
+)
+from .publishers import RedisChangesPublisher
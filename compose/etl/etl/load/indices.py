@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import re
+
+import backoff
+import elasticsearch
+
+REINDEX_ALIAS_SUFFIX = '_reindex'
+
+
+class ElasticsearchIndexManager:
+    client: elasticsearch.Elasticsearch
+
+    def __init__(self, *, client: elasticsearch.Elasticsearch) -> None:
+        self.client = client
+
+    @staticmethod
+    def get_reindex_alias(alias: str) -> str:
+        return f'{alias}{REINDEX_ALIAS_SUFFIX}'
+
+    @backoff.on_exception(backoff.expo, (
+            elasticsearch.ConnectionError,
+            elasticsearch.ConnectionTimeout,
+    ))
+    def get_indices(self, *, name: str) -> list[str]:
+        try:
+            return list(self.client.indices.get(index=name).body)
+        except elasticsearch.NotFoundError:
+            return []
+
+    @backoff.on_exception(backoff.expo, (
+            elasticsearch.ConnectionError,
+            elasticsearch.ConnectionTimeout,
+    ))
+    def get_alias_indices(self, *, alias: str) -> list[str]:
+        try:
+            return list(self.client.indices.get_alias(name=alias).body)
+        except elasticsearch.NotFoundError:
+            return []
+
+    @backoff.on_exception(backoff.expo, (
+            elasticsearch.ConnectionError,
+            elasticsearch.ConnectionTimeout,
+    ))
+    def create_index(self, *, alias: str, index_data: dict | None, settings: dict | None = None) -> str:
+        index_data = dict(index_data or {})
+        index_data['settings'] = {**index_data.get('settings', {}), **(settings or {})}
+        index_name = f'{alias}_v{self._get_next_version(alias=alias)}'
+        self.client.indices.create(index=index_name, body=index_data)
+
+        return index_name
+
+    @backoff.on_exception(backoff.expo, (
+            elasticsearch.ConnectionError,
+            elasticsearch.ConnectionTimeout,
+    ))
+    def ensure_index(self, *, alias: str, index_data: dict | None) -> None:
+        if self.client.indices.exists(index=alias):
+            return
+
+        try:
+            self.client.indices.create(
+                index=f'{alias}_v{self._get_next_version(alias=alias)}',
+                body={**(index_data or {}), 'aliases': {alias: {}}},
+            )
+        except elasticsearch.BadRequestError as e:
+            if e.error != 'resource_already_exists_exception':
+                raise
+
+    @backoff.on_exception(backoff.expo, (
+            elasticsearch.ConnectionError,
+            elasticsearch.ConnectionTimeout,
+    ))
+    def add_alias(self, *, index: str, alias: str) -> None:
+        self.client.indices.put_alias(index=index, name=alias)
+
+    @backoff.on_exception(backoff.expo, (
+            elasticsearch.ConnectionError,
+            elasticsearch.ConnectionTimeout,
+    ))
+    def swap_alias(self, *, alias: str, index: str) -> list[str]:
+        old_indices = [old_index for old_index in self.get_indices(name=alias) if old_index != index]
+        actions: list[dict] = [
+            {'remove': {'index': index, 'alias': self.get_reindex_alias(alias)}},
+            {'add': {'index': index, 'alias': alias}},
+        ]
+
+        # A concrete index named like the alias is removed in the same request, so the name never goes missing.
+        actions.extend({'remove_index': {'index': old_index}} for old_index in old_indices)
+        self.client.indices.update_aliases(actions=actions)
+
+        return old_indices
+
+    @backoff.on_exception(backoff.expo, (
+            elasticsearch.ConnectionError,
+            elasticsearch.ConnectionTimeout,
+    ))
+    def delete_index(self, *, index: str) -> None:
+        self.client.indices.delete(index=index, ignore_unavailable=True)
+
+    @backoff.on_exception(backoff.expo, (
+            elasticsearch.ConnectionError,
+            elasticsearch.ConnectionTimeout,
+    ))
+    def get_settings(self, *, index: str) -> dict:
+        response = self.client.indices.get_settings(
+            index=index,
+            name='index.refresh_interval,index.number_of_replicas',
+            flat_settings=True,
+        )
+        index_settings = next(iter(response.values()))['settings']
+
+        return {
+            'refresh_interval': index_settings.get('index.refresh_interval'),
+            'number_of_replicas': index_settings.get('index.number_of_replicas'),
+        }
+
+    @backoff.on_exception(backoff.expo, (
+            elasticsearch.ConnectionError,
+            elasticsearch.ConnectionTimeout,
+    ))
+    def put_settings(self, *, index: str, settings: dict) -> None:
+        self.client.indices.put_settings(index=index, settings={'index': settings})
+
+    @backoff.on_exception(backoff.expo, (
+            elasticsearch.ConnectionError,
+            elasticsearch.ConnectionTimeout,
+    ))
+    def count(self, *, index: str) -> int:
+        self.client.indices.refresh(index=index)
+
+        return self.client.count(index=index)['count']
+
+    def _get_next_version(self, *, alias: str) -> int:
+        versions = [
+            int(match.group(1))
+            for index in self.get_indices(name=f'{alias}_v*')
+            if (match := re.fullmatch(rf'{re.escape(alias)}_v(\d+)', index))
+        ]
+
+        return max(versions, default=0) + 1
@@ -1,33 +1,63 @@
 from __future__ import annotations
 
+import contextlib
+import dataclasses
 import logging
-from collections.abc import Iterable
+import time
+from collections.abc import Generator, Iterable
+from typing import Literal
 
 import backoff
 import elasticsearch
 import elasticsearch.helpers
 
+from .indices import ElasticsearchIndexManager
+from .publishers import RedisChangesPublisher
 from ..transform import Document
 
 logger = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass(kw_only=True)
+class BulkOptions:
+    mode: Literal['bulk', 'streaming', 'parallel'] = 'bulk'
+    chunk_size: int = 500
+    max_chunk_bytes: int = 100 * 1024 * 1024
+    thread_count: int = 4
+    max_retries: int = 3
+    initial_backoff: float = 2.0
+    max_backoff: float = 600.0
+
+
 class ElasticsearchLoader[TDocument: Document]:
     client: elasticsearch.Elasticsearch
     index_name: str
     index_data: dict | None
     index_created: bool
+    changes_publisher: RedisChangesPublisher | None
+    bulk_options: BulkOptions
+    dual_write: bool
+    index_manager: ElasticsearchIndexManager
+    reindexing: bool
 
     def __init__(self,
                  *,
                  client: elasticsearch.Elasticsearch,
                  index_name: str,
-                 index_data: dict | None = None) -> None:
+                 index_data: dict | None = None,
+                 changes_publisher: RedisChangesPublisher | None = None,
+                 bulk_options: BulkOptions | None = None,
+                 dual_write: bool = True) -> None:
         self.client = client
         self.index_name = index_name
         self.index_data = index_data
+        self.changes_publisher = changes_publisher
+        self.bulk_options = bulk_options or BulkOptions()
+        self.dual_write = dual_write
+        self.index_manager = ElasticsearchIndexManager(client=client)
 
         self.index_created = False
+        self.reindexing = False
 
     @backoff.on_exception(backoff.expo, (
             elasticsearch.ConnectionError,
@@ -37,27 +67,130 @@ class ElasticsearchLoader[TDocument: Document]:
         if self.index_data and not self.index_created:
             self._create_index()
 
+        documents = list(documents)
+
+        # Refreshes are switched off while reindexing, waiting for one would block until the reindex ends.
+        refresh = 'wait_for' if self.changes_publisher is not None and not self.reindexing else False
+        self._bulk(self._create_actions(documents, index_name=self.index_name), refresh=refresh)
+
+        # While a reindex builds a new index, changes are written to it as well, so it does not miss them.
+        if self.dual_write:
+            for index_name in self.index_manager.get_alias_indices(
+                    alias=self.index_manager.get_reindex_alias(self.index_name),
+            ):
+                self._bulk(self._create_actions(documents, index_name=index_name), refresh=False)
+
+        if self.changes_publisher is not None:
+            self.changes_publisher.publish(
+                index_name=self.index_name,
+                ids=[str(document.id) for document in documents],
+            )
+
+    @contextlib.contextmanager
+    def reindex_profile(self) -> Generator[None]:
+        if self.index_data and not self.index_created:
+            self._create_index()
+
+        index_settings = self.index_manager.get_settings(index=self.index_name)
+        self.index_manager.put_settings(index=self.index_name, settings={
+            'refresh_interval': '-1',
+            'number_of_replicas': 0,
+        })
+        self.reindexing = True
+
+        try:
+            yield
+
+        finally:
+            self.reindexing = False
+            self.index_manager.put_settings(index=self.index_name, settings=index_settings)
+            self.client.indices.refresh(index=self.index_name)
+
+            if self.changes_publisher is not None:
+                self.changes_publisher.publish_index(index_name=self.index_name)
+
+    def _create_actions(self, documents: list[TDocument], *, index_name: str) -> list[dict]:
+        return [{
+            '_index': index_name,
+            '_id': document.id,
+            '_source': document.get_source(),
+        } for document in documents]
+
+    def _bulk(self, actions: list[dict], *, refresh: str | bool) -> None:
         try:
-            elasticsearch.helpers.bulk(self.client, ({
-                '_index': self.index_name,
-                '_id': document.id,
-                '_source': document.model_dump(mode='json'),
-            } for document in documents))
+            match self.bulk_options.mode:
+                case 'bulk':
+                    elasticsearch.helpers.bulk(
+                        self.client,
+                        actions,
+                        chunk_size=self.bulk_options.chunk_size,
+                        max_chunk_bytes=self.bulk_options.max_chunk_bytes,
+                        refresh=refresh,
+                    )
+                case 'streaming':
+                    self._streaming_bulk(actions, refresh=refresh)
+                case 'parallel':
+                    self._parallel_bulk(actions, refresh=refresh)
 
         except elasticsearch.helpers.BulkIndexError as e:
             logger.exception(e)
             logger.debug(e.errors)
             raise
 
-    @backoff.on_exception(backoff.expo, (
-            elasticsearch.ConnectionError,
-            elasticsearch.ConnectionTimeout,
-    ))
-    def _create_index(self) -> None:
-        try:
-            self.client.indices.create(index=self.index_name, body=self.index_data)
-        except elasticsearch.BadRequestError as e:
-            if e.error == 'resource_already_exists_exception':
-                pass
+    def _streaming_bulk(self, actions: list[dict], *, refresh: str | bool) -> None:
+        for _ok, _item in elasticsearch.helpers.streaming_bulk(
+                self.client,
+                actions,
+                chunk_size=self.bulk_options.chunk_size,
+                max_chunk_bytes=self.bulk_options.max_chunk_bytes,
+                max_retries=self.bulk_options.max_retries,
+                initial_backoff=self.bulk_options.initial_backoff,
+                max_backoff=self.bulk_options.max_backoff,
+                yield_ok=False,
+                refresh=refresh,
+        ):
+            pass
+
+    def _parallel_bulk(self, actions: list[dict], *, refresh: str | bool) -> None:
+        for attempt in range(self.bulk_options.max_retries + 1):
+            rejected_actions = []
+            errors = []
+
+            # parallel_bulk yields the results in the order of the actions.
+            for action, (ok, item) in zip(actions, elasticsearch.helpers.parallel_bulk(
+                    self.client,
+                    actions,
+                    thread_count=self.bulk_options.thread_count,
+                    chunk_size=self.bulk_options.chunk_size,
+                    max_chunk_bytes=self.bulk_options.max_chunk_bytes,
+                    raise_on_error=False,
+                    refresh=refresh,
+            )):
+                if ok:
+                    continue
 
+                if next(iter(item.values())).get('status') == 429:
+                    rejected_actions.append(action)
+                else:
+                    errors.append(item)
+
+            if errors:
+                raise elasticsearch.helpers.BulkIndexError(f'{len(errors)} document(s) failed to index.', errors)
+
+            if not rejected_actions:
+                return
+
+            if attempt < self.bulk_options.max_retries:
+                logger.warning('Retry %d rejected document(s) of %s', len(rejected_actions), self.index_name)
+                time.sleep(min(self.bulk_options.max_backoff, self.bulk_options.initial_backoff * 2 ** attempt))
+
+            actions = rejected_actions
+
+        raise elasticsearch.helpers.BulkIndexError(
+            f'{len(actions)} document(s) rejected after {self.bulk_options.max_retries} retries.',
+            [],
+        )
+
+    def _create_index(self) -> None:
+        self.index_manager.ensure_index(alias=self.index_name, index_data=self.index_data)
         self.index_created = True
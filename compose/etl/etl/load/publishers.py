@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+
+import backoff
+import redis
+import redis.exceptions
+
+
+class RedisChangesPublisher:
+    client: redis.Redis
+    stream_name: str
+    stream_max_length: int
+    versions_key: str
+
+    def __init__(self,
+                 *,
+                 client: redis.Redis,
+                 stream_name: str,
+                 stream_max_length: int,
+                 versions_key: str) -> None:
+        self.client = client
+        self.stream_name = stream_name
+        self.stream_max_length = stream_max_length
+        self.versions_key = versions_key
+
+    @backoff.on_exception(backoff.expo, (
+            redis.exceptions.ConnectionError,
+            redis.exceptions.TimeoutError,
+    ))
+    def publish(self, *, index_name: str, ids: list[str]) -> None:
+        if not ids:
+            return
+
+        self._publish(index_name=index_name, ids=ids)
+
+    @backoff.on_exception(backoff.expo, (
+            redis.exceptions.ConnectionError,
+            redis.exceptions.TimeoutError,
+    ))
+    def publish_index(self, *, index_name: str) -> None:
+        self._publish(index_name=index_name, ids=[])
+
+    def _publish(self, *, index_name: str, ids: list[str]) -> None:
+        with self.client.pipeline(transaction=True) as pipeline:
+            pipeline.hincrby(self.versions_key, index_name, 1)
+            pipeline.xadd(
+                self.stream_name,
+                {'index': index_name, 'ids': json.dumps(ids)},
+                maxlen=self.stream_max_length,
+                approximate=True,
+            )
+            pipeline.execute()
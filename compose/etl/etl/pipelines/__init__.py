@@ -1,8 +1,25 @@
 from .pipelines import (
     ETLPipeline,
+    ExtractedBatch,
+    PipelineLag,
     DocumentsTransformResult,
     DocumentsTransformExecutor,
     FilmsTransformExecutor,
     GenresTransformExecutor,
     PersonsTransformExecutor,
+    SourcesTransformExecutor,
+    create_transform_executor,
+)
+from .runners import (
+    ConcurrentETLRunner,
+    PipelineStats,
+    StageStats,
+)
+from .reindexers import (
+    Reindexer,
+    ReindexError,
+)
+from .shards import (
+    ShardedLoadCoordinator,
+    ShardLoader,
 )
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import dataclasses
+import datetime
+import logging
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from ..extract import (
+    ExtractedChanges,
+    PostgreSQLChangesExtractor,
     PostgreSQLExtractor,
     FilmWorksParser,
     GenresParser,
@@ -13,10 +17,15 @@ from ..extract import (
 from ..load import ElasticsearchLoader
 from ..state import (
     ExtractorState,
-    LastModified
+    LastChange,
+    LastModified,
+    Shard,
 )
 from ..transform import (
     Document,
+    DocumentSource,
+    DocumentSourcesBuilder,
+    DocumentsHashFilter,
     Film,
     Genre,
     Person,
@@ -25,6 +34,8 @@ from ..transform import (
     PersonsTransformer,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclasses.dataclass(kw_only=True)
 class DocumentsTransformResult[TDocument: Document]:
@@ -36,6 +47,21 @@ class DocumentsTransformResult[TDocument: Document]:
         def __init__(self, *, documents: list[TDocument], last_modified: LastModified) -> None: ...
 
 
+@dataclasses.dataclass(kw_only=True)
+class ExtractedBatch:
+    documents_data: list[dict]
+    last_modified: LastModified | None = None
+    last_change: LastChange | None = None
+
+
+@dataclasses.dataclass(kw_only=True)
+class PipelineLag:
+    index_name: str
+    modified_lag: datetime.timedelta | None = None
+    pending_changes: int | None = None
+    oldest_change_age: datetime.timedelta | None = None
+
+
 class DocumentsTransformExecutor[TDocument: Document]:
     def transform_documents(self, *, documents_data: Iterable[dict]) -> DocumentsTransformResult[TDocument]:
         raise NotImplementedError
@@ -80,22 +106,63 @@ class PersonsTransformExecutor(DocumentsTransformExecutor[Person]):
         )
 
 
+class SourcesTransformExecutor(DocumentsTransformExecutor[DocumentSource]):
+    sources_builder: DocumentSourcesBuilder
+
+    def __init__(self, *, sources_builder: DocumentSourcesBuilder) -> None:
+        self.sources_builder = sources_builder
+
+    def transform_documents(self, *, documents_data: Iterable[dict]) -> DocumentsTransformResult[DocumentSource]:
+        sources_result = self.sources_builder.build(documents_data=list(documents_data))
+
+        return DocumentsTransformResult[DocumentSource](
+            documents=sources_result.sources,
+            last_modified=sources_result.last_modified,
+        )
+
+
+def create_transform_executor[TDocument: Document](
+        *,
+        models_executor: DocumentsTransformExecutor[TDocument],
+        sources_builder: DocumentSourcesBuilder | None = None,
+) -> DocumentsTransformExecutor[TDocument]:
+    if sources_builder is None:
+        return models_executor
+
+    # Sources stand in for the models downstream, only their id and serialized form are used there.
+    return SourcesTransformExecutor(sources_builder=sources_builder)  # type: ignore[return-value]
+
+
 class ETLPipeline[TDocument: Document]:
     extractor: PostgreSQLExtractor
     extractor_state: ExtractorState
     transform_executor: DocumentsTransformExecutor[TDocument]
     loader: ElasticsearchLoader[TDocument]
+    changes_extractor: PostgreSQLChangesExtractor | None
+    documents_filter: DocumentsHashFilter[TDocument] | None
 
     def __init__(self,
                  *,
                  extractor: PostgreSQLExtractor,
                  extractor_state: ExtractorState,
                  transform_executor: DocumentsTransformExecutor[TDocument],
-                 loader: ElasticsearchLoader[TDocument]) -> None:
+                 loader: ElasticsearchLoader[TDocument],
+                 changes_extractor: PostgreSQLChangesExtractor | None = None,
+                 documents_filter: DocumentsHashFilter[TDocument] | None = None) -> None:
         self.extractor = extractor
         self.extractor_state = extractor_state
         self.transform_executor = transform_executor
         self.loader = loader
+        self.changes_extractor = changes_extractor
+        self.documents_filter = documents_filter
+
+    @property
+    def captures_changes(self) -> bool:
+        return self.changes_extractor is not None and self.extractor_state.last_change.transaction_id is not None
+
+    @property
+    def loads_from_scratch(self) -> bool:
+        return self.extractor_state.last_modified.modified is None and not self.captures_changes
 
     def transfer_data(self) -> DocumentsTransformResult[TDocument]:
         documents_data = self.extractor.extract(last_modified=self.extractor_state.last_modified)
@@ -104,7 +171,150 @@ class ETLPipeline[TDocument: Document]:
         )
 
         if documents_transform_result.documents:
-            self.loader.load(documents=documents_transform_result.documents)
+            self.load_batch(documents=self._filter_documents(documents_transform_result.documents))
             self.extractor_state.last_modified = documents_transform_result.last_modified
 
         return documents_transform_result
+
+    def stream_data(self) -> Iterable[DocumentsTransformResult[TDocument]]:
+        for documents_data in self.extractor.stream(last_modified=self.extractor_state.last_modified):
+            documents_transform_result = self.transform_executor.transform_documents(
+                documents_data=documents_data,
+            )
+            self.load_batch(documents=self._filter_documents(documents_transform_result.documents))
+            self.extractor_state.last_modified = documents_transform_result.last_modified
+
+            yield documents_transform_result
+
+    def transfer_changes(self) -> ExtractedChanges | None:
+        if self.changes_extractor is None:
+            return None
+
+        changes = self.changes_extractor.extract(last_change=self.extractor_state.last_change)
+
+        if changes is None:
+            return None
+
+        for documents_data in self.extractor.extract_ids(ids=changes.ids):
+            documents_transform_result = self.transform_executor.transform_documents(
+                documents_data=documents_data,
+            )
+            self.load_batch(documents=self._filter_documents(documents_transform_result.documents))
+
+        self.extractor_state.last_change = changes.last_change
+
+        return changes
+
+    def extract_batches(self, *, stream: bool = True) -> Iterable[ExtractedBatch]:
+        if self.captures_changes:
+            yield from self._extract_changed_batches()
+            return
+
+        last_change = None
+
+        if self.changes_extractor is not None:
+            last_change = self.changes_extractor.get_position()
+
+        yield from self._extract_modified_batches(stream=stream, last_modified=self.extractor_state.last_modified)
+
+        if last_change is not None:
+            yield ExtractedBatch(documents_data=[], last_change=last_change)
+
+    def extract_shard_batches(self, *, shard: Shard, last_modified: LastModified) -> Iterable[ExtractedBatch]:
+        yield from self._extract_modified_batches(stream=True, last_modified=last_modified, shard=shard)
+
+    def transform_batch(self, *, batch: ExtractedBatch) -> list[TDocument]:
+        if not batch.documents_data:
+            return []
+
+        documents = self.transform_executor.transform_documents(documents_data=batch.documents_data).documents
+
+        return self._filter_documents(documents)
+
+    def load_batch(self, *, documents: list[TDocument]) -> None:
+        if not documents:
+            return
+
+        self.loader.load(documents=documents)
+
+        if self.documents_filter is not None:
+            self.documents_filter.commit(documents)
+
+    def log_filter_stats(self) -> None:
+        if self.documents_filter is None:
+            return
+
+        sent, skipped = self.documents_filter.pop_counters()
+
+        if sent or skipped:
+            logger.info('%s: %d documents sent, %d unchanged skipped', self.loader.index_name, sent, skipped)
+
+    def measure_lag(self) -> PipelineLag:
+        lag = PipelineLag(index_name=self.loader.index_name)
+
+        if self.captures_changes:
+            assert self.changes_extractor is not None
+            pending_changes = self.changes_extractor.get_pending(last_change=self.extractor_state.last_change)
+            lag.pending_changes = pending_changes.count
+
+            if pending_changes.oldest_created is not None:
+                lag.oldest_change_age = datetime.datetime.now(datetime.UTC) - pending_changes.oldest_created
+
+            return lag
+
+        newest_modified = self.extractor.get_newest_modified()
+        last_modified = self.extractor_state.last_modified.modified
+
+        if newest_modified is not None and last_modified is not None:
+            lag.modified_lag = max(newest_modified - last_modified, datetime.timedelta())
+
+        return lag
+
+    def commit_batch(self, *, batch: ExtractedBatch) -> None:
+        if batch.last_modified is not None:
+            self.extractor_state.last_modified = batch.last_modified
+
+        if batch.last_change is not None:
+            self.extractor_state.last_change = batch.last_change
+
+    def _filter_documents(self, documents: list[TDocument]) -> list[TDocument]:
+        if self.documents_filter is None:
+            return documents
+
+        return self.documents_filter.filter(documents)
+
+    def _extract_changed_batches(self) -> Iterable[ExtractedBatch]:
+        assert self.changes_extractor is not None
+        last_change = self.extractor_state.last_change
+
+        while (changes := self.changes_extractor.extract(last_change=last_change)) is not None:
+            for documents_data in self.extractor.extract_ids(ids=changes.ids):
+                yield ExtractedBatch(documents_data=documents_data)
+
+            yield ExtractedBatch(documents_data=[], last_change=changes.last_change)
+            last_change = changes.last_change
+
+    def _extract_modified_batches(self,
+                                  *,
+                                  stream: bool,
+                                  last_modified: LastModified,
+                                  shard: Shard | None = None) -> Iterable[ExtractedBatch]:
+        if stream:
+            batches = self.extractor.stream(last_modified=last_modified, shard=shard)
+        else:
+            batches = self._extract_pages(last_modified=last_modified)
+
+        for documents_data in batches:
+            last_row = documents_data[-1]
+
+            yield ExtractedBatch(
+                documents_data=documents_data,
+                last_modified=LastModified(modified=last_row['modified'], id=last_row['id']),
+            )
+
+    def _extract_pages(self, *, last_modified: LastModified) -> Iterable[list[dict]]:
+        while documents_data := list(self.extractor.extract(last_modified=last_modified)):
+            yield documents_data
+
+            last_row = documents_data[-1]
+            last_modified = LastModified(modified=last_row['modified'], id=last_row['id'])
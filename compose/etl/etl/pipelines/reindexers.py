@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import logging
+import time
+
+from .pipelines import DocumentsTransformExecutor
+from ..extract import PostgreSQLExtractor
+from ..load import (
+    BulkOptions,
+    ElasticsearchIndexManager,
+    ElasticsearchLoader,
+    RedisChangesPublisher,
+)
+from ..state import LastModified
+from ..transform import Document
+
+logger = logging.getLogger(__name__)
+
+
+class ReindexError(Exception):
+    pass
+
+
+class Reindexer[TDocument: Document]:
+    extractor: PostgreSQLExtractor
+    transform_executor: DocumentsTransformExecutor[TDocument]
+    index_manager: ElasticsearchIndexManager
+    index_name: str
+    index_data: dict | None
+    bulk_options: BulkOptions | None
+    changes_publisher: RedisChangesPublisher | None
+    grace_period: float
+
+    def __init__(self,
+                 *,
+                 extractor: PostgreSQLExtractor,
+                 transform_executor: DocumentsTransformExecutor[TDocument],
+                 index_manager: ElasticsearchIndexManager,
+                 index_name: str,
+                 index_data: dict | None = None,
+                 bulk_options: BulkOptions | None = None,
+                 changes_publisher: RedisChangesPublisher | None = None,
+                 grace_period: float = 0.0) -> None:
+        self.extractor = extractor
+        self.transform_executor = transform_executor
+        self.index_manager = index_manager
+        self.index_name = index_name
+        self.index_data = index_data
+        self.bulk_options = bulk_options
+        self.changes_publisher = changes_publisher
+        self.grace_period = grace_period
+
+    def reindex(self) -> str:
+        old_indices = self.index_manager.get_indices(name=self.index_name)
+        schema_settings = (self.index_data or {}).get('settings', {})
+        index_settings = {
+            'refresh_interval': schema_settings.get('refresh_interval'),
+            'number_of_replicas': schema_settings.get('number_of_replicas'),
+        }
+
+        if old_indices:
+            index_settings = self.index_manager.get_settings(index=old_indices[0])
+
+        new_index = self.index_manager.create_index(
+            alias=self.index_name,
+            index_data=self.index_data,
+            settings={'refresh_interval': '-1', 'number_of_replicas': 0},
+        )
+        logger.info('Reindex %s into %s', self.index_name, new_index)
+
+        try:
+            # The incremental ETL starts writing to the new index as well, batches it extracted before the
+            # alias appeared are given time to finish before the full extraction starts.
+            self.index_manager.add_alias(index=new_index, alias=self.index_manager.get_reindex_alias(self.index_name))
+            time.sleep(self.grace_period)
+
+            self._load(index=new_index)
+            self.index_manager.put_settings(index=new_index, settings=index_settings)
+            self._verify(index=new_index)
+
+        except BaseException:
+            self.index_manager.delete_index(index=new_index)
+            raise
+
+        removed_indices = self.index_manager.swap_alias(alias=self.index_name, index=new_index)
+        logger.info('Alias %s points to %s, removed %s', self.index_name, new_index, removed_indices)
+
+        if self.changes_publisher is not None:
+            self.changes_publisher.publish_index(index_name=self.index_name)
+
+        return new_index
+
+    def _load(self, *, index: str) -> None:
+        loader = ElasticsearchLoader[TDocument](
+            client=self.index_manager.client,
+            index_name=index,
+            bulk_options=self.bulk_options,
+            dual_write=False,
+        )
+        loader.reindexing = True
+
+        for documents_data in self.extractor.stream(last_modified=LastModified()):
+            documents_transform_result = self.transform_executor.transform_documents(
+                documents_data=documents_data,
+            )
+            loader.load(documents=documents_transform_result.documents)
+
+    def _verify(self, *, index: str) -> None:
+        expected_count = self.extractor.count()
+        count = self.index_manager.count(index=index)
+
+        if count != expected_count:
+            raise ReindexError(f'{index} has {count} documents, {expected_count} expected')
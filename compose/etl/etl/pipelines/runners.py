@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+)
+
+from .pipelines import (
+    ETLPipeline,
+    ExtractedBatch,
+)
+from ..state import (
+    State,
+    Storage,
+)
+from ..transform import Document
+
+logger = logging.getLogger(__name__)
+
+
+class RunnerStopped(Exception):
+    pass
+
+
+@dataclasses.dataclass(kw_only=True)
+class StageStats:
+    name: str
+    batches: int = 0
+    documents: int = 0
+    seconds: float = 0.0
+
+    @property
+    def documents_per_second(self) -> float:
+        if not self.seconds:
+            return 0.0
+
+        return self.documents / self.seconds
+
+    def record(self, *, documents: int, seconds: float) -> None:
+        self.batches += 1
+        self.documents += documents
+        self.seconds += seconds
+
+
+@dataclasses.dataclass(kw_only=True)
+class PipelineStats:
+    extract: StageStats = dataclasses.field(default_factory=lambda: StageStats(name='extract'))
+    transform: StageStats = dataclasses.field(default_factory=lambda: StageStats(name='transform'))
+    load: StageStats = dataclasses.field(default_factory=lambda: StageStats(name='load'))
+
+    @property
+    def stages(self) -> list[StageStats]:
+        return [self.extract, self.transform, self.load]
+
+
+class ConcurrentETLRunner:
+    etl_pipelines: list[ETLPipeline[Document]]
+    storage: Storage
+    state: State
+    queue_size: int
+    stream: bool
+    state_lock: threading.Lock
+
+    def __init__(self,
+                 *,
+                 etl_pipelines: list[ETLPipeline[Document]],
+                 storage: Storage,
+                 state: State,
+                 queue_size: int = 4,
+                 stream: bool = True) -> None:
+        self.etl_pipelines = etl_pipelines
+        self.storage = storage
+        self.state = state
+        self.queue_size = queue_size
+        self.stream = stream
+        self.state_lock = threading.Lock()
+
+    def run(self) -> dict[str, PipelineStats]:
+        stop_event = threading.Event()
+        stats: dict[str, PipelineStats] = {}
+        futures: list[Future[None]] = []
+
+        with ThreadPoolExecutor(max_workers=len(self.etl_pipelines) * 3, thread_name_prefix='etl') as executor:
+            for etl_pipeline in self.etl_pipelines:
+                pipeline_stats = stats[etl_pipeline.loader.index_name] = PipelineStats()
+                extracted_queue: queue.Queue[ExtractedBatch | None] = queue.Queue(maxsize=self.queue_size)
+                transformed_queue: queue.Queue[tuple[ExtractedBatch, list[Document]] | None] = queue.Queue(
+                    maxsize=self.queue_size,
+                )
+
+                futures.append(executor.submit(
+                    self._extract,
+                    etl_pipeline=etl_pipeline,
+                    output_queue=extracted_queue,
+                    stage_stats=pipeline_stats.extract,
+                    stop_event=stop_event,
+                ))
+                futures.append(executor.submit(
+                    self._transform,
+                    etl_pipeline=etl_pipeline,
+                    input_queue=extracted_queue,
+                    output_queue=transformed_queue,
+                    stage_stats=pipeline_stats.transform,
+                    stop_event=stop_event,
+                ))
+                futures.append(executor.submit(
+                    self._load,
+                    etl_pipeline=etl_pipeline,
+                    input_queue=transformed_queue,
+                    stage_stats=pipeline_stats.load,
+                    stop_event=stop_event,
+                ))
+
+            try:
+                for future in as_completed(futures):
+                    future.result()
+
+            except BaseException:
+                stop_event.set()
+                raise
+
+        self._log_stats(stats)
+
+        for etl_pipeline in self.etl_pipelines:
+            etl_pipeline.log_filter_stats()
+
+        return stats
+
+    def _extract(self,
+                 *,
+                 etl_pipeline: ETLPipeline[Document],
+                 output_queue: queue.Queue[ExtractedBatch | None],
+                 stage_stats: StageStats,
+                 stop_event: threading.Event) -> None:
+        batches = iter(etl_pipeline.extract_batches(stream=self.stream))
+
+        while True:
+            started_at = time.perf_counter()
+            batch = next(batches, None)
+
+            if batch is None:
+                break
+
+            stage_stats.record(documents=len(batch.documents_data), seconds=time.perf_counter() - started_at)
+            self._put(output_queue, batch, stop_event=stop_event)
+
+        self._put(output_queue, None, stop_event=stop_event)
+
+    def _transform(self,
+                   *,
+                   etl_pipeline: ETLPipeline[Document],
+                   input_queue: queue.Queue[ExtractedBatch | None],
+                   output_queue: queue.Queue[tuple[ExtractedBatch, list[Document]] | None],
+                   stage_stats: StageStats,
+                   stop_event: threading.Event) -> None:
+        while (batch := self._get(input_queue, stop_event=stop_event)) is not None:
+            started_at = time.perf_counter()
+            documents = etl_pipeline.transform_batch(batch=batch)
+            stage_stats.record(documents=len(documents), seconds=time.perf_counter() - started_at)
+
+            self._put(output_queue, (batch, documents), stop_event=stop_event)
+
+        self._put(output_queue, None, stop_event=stop_event)
+
+    def _load(self,
+              *,
+              etl_pipeline: ETLPipeline[Document],
+              input_queue: queue.Queue[tuple[ExtractedBatch, list[Document]] | None],
+              stage_stats: StageStats,
+              stop_event: threading.Event) -> None:
+        while (item := self._get(input_queue, stop_event=stop_event)) is not None:
+            batch, documents = item
+            started_at = time.perf_counter()
+            etl_pipeline.load_batch(documents=documents)
+            stage_stats.record(documents=len(documents), seconds=time.perf_counter() - started_at)
+
+            # Batches reach the load stage in extraction order, so the state only ever moves forward.
+            with self.state_lock:
+                etl_pipeline.commit_batch(batch=batch)
+                self.storage.save(self.state)
+
+    def _put[TItem](self, output_queue: queue.Queue[TItem], item: TItem, *, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            try:
+                output_queue.put(item, timeout=0.1)
+                return
+
+            except queue.Full:
+                pass
+
+        raise RunnerStopped
+
+    def _get[TItem](self, input_queue: queue.Queue[TItem], *, stop_event: threading.Event) -> TItem:
+        while not stop_event.is_set():
+            try:
+                return input_queue.get(timeout=0.1)
+
+            except queue.Empty:
+                pass
+
+        raise RunnerStopped
+
+    def _log_stats(self, stats: dict[str, PipelineStats]) -> None:
+        for index_name, pipeline_stats in stats.items():
+            if not pipeline_stats.load.documents:
+                continue
+
+            for stage_stats in pipeline_stats.stages:
+                logger.info(
+                    '%s %s: %d batches, %d documents in %.2fs (%.1f documents/s)',
+                    index_name,
+                    stage_stats.name,
+                    stage_stats.batches,
+                    stage_stats.documents,
+                    stage_stats.seconds,
+                    stage_stats.documents_per_second,
+                )
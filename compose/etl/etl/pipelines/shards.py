@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import queue
+import time
+from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_EXCEPTION,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+
+from .pipelines import ETLPipeline
+from ..state import (
+    LastChange,
+    LastModified,
+    Shard,
+    ShardState,
+    State,
+    Storage,
+)
+from ..transform import Document
+
+logger = logging.getLogger(__name__)
+
+type ShardLoader = Callable[..., int]
+
+
+class ShardedLoadCoordinator:
+    etl_pipelines: list[ETLPipeline[Document]]
+    storage: Storage
+    state: State
+    shard_loader: ShardLoader
+    shard_count: int
+    process_count: int
+
+    def __init__(self,
+                 *,
+                 etl_pipelines: list[ETLPipeline[Document]],
+                 storage: Storage,
+                 state: State,
+                 shard_loader: ShardLoader,
+                 shard_count: int,
+                 process_count: int | None = None) -> None:
+        self.etl_pipelines = etl_pipelines
+        self.storage = storage
+        self.state = state
+        self.shard_loader = shard_loader
+        self.shard_count = shard_count
+        self.process_count = process_count or shard_count
+
+    def run(self) -> None:
+        # Only initial loads are sharded, and loads a crash interrupted are resumed shard by shard.
+        etl_pipelines = {
+            etl_pipeline.loader.index_name: etl_pipeline
+            for etl_pipeline in self.etl_pipelines
+            if etl_pipeline.extractor_state.shards or etl_pipeline.loads_from_scratch
+        }
+
+        if not etl_pipelines:
+            return
+
+        last_changes: dict[str, LastChange | None] = {}
+
+        for index_name, etl_pipeline in etl_pipelines.items():
+            # Changes made during the load are captured as well, so they are transferred at least once.
+            last_changes[index_name] = None
+
+            if etl_pipeline.changes_extractor is not None:
+                last_changes[index_name] = etl_pipeline.changes_extractor.get_position()
+
+            if not etl_pipeline.extractor_state.shards:
+                etl_pipeline.extractor_state.shards = [
+                    ShardState(shard=Shard(index=index, count=self.shard_count))
+                    for index in range(self.shard_count)
+                ]
+
+        self.storage.save(self.state)
+        self._load_shards(etl_pipelines=etl_pipelines)
+
+        for index_name, etl_pipeline in etl_pipelines.items():
+            extractor_state = etl_pipeline.extractor_state
+            # A row a shard had passed may be modified while the others still load, and without captured changes
+            # only the earliest checkpoint is sure to be before it. Rows after it are extracted again.
+            extractor_state.last_modified = min(
+                (
+                    shard_state.last_modified
+                    for shard_state in extractor_state.shards
+                    if shard_state.last_modified.modified is not None
+                ),
+                key=lambda last_modified: (last_modified.modified, last_modified.id),
+                default=LastModified(),
+            )
+            extractor_state.shards = []
+
+            if (last_change := last_changes[index_name]) is not None:
+                extractor_state.last_change = last_change
+
+        self.storage.save(self.state)
+
+    def _load_shards(self, *, etl_pipelines: dict[str, ETLPipeline[Document]]) -> None:
+        mp_context = multiprocessing.get_context('spawn')
+        started_at = time.perf_counter()
+        documents = 0
+
+        with (
+            mp_context.Manager() as manager,
+            ProcessPoolExecutor(max_workers=self.process_count, mp_context=mp_context) as executor,
+        ):
+            progress_queue = manager.Queue()
+            stop_event = manager.Event()
+            futures: dict[Future[int], tuple[str, ShardState]] = {}
+
+            for index_name, etl_pipeline in etl_pipelines.items():
+                for shard_state in etl_pipeline.extractor_state.shards:
+                    if shard_state.done:
+                        continue
+
+                    future = executor.submit(
+                        self.shard_loader,
+                        index_name=index_name,
+                        shard=shard_state.shard,
+                        last_modified=shard_state.last_modified,
+                        progress_queue=progress_queue,
+                        stop_event=stop_event,
+                    )
+                    futures[future] = index_name, shard_state
+
+            pending = set(futures)
+
+            try:
+                while pending:
+                    done, pending = wait(pending, timeout=1.0, return_when=FIRST_EXCEPTION)
+                    self._apply_progress(etl_pipelines=etl_pipelines, progress_queue=progress_queue)
+
+                    # Progress is drained first, a finished shard has reported all of its batches by now.
+                    for future in done:
+                        index_name, shard_state = futures[future]
+                        shard_documents = future.result()
+                        shard_state.done = True
+                        documents += shard_documents
+
+                        logger.info(
+                            '%s shard %d/%d: %d documents loaded',
+                            index_name,
+                            shard_state.shard.index + 1,
+                            shard_state.shard.count,
+                            shard_documents,
+                        )
+
+                    self.storage.save(self.state)
+
+            except BaseException:
+                # Running shards stop after their current batch, their progress is kept for the next run.
+                stop_event.set()
+                executor.shutdown(wait=True, cancel_futures=True)
+                self._apply_progress(etl_pipelines=etl_pipelines, progress_queue=progress_queue)
+                self.storage.save(self.state)
+                raise
+
+        seconds = time.perf_counter() - started_at
+        logger.info(
+            'Sharded load: %d documents in %.2fs (%.1f documents/s)',
+            documents,
+            seconds,
+            documents / seconds if seconds else 0.0,
+        )
+
+    def _apply_progress(self,
+                        *,
+                        etl_pipelines: dict[str, ETLPipeline[Document]],
+                        progress_queue: queue.Queue[tuple[str, int, LastModified]]) -> None:
+        while True:
+            try:
+                index_name, shard_index, last_modified = progress_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            etl_pipelines[index_name].extractor_state.shards[shard_index].last_modified = last_modified
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Literal
+
 from dotenv import load_dotenv
 from pydantic_settings import (
     BaseSettings,
@@ -36,14 +39,62 @@ class ElasticsearchSettings(BaseSettings):
     host: str | None = 'localhost'
     port: int | None = 9200
 
+    bulk_mode: Literal['bulk', 'streaming', 'parallel'] = 'bulk'
+    bulk_chunk_size: int = 500
+    bulk_max_chunk_bytes: int = 100 * 1024 * 1024
+    bulk_thread_count: int = 4
+    bulk_max_retries: int = 3
+    bulk_initial_backoff: float = 2.0
+    reindex_profile: bool = True
+
     @property
     def url(self) -> str:
         return f'{self.scheme}://{self.host}:{self.port}'
 
 
+class RedisSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='redis_')
+
+    host: str | None = 'localhost'
+    port: int | None = 6379
+
+    publish_changes: bool = True
+    changes_stream: str = 'search:changes'
+    changes_stream_max_length: int = 10_000
+    versions_key: str = 'search:versions'
+
+
+class ETLSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='etl_')
+
+    runner: Literal['sequential', 'concurrent'] = 'concurrent'
+    queue_size: int = 4
+    extract_mode: Literal['batch', 'stream'] = 'stream'
+    batch_size: int = 100
+    shards: int = 1
+    shard_processes: int | None = None
+    transform_mode: Literal['models', 'sources'] = 'sources'
+    validate_every: int = 100
+
+    capture_changes: bool = True
+    changes_batch_size: int = 1000
+    poll_interval: float = 10.0
+
+    reindex_grace_period: float = 30.0
+
+    hash_documents: bool = True
+
+    data_dir: Path | None = None
+    state_storage: Literal['json', 'sqlite'] = 'sqlite'
+    state_save_interval: float = 1.0
+    lag_interval: float = 60.0
+
+
 class Settings(BaseSettings):
+    etl: ETLSettings = ETLSettings()
     postgresql: PostgreSQLSettings = PostgreSQLSettings()  # type: ignore[call-arg]
     elasticsearch: ElasticsearchSettings = ElasticsearchSettings()
+    redis: RedisSettings = RedisSettings()
 
 
 settings = Settings()
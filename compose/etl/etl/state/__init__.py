@@ -2,8 +2,16 @@ from .state import (
     State,
     ExtractorState,
     LastModified,
+    LastChange,
+    Shard,
+    ShardState,
 )
 from .storage import (
     Storage,
     JsonFileStorage,
+    SQLiteStorage,
+)
+from .hashes import (
+    DocumentHashStore,
+    SQLiteDocumentHashStore,
 )
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+
+
+class DocumentHashStore:
+    def get_many(self, *, index_name: str, ids: list[str]) -> dict[str, bytes]:
+        raise NotImplementedError
+
+    def set_many(self, *, index_name: str, hashes: dict[str, bytes]) -> None:
+        raise NotImplementedError
+
+    def clear(self, *, index_name: str) -> None:
+        raise NotImplementedError
+
+
+class SQLiteDocumentHashStore(DocumentHashStore):
+    file_path: str
+    connection: sqlite3.Connection
+    lock: threading.Lock
+
+    def __init__(self, *, file_path: os.PathLike[str] | str, busy_timeout: float = 60.0) -> None:
+        self.file_path = str(file_path)
+        # The shard processes write to the same file, a writer waits for the others to commit.
+        self.connection = sqlite3.connect(self.file_path, timeout=busy_timeout, check_same_thread=False)
+        self.lock = threading.Lock()
+
+        with self.lock:
+            self.connection.execute('PRAGMA journal_mode = WAL')
+            self.connection.execute('PRAGMA synchronous = NORMAL')
+            self.connection.execute('''
+                CREATE TABLE IF NOT EXISTS document_hashes (
+                    index_name TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    hash BLOB NOT NULL,
+                    PRIMARY KEY (index_name, id)
+                ) WITHOUT ROWID
+            ''')
+
+    def get_many(self, *, index_name: str, ids: list[str]) -> dict[str, bytes]:
+        hashes: dict[str, bytes] = {}
+
+        with self.lock:
+            # SQLite limits the number of bound parameters, ids are looked up in chunks.
+            for offset in range(0, len(ids), 500):
+                chunk = ids[offset:offset + 500]
+                rows = self.connection.execute(
+                    f'''
+                        SELECT id, hash
+                        FROM document_hashes
+                        WHERE index_name = ? AND id IN ({', '.join('?' * len(chunk))})
+                    ''',
+                    [index_name, *chunk],
+                )
+                hashes.update(rows)
+
+        return hashes
+
+    def set_many(self, *, index_name: str, hashes: dict[str, bytes]) -> None:
+        with self.lock, self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO document_hashes (index_name, id, hash) VALUES (?, ?, ?)',
+                [(index_name, id, hash) for id, hash in hashes.items()],
+            )
+
+    def clear(self, *, index_name: str) -> None:
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM document_hashes WHERE index_name = ?', [index_name])
+
+    def close(self) -> None:
+        self.connection.close()
@@ -26,6 +26,21 @@ class ExtractorsState(StateModel):
 
 class ExtractorState(StateModel):
     last_modified: LastModified = Field(default_factory=lambda: LastModified())
+    last_change: LastChange = Field(default_factory=lambda: LastChange())
+    shards: list[ShardState] = Field(default_factory=list)
+
+
+class ShardState(StateModel):
+    shard: Shard
+    last_modified: LastModified = Field(default_factory=lambda: LastModified())
+    done: bool = Field(default=False)
+
+
+class Shard(StateModel):
+    model_config = ConfigDict(frozen=True)
+
+    index: int
+    count: int
 
 
 class LastModified(StateModel):
@@ -33,3 +48,10 @@ class LastModified(StateModel):
 
     modified: datetime.datetime | None = Field(default=None)
     id: uuid.UUID | None = Field(default=None)
+
+
+class LastChange(StateModel):
+    model_config = ConfigDict(frozen=True)
+
+    transaction_id: int | None = Field(default=None)
+    id: int | None = Field(default=None)
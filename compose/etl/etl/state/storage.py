@@ -1,8 +1,16 @@
 from __future__ import annotations
 
 import os
+import sqlite3
+import tempfile
+import threading
+import time
 
-from .state import State
+from .state import (
+    State,
+    ExtractorsState,
+    ExtractorState,
+)
 
 
 class Storage:
@@ -12,6 +20,15 @@ class Storage:
     def save(self, state: State) -> None:
         raise NotImplementedError
 
+    def flush(self) -> None:
+        pass
+
+    def get_checkpoint_times(self) -> dict[str, float]:
+        return {}
+
+    def close(self) -> None:
+        self.flush()
+
 
 class JsonFileStorage(Storage):
     file_path: str
@@ -33,6 +50,103 @@ class JsonFileStorage(Storage):
 
     def save(self, state: State) -> None:
         state_json = state.model_dump_json(indent=2)
+        dir_path = os.path.dirname(self.file_path) or '.'
 
-        with open(self.file_path, 'wb') as state_file:
+        # The state is written next to the old one and renamed over it, a crash never leaves a partial file.
+        with tempfile.NamedTemporaryFile('wb', dir=dir_path, prefix='.state-', delete=False) as state_file:
             state_file.write(state_json.encode())
+            state_file.flush()
+            os.fsync(state_file.fileno())
+
+        os.replace(state_file.name, self.file_path)
+
+
+class SQLiteStorage(Storage):
+    file_path: str
+    save_interval: float
+    connection: sqlite3.Connection
+    lock: threading.Lock
+
+    saved_states: dict[str, str]
+    pending_state: State | None
+    saved_at: float
+
+    def __init__(self, *, file_path: os.PathLike[str] | str, save_interval: float = 0.0) -> None:
+        self.file_path = str(file_path)
+        self.save_interval = save_interval
+        self.connection = sqlite3.connect(self.file_path, check_same_thread=False)
+        self.lock = threading.Lock()
+
+        self.saved_states = {}
+        self.pending_state = None
+        self.saved_at = 0.0
+
+        # In WAL mode with synchronous=NORMAL commits are atomic but only fsynced at WAL checkpoints.
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.execute('PRAGMA synchronous = NORMAL')
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                name TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                saved_at REAL NOT NULL
+            )
+        ''')
+
+    def is_empty(self) -> bool:
+        with self.lock:
+            return self.connection.execute('SELECT count(*) FROM checkpoints').fetchone()[0] == 0
+
+    def load(self) -> State:
+        with self.lock:
+            rows = self.connection.execute('SELECT name, state FROM checkpoints').fetchall()
+
+        extractors = {
+            name: ExtractorState.model_validate_json(state_json)
+            for name, state_json in rows
+            if name in ExtractorsState.model_fields
+        }
+        self.saved_states = dict(rows)
+
+        return State(extractors=ExtractorsState(**extractors))
+
+    def save(self, state: State) -> None:
+        with self.lock:
+            self.pending_state = state
+
+            # Checkpoints are only written once per save interval, the latest pending one is written by flush().
+            if time.monotonic() - self.saved_at >= self.save_interval:
+                self._write()
+
+    def flush(self) -> None:
+        with self.lock:
+            self._write()
+
+    def get_checkpoint_times(self) -> dict[str, float]:
+        with self.lock:
+            return dict(self.connection.execute('SELECT name, saved_at FROM checkpoints'))
+
+    def close(self) -> None:
+        self.flush()
+        self.connection.close()
+
+    def _write(self) -> None:
+        if self.pending_state is None:
+            return
+
+        now = time.time()
+        changed_states = {
+            name: state_json
+            for name, extractor_state in self.pending_state.extractors
+            if self.saved_states.get(name) != (state_json := extractor_state.model_dump_json())
+        }
+
+        # Every pipeline checkpoint is its own row, all rows changed since the last save are replaced together.
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO checkpoints (name, state, saved_at) VALUES (?, ?, ?)',
+                [(name, state_json, now) for name, state_json in changed_states.items()],
+            )
+
+        self.saved_states.update(changed_states)
+        self.pending_state = None
+        self.saved_at = time.monotonic()
@@ -17,3 +17,12 @@ from .transformers import (
     PersonsTransformer,
     PersonsTransformResult,
 )
+from .filters import DocumentsHashFilter
+from .sources import (
+    DocumentSource,
+    DocumentSourcesResult,
+    DocumentSourcesBuilder,
+    FilmSourcesBuilder,
+    GenreSourcesBuilder,
+    PersonSourcesBuilder,
+)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import hashlib
+
+from .models import Document
+from ..state import DocumentHashStore
+
+
+class DocumentsHashFilter[TDocument: Document]:
+    store: DocumentHashStore
+    index_name: str
+
+    sent: int
+    skipped: int
+
+    def __init__(self, *, store: DocumentHashStore, index_name: str) -> None:
+        self.store = store
+        self.index_name = index_name
+
+        self.sent = 0
+        self.skipped = 0
+
+    @staticmethod
+    def hash_document(document: Document) -> bytes:
+        return hashlib.blake2b(document.get_source_json(), digest_size=16).digest()
+
+    def filter(self, documents: list[TDocument]) -> list[TDocument]:
+        stored_hashes = self.store.get_many(
+            index_name=self.index_name,
+            ids=[str(document.id) for document in documents],
+        )
+        changed_documents = [
+            document for document in documents
+            if stored_hashes.get(str(document.id)) != self.hash_document(document)
+        ]
+
+        self.sent += len(changed_documents)
+        self.skipped += len(documents) - len(changed_documents)
+
+        return changed_documents
+
+    def commit(self, documents: list[TDocument]) -> None:
+        self.store.set_many(
+            index_name=self.index_name,
+            hashes={str(document.id): self.hash_document(document) for document in documents},
+        )
+
+    def clear(self) -> None:
+        self.store.clear(index_name=self.index_name)
+
+    def pop_counters(self) -> tuple[int, int]:
+        counters = self.sent, self.skipped
+        self.sent = self.skipped = 0
+
+        return counters
@@ -8,6 +8,12 @@ from pydantic import BaseModel
 class Document(BaseModel):
     id: uuid.UUID
 
+    def get_source(self) -> dict:
+        return self.model_dump(mode='json')
+
+    def get_source_json(self) -> bytes:
+        return self.model_dump_json().encode()
+
 
 class DocumentRelation(BaseModel):
     id: uuid.UUID
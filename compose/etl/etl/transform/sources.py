@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import ClassVar
+
+import pydantic_core
+
+from .models import (
+    Document,
+    Film,
+    Genre,
+    Person,
+)
+from ..state import LastModified
+
+
+class DocumentSource(Document):
+    source: dict
+
+    def get_source(self) -> dict:
+        return self.source
+
+    def get_source_json(self) -> bytes:
+        # Serialized like model_dump_json(), so hashes of both transform paths match.
+        return pydantic_core.to_json(self.source)
+
+
+@dataclasses.dataclass(kw_only=True)
+class DocumentSourcesResult:
+    sources: list[DocumentSource] = dataclasses.field(default_factory=list)
+    last_modified: LastModified = dataclasses.field(default_factory=lambda: LastModified())
+
+
+class DocumentSourcesBuilder:
+    document_class: ClassVar[type[Document]]
+
+    validate_every: int
+    built: int
+
+    def __init__(self, *, validate_every: int = 100) -> None:
+        self.validate_every = validate_every
+        self.built = 0
+
+    def build(self, *, documents_data: list[dict]) -> DocumentSourcesResult:
+        result = DocumentSourcesResult()
+
+        for document_data in documents_data:
+            source = self.build_source(document_data)
+
+            # Sources skip pydantic, a sample of them is still checked against the document model.
+            if self.validate_every and self.built % self.validate_every == 0:
+                self.document_class.model_validate(source)
+
+            self.built += 1
+            result.sources.append(DocumentSource.model_construct(id=document_data['id'], source=source))
+
+        if documents_data:
+            last_document_data = documents_data[-1]
+            result.last_modified = LastModified(
+                modified=last_document_data['modified'],
+                id=last_document_data['id'],
+            )
+
+        return result
+
+    def build_source(self, document_data: dict) -> dict:
+        raise NotImplementedError
+
+
+class FilmSourcesBuilder(DocumentSourcesBuilder):
+    document_class = Film
+
+    def build_source(self, document_data: dict) -> dict:
+        # Nested rows come from jsonb, their ids are already strings.
+        genres = [{'id': genre['id'], 'name': genre['name']} for genre in document_data['genres']]
+        persons: dict[str, list[dict]] = {'director': [], 'actor': [], 'writer': []}
+
+        for person in document_data['persons']:
+            if (role_persons := persons.get(person['role'])) is not None:
+                role_persons.append({'id': person['id'], 'full_name': person['full_name']})
+
+        return {
+            'id': str(document_data['id']),
+            'title': document_data['title'],
+            'description': document_data['description'],
+            'rating': document_data['rating'],
+            'genres_names': [genre['name'] for genre in genres],
+            'directors_names': [person['full_name'] for person in persons['director']],
+            'actors_names': [person['full_name'] for person in persons['actor']],
+            'writers_names': [person['full_name'] for person in persons['writer']],
+            'genres': genres,
+            'directors': persons['director'],
+            'actors': persons['actor'],
+            'writers': persons['writer'],
+        }
+
+
+class GenreSourcesBuilder(DocumentSourcesBuilder):
+    document_class = Genre
+
+    def build_source(self, document_data: dict) -> dict:
+        return {
+            'id': str(document_data['id']),
+            'name': document_data['name'],
+        }
+
+
+class PersonSourcesBuilder(DocumentSourcesBuilder):
+    document_class = Person
+
+    def build_source(self, document_data: dict) -> dict:
+        films: dict[str, list[str]] = {}
+
+        for film_work in document_data['film_works']:
+            films.setdefault(film_work['id'], []).append(film_work['role'])
+
+        return {
+            'id': str(document_data['id']),
+            'full_name': document_data['full_name'],
+            'films': [{'id': film_id, 'roles': roles} for film_id, roles in films.items()],
+        }
@@ -0,0 +1,65 @@
+CREATE TABLE IF NOT EXISTS content.changes (
+    id bigint GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    transaction_id bigint NOT NULL DEFAULT pg_current_xact_id()::text::bigint,
+    entity text NOT NULL,
+    entity_id uuid NOT NULL,
+    cascade boolean NOT NULL,
+    created timestamp with time zone NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS changes_transaction_idx ON content.changes USING btree (transaction_id, id);
+
+CREATE INDEX IF NOT EXISTS genre_film_work_genre_idx ON content.genre_film_work USING btree (genre_id);
+
+CREATE INDEX IF NOT EXISTS person_film_work_person_idx ON content.person_film_work USING btree (person_id);
+
+CREATE OR REPLACE FUNCTION content.capture_change() RETURNS trigger AS $$
+DECLARE
+    changed_row record;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed_row := OLD;
+    ELSE
+        changed_row := NEW;
+    END IF;
+
+    IF TG_TABLE_NAME IN ('film_work', 'genre', 'person') THEN
+        INSERT INTO content.changes (entity, entity_id, cascade)
+        VALUES (TG_TABLE_NAME, changed_row.id, true);
+    END IF;
+
+    IF TG_TABLE_NAME IN ('genre_film_work', 'person_film_work') THEN
+        INSERT INTO content.changes (entity, entity_id, cascade)
+        VALUES ('film_work', changed_row.film_work_id, false);
+    END IF;
+
+    IF TG_TABLE_NAME = 'person_film_work' THEN
+        INSERT INTO content.changes (entity, entity_id, cascade)
+        VALUES ('person', changed_row.person_id, false);
+    END IF;
+
+    PERFORM pg_notify('content_changes', '');
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER film_work_capture_change
+    AFTER INSERT OR UPDATE OR DELETE ON content.film_work
+    FOR EACH ROW EXECUTE FUNCTION content.capture_change();
+
+CREATE OR REPLACE TRIGGER genre_capture_change
+    AFTER INSERT OR UPDATE OR DELETE ON content.genre
+    FOR EACH ROW EXECUTE FUNCTION content.capture_change();
+
+CREATE OR REPLACE TRIGGER person_capture_change
+    AFTER INSERT OR UPDATE OR DELETE ON content.person
+    FOR EACH ROW EXECUTE FUNCTION content.capture_change();
+
+CREATE OR REPLACE TRIGGER genre_film_work_capture_change
+    AFTER INSERT OR UPDATE OR DELETE ON content.genre_film_work
+    FOR EACH ROW EXECUTE FUNCTION content.capture_change();
+
+CREATE OR REPLACE TRIGGER person_film_work_capture_change
+    AFTER INSERT OR UPDATE OR DELETE ON content.person_film_work
+    FOR EACH ROW EXECUTE FUNCTION content.capture_change();
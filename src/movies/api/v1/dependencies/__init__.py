@@ -1,3 +1,8 @@
+from .cursor import (
+    NEXT_CURSOR_HEADER,
+    Cursor,
+    CursorDep,
+)
 from .page import (
     Page,
     PageDep,
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import (
+    Depends,
+    HTTPException,
+)
+
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+class Cursor:
+    token: str | None
+    snapshot: bool
+
+    def __init__(self, *, cursor: str | None = None, snapshot: bool = False) -> None:
+        self.token = cursor or None
+        self.snapshot = snapshot
+
+    @property
+    def is_requested(self) -> bool:
+        return self.token is not None or self.snapshot
+
+    def load(self, *, scope: dict) -> dict | None:
+        if self.token is None:
+            return None
+
+        try:
+            data = json.loads(base64.urlsafe_b64decode(self.token + '=' * (-len(self.token) % 4)))
+        except ValueError:
+            raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='Invalid cursor')
+
+        if not isinstance(data, dict) or data.get('scope') != self._create_scope_hash(scope):
+            raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='Invalid cursor')
+
+        state = data.get('state')
+
+        if (
+                not isinstance(state, dict)
+                or not isinstance(state.get('search_after'), list)
+                or not isinstance(state.get('pit_id', ''), str)
+        ):
+            raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='Invalid cursor')
+
+        return state
+
+    def dump(self, *, scope: dict, state: dict) -> str:
+        data = json.dumps(
+            {'scope': self._create_scope_hash(scope), 'state': state},
+            separators=(',', ':'),
+        )
+
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def _create_scope_hash(scope: dict) -> str:
+        data = json.dumps(scope, sort_keys=True, default=str)
+
+        return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+CursorDep = Annotated[Cursor, Depends()]
@@ -11,10 +11,21 @@ from fastapi import (
     HTTPException,
 )
 
-from ..dependencies import PageDep
-from ..models.films import FilmInfo, Film
+from ..dependencies import (
+    NEXT_CURSOR_HEADER,
+    CursorDep,
+    PageDep,
+)
+from ..models.batch import Batch
+from ..models.films import FILM_FIELDS, FilmInfo, Film
+from ..responses import ModelResponse
+from .... import models
 from ....services import FilmServiceDep
 from ....services.auth import AuthUserDep
+from ....services.search import (
+    CursorExpiredError,
+    InvalidCursorError,
+)
 
 router = APIRouter()
 
@@ -30,7 +41,10 @@ class SortOrderEnum(str, Enum):
     summary='Get list of films',
     description=(
             'Get list of films with sorting, pagination and filter by concrete genre. '
-            'The maximum count of films on one page are 150.'
+            'The maximum count of films on one page are 150. '
+            f'The first page returns an opaque cursor in the {NEXT_CURSOR_HEADER} header, '
+            'pass it as the cursor parameter to get the next page instead of the page number. '
+            'Set snapshot to get all pages from a point in time view of the catalog.'
     )
 )
 async def get_list(
@@ -38,9 +52,10 @@ async def get_list(
         sort: str = '',
         genre: uuid.UUID | None = None,
         page: PageDep,
+        cursor: CursorDep,
         film_service: FilmServiceDep,
         _user: AuthUserDep,
-) -> list[Film]:
+) -> ModelResponse:
     sort_by = {}
     if sort:
         is_first_dash = sort[0] == '-'
@@ -54,16 +69,55 @@ async def get_list(
     if not sort_by:
         sort_by = {'field': 'id', 'order': SortOrderEnum.asc}
 
-    film_list = await film_service.get_list(
-        sort=sort_by,
-        genre_uuid=genre,
-        page_number=page.number,
-        page_size=page.size
+    headers = {}
+
+    if cursor.is_requested or page.number == 1:
+        cursor_scope = {'sort': sort_by, 'genre': genre}
+
+        try:
+            film_list, next_cursor = await film_service.get_list_cursor(
+                sort=sort_by,
+                genre_uuid=genre,
+                page_size=page.size,
+                cursor=cursor.load(scope=cursor_scope),
+                snapshot=cursor.snapshot,
+            )
+        except CursorExpiredError:
+            raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='Cursor expired')
+        except InvalidCursorError:
+            raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='Invalid cursor')
+
+        if next_cursor is not None:
+            headers[NEXT_CURSOR_HEADER] = cursor.dump(scope=cursor_scope, state=next_cursor)
+    else:
+        film_list = await film_service.get_list(
+            sort=sort_by,
+            genre_uuid=genre,
+            page_number=page.number,
+            page_size=page.size
+        )
+
+    return ModelResponse(film_list, include={'__all__': FILM_FIELDS}, headers=headers)
+
+
+@router.post(
+    '/batch',
+    response_model=list[FilmInfo],
+    summary='Get films by list of uuids',
+    description=(
+            'Get concrete films by list of uuids in one request. '
+            'Films that are not found are skipped. The maximum count of uuids is 100.'
     )
-    if not film_list:
-        return []
+)
+async def get_by_ids(
+        *,
+        batch: Batch,
+        film_service: FilmServiceDep,
+        _user: AuthUserDep,
+) -> ModelResponse:
+    film_list = await film_service.get_by_ids(list(dict.fromkeys(batch.ids)))
 
-    return [Film(**item.model_dump(by_alias=True)) for item in film_list]
+    return ModelResponse(film_list)
 
 
 @router.get(
@@ -77,32 +131,60 @@ async def get_by_id(
         film_uuid: Annotated[uuid.UUID, Path(alias='uuid')],
         film_service: FilmServiceDep,
         _user: AuthUserDep,
-) -> FilmInfo:
+) -> ModelResponse:
     film = await film_service.get_by_id(film_uuid)
     if not film:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail='Film not found')
 
-    return FilmInfo(**film.model_dump(by_alias=True))
+    return ModelResponse(film)
 
 
 @router.get(
     '/search/',
     response_model=list[Film],
     summary='Search film by query',
-    description='Search film by title with pagination. The maximum count of films on one page are 150.'
+    description=(
+            'Search film by title with pagination. The maximum count of films on one page are 150. '
+            f'The first page returns an opaque cursor in the {NEXT_CURSOR_HEADER} header, '
+            'pass it as the cursor parameter to get the next page instead of the page number. '
+            'Set snapshot to get all pages from a point in time view of the catalog.'
+    )
 )
 async def search(
         *,
         query: str = '',
         page: PageDep,
+        cursor: CursorDep,
         film_service: FilmServiceDep,
         _user: AuthUserDep,
-) -> list[Film]:
+) -> ModelResponse:
     if not query:
-        return []
-
-    film_list = await film_service.search(query=query, page_number=page.number, page_size=page.size)
-    if not film_list:
-        return []
-
-    return [Film(**item.model_dump(by_alias=True)) for item in film_list]
+        return ModelResponse([])
+
+    headers = {}
+    film_list: list[models.Film] | None
+
+    if cursor.is_requested or page.number == 1:
+        cursor_scope = {'query': query}
+
+        try:
+            film_list, next_cursor = await film_service.search_cursor(
+                query=query,
+                page_size=page.size,
+                cursor=cursor.load(scope=cursor_scope),
+                snapshot=cursor.snapshot,
+            )
+        except CursorExpiredError:
+            raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='Cursor expired')
+        except InvalidCursorError:
+            raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='Invalid cursor')
+
+        if next_cursor is not None:
+            headers[NEXT_CURSOR_HEADER] = cursor.dump(scope=cursor_scope, state=next_cursor)
+    else:
+        film_list = await film_service.search(query=query, page_number=page.number, page_size=page.size)
+
+    if film_list is None:
+        return ModelResponse([], headers=headers)
+
+    return ModelResponse(film_list, include={'__all__': FILM_FIELDS}, headers=headers)
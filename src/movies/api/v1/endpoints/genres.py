@@ -12,6 +12,7 @@ from fastapi import (
 
 from ..dependencies import PageDep
 from ..models.genres import Genre
+from ..responses import ModelResponse
 from ....services import GenreServiceDep
 from ....services.auth import AuthUserDep
 
@@ -29,15 +30,13 @@ async def get_list(
         page: PageDep,
         genre_service: GenreServiceDep,
         _user: AuthUserDep,
-) -> list[Genre]:
+) -> ModelResponse:
     genre_list = await genre_service.get_list(
         page_number=page.number,
         page_size=page.size
     )
-    if not genre_list:
-        return []
 
-    return [Genre(**item.model_dump(by_alias=True)) for item in genre_list]
+    return ModelResponse(genre_list)
 
 
 @router.get(
@@ -51,9 +50,9 @@ async def get_by_id(
         genre_uuid: Annotated[uuid.UUID, Path(alias='uuid')],
         genre_service: GenreServiceDep,
         _user: AuthUserDep,
-) -> Genre:
+) -> ModelResponse:
     genre = await genre_service.get_by_id(genre_uuid)
     if not genre:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail='Genre not found')
 
-    return Genre(**genre.model_dump(by_alias=True))
+    return ModelResponse(genre)
@@ -11,7 +11,10 @@ from fastapi import (
 )
 
 from ..dependencies import PageDep
+from ..models.batch import Batch
+from ..models.films import FILM_FIELDS
 from ..models.persons import Person, PersonFilm
+from ..responses import ModelResponse
 from ....services import (
     PersonServiceDep,
     FilmServiceDep,
@@ -21,6 +24,26 @@ from ....services.auth import AuthUserDep
 router = APIRouter()
 
 
+@router.post(
+    '/batch',
+    response_model=list[Person],
+    summary='Get persons by list of uuids',
+    description=(
+            'Get concrete persons with list of films and roles by list of uuids in one request. '
+            'Persons that are not found are skipped. The maximum count of uuids is 100.'
+    ),
+)
+async def get_by_ids(
+        *,
+        batch: Batch,
+        person_service: PersonServiceDep,
+        _user: AuthUserDep,
+) -> ModelResponse:
+    person_list = await person_service.get_by_ids(list(dict.fromkeys(batch.ids)))
+
+    return ModelResponse(person_list)
+
+
 @router.get(
     '/{uuid}',
     response_model=Person,
@@ -32,12 +55,12 @@ async def get_by_id(
         person_uuid: Annotated[uuid.UUID, Path(alias='uuid')],
         person_service: PersonServiceDep,
         _user: AuthUserDep,
-) -> Person:
+) -> ModelResponse:
     person = await person_service.get_by_id(person_uuid)
     if not person:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail='Person not found')
 
-    return Person(**person.model_dump(by_alias=True))
+    return ModelResponse(person)
 
 
 @router.get(
@@ -51,12 +74,10 @@ async def get_by_id_with_films(
         person_uuid: Annotated[uuid.UUID, Path(alias='uuid')],
         film_service: FilmServiceDep,
         _user: AuthUserDep,
-) -> list[PersonFilm]:
+) -> ModelResponse:
     films_person = await film_service.get_list_by_person(person_uuid)
-    if not films_person:
-        return []
 
-    return [PersonFilm(**item.model_dump(by_alias=True)) for item in films_person]
+    return ModelResponse(films_person, include={'__all__': FILM_FIELDS})
 
 
 @router.get(
@@ -74,9 +95,7 @@ async def search(
         page: PageDep,
         person_service: PersonServiceDep,
         _user: AuthUserDep,
-) -> list[Person]:
+) -> ModelResponse:
     person_list = await person_service.search(query=query, page_number=page.number, page_size=page.size)
-    if not person_list:
-        return []
 
-    return [Person(**item.model_dump(by_alias=True)) for item in person_list]
+    return ModelResponse(person_list or [])
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+import uuid
+
+from pydantic import BaseModel, Field
+
+
+class Batch(BaseModel):
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=100)
@@ -5,6 +5,9 @@ import uuid
 from pydantic import BaseModel
 
 
+FILM_FIELDS = {'id', 'title', 'rating'}
+
+
 class PersonMixin:
     uuid: uuid.UUID
     full_name: str
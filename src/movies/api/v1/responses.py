@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import Any
+
+import pydantic_core
+from fastapi import Response
+from pydantic.main import IncEx
+
+
+class ModelResponse(Response):
+    media_type = 'application/json'
+
+    include: IncEx | None
+
+    def __init__(self,
+                 content: Any,
+                 *,
+                 include: IncEx | None = None,
+                 status_code: int = HTTPStatus.OK,
+                 headers: dict[str, str] | None = None) -> None:
+        self.include = include
+        super().__init__(content, status_code=status_code, headers=headers)
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content, include=self.include, by_alias=True)
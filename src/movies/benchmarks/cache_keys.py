@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import timeit
+import uuid
+
+from ..services.cache import (
+    Parameterizable,
+    ParameterizedCache,
+)
+from ..services.search.backends.elasticsearch.query import ElasticsearchQueryFactory
+
+KEY_DERIVATIONS_PER_MISS = 3
+
+
+def create_legacy_cache_key(params: Parameterizable) -> str:
+    key_json = json.dumps({'params': params.get_cache_params()}, sort_keys=True)
+    key_hash = hashlib.sha256(key_json.encode()).hexdigest()
+
+    return f'{params.get_cache_prefix()}-{key_hash}'
+
+
+def create_queries() -> dict[str, Parameterizable]:
+    query_factory = ElasticsearchQueryFactory()
+
+    return {
+        'get_film': query_factory.get_film(film_id=uuid.uuid4()).compile(),
+        'films_list': query_factory.films_list(
+            sort={'field': 'rating', 'order': 'desc'},
+            page_number=3,
+            page_size=50,
+            genre_id=uuid.uuid4(),
+        ).compile(),
+        'films_by_person': query_factory.films_by_person(person_id=uuid.uuid4()).compile(),
+    }
+
+
+def measure(number: int) -> dict[str, dict[str, float]]:
+    cache = ParameterizedCache[Parameterizable, dict](cache=None)  # type: ignore[arg-type]
+    results = {}
+
+    for name, query in create_queries().items():
+        compile_query = type(query)
+        query_fields = vars(query).copy()
+
+        def derive_legacy() -> None:
+            for _ in range(KEY_DERIVATIONS_PER_MISS):
+                create_legacy_cache_key(query)
+
+        def derive_current() -> None:
+            compiled_query = compile_query(**query_fields)
+
+            for _ in range(KEY_DERIVATIONS_PER_MISS):
+                cache.create_cache_key(params=compiled_query)
+
+        legacy = timeit.timeit(derive_legacy, number=number) / number * 1_000_000
+        current = timeit.timeit(derive_current, number=number) / number * 1_000_000
+        results[name] = {
+            'legacy_us': round(legacy, 2),
+            'current_us': round(current, 2),
+            'speedup': round(legacy / current, 1),
+        }
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure cache key derivation cost per cache miss.')
+    parser.add_argument('--number', type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(json.dumps(measure(args.number), indent=2))
+
+
+if __name__ == '__main__':
+    main()
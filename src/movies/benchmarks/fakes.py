@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import random
+import time
+import uuid
+from typing import Any
+
+import elasticsearch
+import httpx
+import jwt
+from elastic_transport import ApiResponseMeta, HttpHeaders, NodeConfig
+
+from ..core import settings
+
+
+async def simulate_latency(latency: float) -> None:
+    if latency > 0:
+        await asyncio.sleep(latency)
+
+
+@dataclasses.dataclass(kw_only=True)
+class Catalog:
+    films: dict[str, dict]
+    genres: dict[str, dict]
+    persons: dict[str, dict]
+
+    def get_index(self, index: str) -> dict[str, dict]:
+        return {
+            settings.elasticsearch.index_name_films: self.films,
+            settings.elasticsearch.index_name_genres: self.genres,
+            settings.elasticsearch.index_name_persons: self.persons,
+        }[index]
+
+
+def create_catalog(*, films_count: int, genres_count: int, persons_count: int, seed: int = 0) -> Catalog:
+    randomizer = random.Random(seed)
+
+    def create_id() -> str:
+        return str(uuid.UUID(int=randomizer.getrandbits(128), version=4))
+
+    genres = {
+        genre_id: {'id': genre_id, 'name': f'Genre {index}'}
+        for index, genre_id in enumerate(create_id() for _ in range(genres_count))
+    }
+    persons: dict[str, dict[str, Any]] = {
+        person_id: {'id': person_id, 'full_name': f'Person {index}', 'films': []}
+        for index, person_id in enumerate(create_id() for _ in range(persons_count))
+    }
+    genre_list = list(genres.values())
+    person_list = list(persons.values())
+    films = {}
+
+    for index in range(films_count):
+        film_id = create_id()
+        roles = {
+            role: randomizer.sample(person_list, k=min(count, len(person_list)))
+            for role, count in (('directors', 1), ('actors', 5), ('writers', 2))
+        }
+        film_genres = randomizer.sample(genre_list, k=min(3, len(genre_list)))
+        films[film_id] = {
+            'id': film_id,
+            'title': f'Film {index} {randomizer.choice(["star", "war", "love", "night", "city"])}',
+            'description': f'Description of film {index}',
+            'rating': round(randomizer.uniform(1.0, 10.0), 1),
+            'genres': film_genres,
+            'genres_names': [genre['name'] for genre in film_genres],
+            **{
+                role: [{'id': person['id'], 'full_name': person['full_name']} for person in people]
+                for role, people in roles.items()
+            },
+        }
+
+        for role, people in roles.items():
+            for person in people:
+                person['films'].append({'id': film_id, 'roles': [role.removesuffix('s')]})
+
+    return Catalog(films=films, genres=genres, persons=persons)
+
+
+class FakeElasticsearch:
+    catalog: Catalog
+    latency: float
+
+    def __init__(self, *, catalog: Catalog, latency: float = 0.0) -> None:
+        self.catalog = catalog
+        self.latency = latency
+
+    async def get(self, *, index: str, id: str) -> dict:
+        await simulate_latency(self.latency)
+        document = self.catalog.get_index(index).get(id)
+
+        if document is None:
+            raise elasticsearch.NotFoundError(
+                message='Not found',
+                meta=ApiResponseMeta(
+                    status=404,
+                    http_version='1.1',
+                    headers=HttpHeaders(),
+                    duration=0.0,
+                    node=NodeConfig(scheme='http', host='localhost', port=9200),
+                ),
+                body={'found': False},
+            )
+
+        return {'_index': index, '_id': id, 'found': True, '_source': document}
+
+    async def mget(self, *, docs: list[dict]) -> dict:
+        await simulate_latency(self.latency)
+        documents = []
+
+        for doc in docs:
+            document = self.catalog.get_index(doc['_index']).get(doc['_id'])
+            documents.append({
+                '_index': doc['_index'],
+                '_id': doc['_id'],
+                'found': document is not None,
+                **({'_source': document} if document is not None else {}),
+            })
+
+        return {'docs': documents}
+
+    async def search(self, *, body: dict, index: str | None = None) -> dict:
+        await simulate_latency(self.latency)
+
+        if index is None:
+            index = body['pit']['id']
+
+        documents = self._filter_documents(self.catalog.get_index(index).values(), body.get('query'))
+        documents = sorted(documents, key=lambda document: document['id'])
+
+        if 'search_after' in body:
+            last_id = body['search_after'][-1]
+            documents = [document for document in documents if document['id'] > last_id]
+
+        offset = body.get('from', 0)
+        size = body.get('size', 10)
+
+        return {
+            'hits': {
+                'hits': [
+                    {'_index': index, '_id': document['id'], '_source': document, 'sort': [document['id']]}
+                    for document in documents[offset:offset + size]
+                ],
+            },
+        }
+
+    async def open_point_in_time(self, *, index: str, keep_alive: str) -> dict:
+        return {'id': index}
+
+    async def close_point_in_time(self, *, id: str) -> dict:
+        return {'succeeded': True}
+
+    async def close(self) -> None:
+        pass
+
+    def _filter_documents(self, documents: Any, query: dict | None) -> list[dict]:
+        if not query:
+            return list(documents)
+
+        if 'match' in query:
+            field, value = next(iter(query['match'].items()))
+            words = value.lower().split()
+
+            return [
+                document for document in documents
+                if any(word in str(document.get(field, '')).lower() for word in words)
+            ]
+
+        query_json = json.dumps(query)
+
+        return [
+            document for document in documents
+            if any(
+                related['id'] in query_json
+                for field in ('genres', 'directors', 'actors', 'writers')
+                for related in document.get(field, ())
+            )
+        ]
+
+
+class FakePipeline:
+    redis: FakeRedis
+    commands: list[tuple[str, tuple, dict]]
+
+    def __init__(self, *, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self) -> FakePipeline:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.commands.clear()
+
+    def set(self, *args: Any, **kwargs: Any) -> FakePipeline:
+        self.commands.append(('set', args, kwargs))
+        return self
+
+    async def execute(self) -> list:
+        await simulate_latency(self.redis.latency)
+
+        return [self.redis.set_value(*args, **kwargs) for _name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    latency: float
+    values: dict[str, tuple[float | None, bytes]]
+    hashes: dict[str, dict[bytes, bytes]]
+
+    def __init__(self, *, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.values = {}
+        self.hashes = {}
+
+    async def get(self, key: str) -> bytes | None:
+        await simulate_latency(self.latency)
+        return self.get_value(key)
+
+    async def set(self, key: str, value: str | bytes, *, ex: int | None = None) -> bool:
+        await simulate_latency(self.latency)
+        return self.set_value(key, value, ex=ex)
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        await simulate_latency(self.latency)
+        return [self.get_value(key) for key in keys]
+
+    async def delete(self, *keys: str) -> int:
+        await simulate_latency(self.latency)
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+    async def hget(self, name: str, key: str) -> bytes | None:
+        return self.hashes.get(name, {}).get(key.encode())
+
+    async def hgetall(self, name: str) -> dict[bytes, bytes]:
+        return dict(self.hashes.get(name, {}))
+
+    async def xrevrange(self, name: str, count: int | None = None) -> list:
+        return []
+
+    async def xread(self, streams: dict, count: int | None = None, block: int | None = None) -> list:
+        await asyncio.sleep((block or 0) / 1000)
+        return []
+
+    def pipeline(self, *, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(redis=self)
+
+    def get_value(self, key: str) -> bytes | None:
+        entry = self.values.get(key)
+
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.values[key]
+            return None
+
+        return value
+
+    def set_value(self, key: str, value: str | bytes, *, ex: int | None = None) -> bool:
+        expires_at = time.monotonic() + ex if ex else None
+        self.values[key] = (expires_at, value.encode() if isinstance(value, str) else value)
+
+        return True
+
+    def flush(self) -> None:
+        self.values.clear()
+
+    async def aclose(self) -> None:
+        pass
+
+
+def create_auth_transport(*, latency: float = 0.0) -> httpx.AsyncBaseTransport:
+    async def handle_request(request: httpx.Request) -> httpx.Response:
+        await simulate_latency(latency)
+        token = request.headers['Authorization'].removeprefix('Bearer ')
+        token_data = jwt.decode(token, options={'verify_signature': False})
+
+        return httpx.Response(200, json={
+            'id': token_data['sub'],
+            'login': 'benchmark',
+            'email': 'benchmark@example.com',
+            'is_superuser': False,
+        })
+
+    return httpx.MockTransport(handle_request)
@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import datetime
+import json
+import logging
+import random
+import statistics
+import subprocess
+import time
+import uuid
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import httpx
+import jwt
+
+from .fakes import (
+    Catalog,
+    FakeElasticsearch,
+    FakeRedis,
+    create_auth_transport,
+    create_catalog,
+)
+from ..core import settings
+from ..main import (
+    app,
+    create_app_state,
+)
+
+
+@dataclasses.dataclass(kw_only=True)
+class BenchmarkConfig:
+    requests: int
+    concurrency: int
+    warm_set_size: int
+    films_count: int
+    genres_count: int
+    persons_count: int
+    elasticsearch_latency: float
+    redis_latency: float
+    auth_latency: float
+    seed: int
+
+
+@dataclasses.dataclass(kw_only=True)
+class PlannedRequest:
+    endpoint: str
+    url: str
+    params: dict[str, str | int] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(kw_only=True)
+class RequestResult:
+    endpoint: str
+    status: int
+    latency: float
+
+
+class BenchmarkApp:
+    config: BenchmarkConfig
+    catalog: Catalog
+    redis_client: FakeRedis
+    elasticsearch_client: FakeElasticsearch
+
+    def __init__(self, *, config: BenchmarkConfig, catalog: Catalog) -> None:
+        self.config = config
+        self.catalog = catalog
+        self.redis_client = FakeRedis(latency=config.redis_latency)
+        self.elasticsearch_client = FakeElasticsearch(catalog=catalog, latency=config.elasticsearch_latency)
+
+    @asynccontextmanager
+    async def run(self) -> AsyncGenerator[httpx.AsyncClient]:
+        async with (
+            httpx.AsyncClient(transport=create_auth_transport(latency=self.config.auth_latency)) as httpx_client,
+            create_app_state(
+                httpx_client=httpx_client,
+                redis_client=self.redis_client,  # type: ignore[arg-type]
+                elasticsearch_client=self.elasticsearch_client,  # type: ignore[arg-type]
+            ) as state,
+        ):
+            async def app_with_state(scope, receive, send) -> None:
+                if scope['type'] == 'http':
+                    scope['state'] = dict(state)
+
+                await app(scope, receive, send)
+
+            # Failed requests are counted as 500 responses instead of aborting the run.
+            transport = httpx.ASGITransport(app=app_with_state, raise_app_exceptions=False)
+
+            async with httpx.AsyncClient(transport=transport, base_url='http://movies') as client:
+                yield client
+
+
+def create_token() -> str:
+    return jwt.encode(
+        {
+            'sub': str(uuid.uuid4()),
+            'jti': str(uuid.uuid4()),
+            'aud': settings.auth.jwt_audience,
+            'exp': int(time.time()) + 60 * 60,
+        },
+        settings.auth.secret_key,
+        algorithm=settings.auth.jwt_algorithm,
+    )
+
+
+def create_request_plan(*, catalog: Catalog, randomizer: random.Random) -> list[PlannedRequest]:
+    api_prefix = '/api/v1'
+    requests = []
+
+    for film_id in catalog.films:
+        requests.append(PlannedRequest(endpoint='film', url=f'{api_prefix}/films/{film_id}'))
+
+    for page_number in range(1, len(catalog.films) // 50 + 1):
+        for sort in ('', '-imdb_rating', 'imdb_rating'):
+            requests.append(PlannedRequest(
+                endpoint='films',
+                url=f'{api_prefix}/films/',
+                params={'sort': sort, 'page_number': page_number, 'page_size': 50},
+            ))
+
+    for genre_id in catalog.genres:
+        requests.append(PlannedRequest(endpoint='genre', url=f'{api_prefix}/genres/{genre_id}'))
+        requests.append(PlannedRequest(
+            endpoint='films',
+            url=f'{api_prefix}/films/',
+            params={'genre': genre_id, 'page_size': 50},
+        ))
+
+    for page_number in range(1, len(catalog.genres) // 10 + 2):
+        requests.append(PlannedRequest(
+            endpoint='genres',
+            url=f'{api_prefix}/genres/',
+            params={'page_number': page_number, 'page_size': 10},
+        ))
+
+    for person_id in catalog.persons:
+        requests.append(PlannedRequest(endpoint='person', url=f'{api_prefix}/persons/{person_id}'))
+        requests.append(PlannedRequest(endpoint='person_films', url=f'{api_prefix}/persons/{person_id}/film/'))
+
+    for index, film in enumerate(catalog.films.values()):
+        requests.append(PlannedRequest(
+            endpoint='films_search',
+            url=f'{api_prefix}/films/search/',
+            params={'query': film['title'].split()[-1], 'page_number': index + 1, 'page_size': 10},
+        ))
+
+    for index, person in enumerate(catalog.persons.values()):
+        requests.append(PlannedRequest(
+            endpoint='persons_search',
+            url=f'{api_prefix}/persons/search/',
+            params={'query': person['full_name'], 'page_number': index % 5 + 1, 'page_size': 10},
+        ))
+
+    randomizer.shuffle(requests)
+
+    return requests
+
+
+async def execute_requests(*,
+                           client: httpx.AsyncClient,
+                           requests: list[PlannedRequest],
+                           concurrency: int,
+                           create_headers: Callable[[], dict[str, str]]) -> tuple[list[RequestResult], float]:
+    queue: asyncio.Queue[PlannedRequest] = asyncio.Queue()
+    results: list[RequestResult] = []
+
+    for request in requests:
+        queue.put_nowait(request)
+
+    async def worker() -> None:
+        while not queue.empty():
+            request = queue.get_nowait()
+            headers = create_headers()
+            started_at = time.perf_counter()
+            response = await client.get(request.url, params=request.params, headers=headers)
+            results.append(RequestResult(
+                endpoint=request.endpoint,
+                status=response.status_code,
+                latency=time.perf_counter() - started_at,
+            ))
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return results, time.perf_counter() - started_at
+
+
+def summarize(results: list[RequestResult], duration: float) -> dict:
+    def describe(latencies: list[float]) -> dict:
+        if len(latencies) < 2:
+            percentiles = latencies * 99 or [0.0] * 99
+        else:
+            percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+
+        return {
+            'requests': len(latencies),
+            'p50_ms': round(percentiles[49] * 1000, 3),
+            'p95_ms': round(percentiles[94] * 1000, 3),
+            'p99_ms': round(percentiles[98] * 1000, 3),
+        }
+
+    endpoints: dict[str, list[float]] = {}
+
+    for result in results:
+        endpoints.setdefault(result.endpoint, []).append(result.latency)
+
+    return {
+        **describe([result.latency for result in results]),
+        'errors': sum(result.status >= 400 for result in results),
+        'duration_s': round(duration, 3),
+        'rps': round(len(results) / duration, 1) if duration else 0.0,
+        'endpoints': {
+            endpoint: describe(latencies)
+            for endpoint, latencies in sorted(endpoints.items())
+        },
+    }
+
+
+async def run_cold_cache(*, config: BenchmarkConfig, catalog: Catalog, plan: list[PlannedRequest]) -> dict:
+    token = create_token()
+
+    async with BenchmarkApp(config=config, catalog=catalog).run() as client:
+        results, duration = await execute_requests(
+            client=client,
+            requests=plan[:config.requests],
+            concurrency=config.concurrency,
+            create_headers=lambda: {'Authorization': f'Bearer {token}'},
+        )
+
+    return summarize(results, duration)
+
+
+async def run_warm_cache(*,
+                         config: BenchmarkConfig,
+                         catalog: Catalog,
+                         plan: list[PlannedRequest],
+                         randomizer: random.Random,
+                         create_headers: Callable[[], dict[str, str]] | None = None) -> dict:
+    token = create_token()
+    warm_set = plan[:config.warm_set_size]
+    requests = [randomizer.choice(warm_set) for _ in range(config.requests)]
+
+    async with BenchmarkApp(config=config, catalog=catalog).run() as client:
+        await execute_requests(
+            client=client,
+            requests=warm_set,
+            concurrency=config.concurrency,
+            create_headers=lambda: {'Authorization': f'Bearer {token}'},
+        )
+        results, duration = await execute_requests(
+            client=client,
+            requests=requests,
+            concurrency=config.concurrency,
+            create_headers=create_headers or (lambda: {'Authorization': f'Bearer {token}'}),
+        )
+
+    return summarize(results, duration)
+
+
+async def run_benchmark(config: BenchmarkConfig) -> dict:
+    settings.cache.invalidation_enabled = False
+
+    if settings.auth.secret_key is None:
+        settings.auth.secret_key = 'benchmark'
+
+    catalog = create_catalog(
+        films_count=config.films_count,
+        genres_count=config.genres_count,
+        persons_count=config.persons_count,
+        seed=config.seed,
+    )
+    randomizer = random.Random(config.seed)
+    plan = create_request_plan(catalog=catalog, randomizer=randomizer)
+
+    return {
+        'cold_cache': await run_cold_cache(config=config, catalog=catalog, plan=plan),
+        'warm_cache': await run_warm_cache(config=config, catalog=catalog, plan=plan, randomizer=randomizer),
+        'auth_cache_miss': await run_warm_cache(
+            config=config,
+            catalog=catalog,
+            plan=plan,
+            randomizer=randomizer,
+            create_headers=lambda: {'Authorization': f'Bearer {create_token()}'},
+        ),
+    }
+
+
+def get_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict, baseline: dict) -> dict:
+    comparison = {}
+
+    for scenario, summary in current['scenarios'].items():
+        baseline_summary = baseline.get('scenarios', {}).get(scenario)
+
+        if baseline_summary is None:
+            continue
+
+        comparison[scenario] = {
+            metric: {
+                'baseline': baseline_summary[metric],
+                'current': summary[metric],
+                'change_percent': round((summary[metric] / baseline_summary[metric] - 1) * 100, 1)
+                if baseline_summary[metric] else None,
+            }
+            for metric in ('rps', 'p50_ms', 'p95_ms', 'p99_ms')
+        }
+
+    return comparison
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Measure throughput and latency of the movies API against in-process fakes.',
+    )
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--warm-set-size', type=int, default=200)
+    parser.add_argument('--films', type=int, default=1000)
+    parser.add_argument('--genres', type=int, default=20)
+    parser.add_argument('--persons', type=int, default=500)
+    parser.add_argument('--elasticsearch-latency-ms', type=float, default=2.0)
+    parser.add_argument('--redis-latency-ms', type=float, default=0.2)
+    parser.add_argument('--auth-latency-ms', type=float, default=5.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, help='Write results as JSON to this file.')
+    parser.add_argument('--compare', type=Path, help='Print the change against a previous results file.')
+    args = parser.parse_args()
+
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+
+    config = BenchmarkConfig(
+        requests=args.requests,
+        concurrency=args.concurrency,
+        warm_set_size=args.warm_set_size,
+        films_count=args.films,
+        genres_count=args.genres,
+        persons_count=args.persons,
+        elasticsearch_latency=args.elasticsearch_latency_ms / 1000,
+        redis_latency=args.redis_latency_ms / 1000,
+        auth_latency=args.auth_latency_ms / 1000,
+        seed=args.seed,
+    )
+    results = {
+        'commit': get_commit(),
+        'created_at': datetime.datetime.now(datetime.UTC).isoformat(),
+        'config': dataclasses.asdict(config),
+        'scenarios': asyncio.run(run_benchmark(config)),
+    }
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.compare is not None:
+        results['comparison'] = compare(results, json.loads(args.compare.read_text()))
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -24,6 +24,19 @@ class RedisConfig(BaseSettings):
     host: str = 'localhost'
     port: int = 5432
     cache_expire_in_seconds: int = 60 * 5
+    changes_stream: str = 'search:changes'
+    versions_key: str = 'search:versions'
+
+
+class CacheConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='cache_')
+
+    memory_enabled: bool = True
+    memory_max_size: int = 1000
+    memory_expire_in_seconds: int = 60
+    soft_expire_in_seconds: int = 60 * 4
+    early_expire_beta: float = 1.0
+    invalidation_enabled: bool = True
 
 
 class ElasticConfig(BaseSettings):
@@ -37,6 +50,8 @@ class ElasticConfig(BaseSettings):
     index_name_genres: str = 'genres'
     index_name_persons: str = 'persons'
 
+    point_in_time_keep_alive: str = '1m'
+
     @property
     def url(self) -> str:
         return f'{self.scheme}://{self.host}:{self.port}'
@@ -49,6 +64,14 @@ class AuthConfig(BaseSettings):
     host: str = 'localhost'
     port: int = 8000
 
+    secret_key: str | None = None
+    jwt_algorithm: str = 'HS256'
+    jwt_audience: list[str] = ['users:auth']
+
+    user_cache_max_size: int = 10_000
+    user_cache_expire_in_seconds: int = 60
+    user_cache_redis_enabled: bool = True
+
     @property
     def oauth2_token_url(self) -> str:
         return '/auth/api/v1/jwt/login'
@@ -71,6 +94,7 @@ class SentryConfig(BaseSettings):
 class Settings(BaseSettings):
     project: ProjectConfig = ProjectConfig()
     redis: RedisConfig = RedisConfig()
+    cache: CacheConfig = CacheConfig()
     elasticsearch: ElasticConfig = ElasticConfig()
     auth: AuthConfig = AuthConfig()
     otel: OpenTelemetryConfig = OpenTelemetryConfig()
@@ -24,6 +24,16 @@ from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapProp
 
 from .api.v1.endpoints import films, genres, persons
 from .core import LOGGING, settings
+from .services.auth import AuthSuperuserDep
+from .services.auth.cache import create_auth_user_memory_cache
+from .services.cache import (
+    CacheVersions,
+    MemoryCacheStoreDep,
+    SingleFlight,
+    create_cache_service,
+)
+from .services.cache.backends.tiered.service import create_memory_cache_store
+from .services.search.invalidation import run_search_cache_invalidator
 
 logging.config.dictConfig(LOGGING)
 
@@ -58,6 +68,30 @@ def configure_otel() -> None:
     ]))
 
 
+@asynccontextmanager
+async def create_app_state(*,
+                           httpx_client: httpx.AsyncClient,
+                           redis_client: redis.Redis,
+                           elasticsearch_client: elasticsearch.AsyncElasticsearch) -> AsyncGenerator[dict]:
+    memory_cache_store = create_memory_cache_store()
+    cache_versions = CacheVersions()
+
+    async with run_search_cache_invalidator(
+            redis_client=redis_client,
+            cache_service=create_cache_service(redis_client=redis_client, memory_cache_store=memory_cache_store),
+            cache_versions=cache_versions,
+    ):
+        yield {
+            'httpx_client': httpx_client,
+            'redis_client': redis_client,
+            'elasticsearch_client': elasticsearch_client,
+            'auth_user_memory_cache': create_auth_user_memory_cache(),
+            'memory_cache_store': memory_cache_store,
+            'cache_versions': cache_versions,
+            'single_flight': SingleFlight(),
+        }
+
+
 @asynccontextmanager
 async def lifespan(_app) -> AsyncGenerator[dict]:
     configure_otel()
@@ -66,12 +100,13 @@ async def lifespan(_app) -> AsyncGenerator[dict]:
         httpx.AsyncClient() as httpx_client,
         redis.Redis(host=settings.redis.host, port=settings.redis.port) as redis_client,
         elasticsearch.AsyncElasticsearch(settings.elasticsearch.url) as elasticsearch_client,
+        create_app_state(
+            httpx_client=httpx_client,
+            redis_client=redis_client,
+            elasticsearch_client=elasticsearch_client,
+        ) as state,
     ):
-        yield {
-            'httpx_client': httpx_client,
-            'redis_client': redis_client,
-            'elasticsearch_client': elasticsearch_client,
-        }
+        yield state
 
 
 base_api_prefix = '/api'
@@ -111,6 +146,11 @@ async def healthcheck():
     return {}
 
 
+@app.get(f'{base_api_prefix}/_cache', include_in_schema=False)
+async def cache_stats(memory_cache_store: MemoryCacheStoreDep, _user: AuthSuperuserDep):
+    return memory_cache_store.get_stats()
+
+
 movies_api_prefix = f'{base_api_prefix}/v1'
 
 app.include_router(films.router, prefix=f'{movies_api_prefix}/films', tags=['films'])
@@ -5,11 +5,13 @@ import uuid
 from pydantic import BaseModel, Field
 
 
+# Declared first, so Person is complete and its serializer is built on definition.
+class PersonFilmRoles(BaseModel):
+    id: uuid.UUID = Field(serialization_alias='uuid')
+    roles: list[str]
+
+
 class Person(BaseModel):
     id: uuid.UUID = Field(serialization_alias='uuid')
     full_name: str
     films: list[PersonFilmRoles]
-
-class PersonFilmRoles(BaseModel):
-    id: uuid.UUID = Field(serialization_alias='uuid')
-    roles: list[str]
@@ -1 +1,4 @@
-from .user import AuthUserDep
+from .user import (
+    AuthUserDep,
+    AuthSuperuserDep,
+)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from ..cache import (
+    AbstractCache,
+    CacheServiceDep,
+    LRUCache,
+)
+from ...core import settings
+from ...models import User
+
+
+class AuthUserCache:
+    memory_cache: LRUCache[User]
+    cache: AbstractCache | None
+
+    def __init__(self, *, memory_cache: LRUCache[User], cache: AbstractCache | None = None) -> None:
+        self.memory_cache = memory_cache
+        self.cache = cache
+
+    async def get(self, token: str) -> User | None:
+        cache_key = self._create_cache_key(token)
+        user = self.memory_cache.get(cache_key)
+
+        if user is not None:
+            return user
+
+        if self.cache is None:
+            return None
+
+        user_json = await self.cache.get(cache_key)
+
+        if user_json is None:
+            return None
+
+        user = User.model_validate_json(user_json)
+        self.memory_cache.set(cache_key, user)
+
+        return user
+
+    async def set(self, token: str, user: User, *, timeout: float | None = None) -> None:
+        cache_timeout = settings.auth.user_cache_expire_in_seconds
+
+        if timeout is not None:
+            cache_timeout = int(min(cache_timeout, timeout))
+
+        if cache_timeout <= 0:
+            return
+
+        cache_key = self._create_cache_key(token)
+        self.memory_cache.set(cache_key, user, timeout=cache_timeout)
+
+        if self.cache is not None:
+            await self.cache.set(cache_key, user.model_dump_json(), timeout=cache_timeout)
+
+    def _create_cache_key(self, token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+
+def create_auth_user_memory_cache() -> LRUCache[User]:
+    return LRUCache[User](
+        max_size=settings.auth.user_cache_max_size,
+        timeout=settings.auth.user_cache_expire_in_seconds,
+    )
+
+
+async def get_auth_user_memory_cache(request: Request) -> LRUCache[User]:
+    return request.state.auth_user_memory_cache
+
+
+AuthUserMemoryCacheDep = Annotated[LRUCache[User], Depends(get_auth_user_memory_cache)]
+
+
+async def get_auth_user_cache(memory_cache: AuthUserMemoryCacheDep, cache_service: CacheServiceDep) -> AuthUserCache:
+    cache: AbstractCache | None = None
+
+    if settings.auth.user_cache_redis_enabled:
+        cache = cache_service.get_cache(key_prefix='auth-user')
+
+    return AuthUserCache(memory_cache=memory_cache, cache=cache)
+
+
+AuthUserCacheDep = Annotated[AuthUserCache, Depends(get_auth_user_cache)]
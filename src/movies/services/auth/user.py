@@ -5,11 +5,33 @@ from typing import Annotated
 import httpx
 from fastapi import HTTPException, Depends, status
 
+from .cache import AuthUserCacheDep
 from .client import AuthClientDep
+from .token import TokenDep
+from .verifier import (
+    InvalidToken,
+    TokenVerifierDep,
+)
 from ...models import User
 
 
-async def get_auth_user(auth_client: AuthClientDep) -> User:
+async def get_auth_user(token: TokenDep,
+                        token_verifier: TokenVerifierDep,
+                        auth_user_cache: AuthUserCacheDep,
+                        auth_client: AuthClientDep) -> User:
+    if not token:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+    try:
+        token_data = token_verifier.verify(token)
+    except InvalidToken:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+    user = await auth_user_cache.get(token)
+
+    if user is not None:
+        return user
+
     try:
         user_data = await auth_client.get_user_profile()
 
@@ -22,7 +44,20 @@ async def get_auth_user(auth_client: AuthClientDep) -> User:
     except httpx.HTTPError:
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
 
-    return User(**user_data)
+    user = User(**user_data)
+    await auth_user_cache.set(token, user, timeout=token_data.expires_in)
+
+    return user
 
 
 AuthUserDep = Annotated[User, Depends(get_auth_user)]
+
+
+async def get_auth_superuser(user: AuthUserDep) -> User:
+    if not user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+
+    return user
+
+
+AuthSuperuserDep = Annotated[User, Depends(get_auth_superuser)]
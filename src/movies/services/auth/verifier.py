@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import dataclasses
+import time
+from typing import Annotated
+
+import jwt
+from fastapi import Depends
+
+from ...core import settings
+
+
+class InvalidToken(Exception):
+    pass
+
+
+@dataclasses.dataclass(kw_only=True)
+class TokenData:
+    user_id: str
+    expires_at: float | None = None
+
+    @property
+    def expires_in(self) -> float | None:
+        if self.expires_at is None:
+            return None
+
+        return self.expires_at - time.time()
+
+
+class TokenVerifier:
+    secret: str | None
+    audience: list[str]
+    algorithm: str
+
+    def __init__(self,
+                 *,
+                 secret: str | None = None,
+                 audience: list[str] | None = None,
+                 algorithm: str = 'HS256') -> None:
+        self.secret = secret
+        self.audience = audience or ['users:auth']
+        self.algorithm = algorithm
+
+    def verify(self, token: str) -> TokenData:
+        try:
+            if self.secret is None:
+                data = jwt.decode(token, options={
+                    'verify_signature': False,
+                    'verify_exp': True,
+                })
+            else:
+                data = jwt.decode(
+                    token,
+                    self.secret,
+                    audience=self.audience,
+                    algorithms=[self.algorithm],
+                )
+        except jwt.PyJWTError:
+            raise InvalidToken
+
+        user_id = data.get('sub')
+        if user_id is None:
+            raise InvalidToken
+
+        expires_at = data.get('exp')
+
+        return TokenData(
+            user_id=str(user_id),
+            expires_at=float(expires_at) if expires_at is not None else None,
+        )
+
+
+async def get_token_verifier() -> TokenVerifier:
+    return TokenVerifier(
+        secret=settings.auth.secret_key,
+        audience=settings.auth.jwt_audience,
+        algorithm=settings.auth.jwt_algorithm,
+    )
+
+
+TokenVerifierDep = Annotated[TokenVerifier, Depends(get_token_verifier)]
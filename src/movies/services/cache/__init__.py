@@ -2,8 +2,21 @@ from .backends import (
     AbstractCache,
     AbstractCacheService,
     CacheServiceDep,
+    create_cache_service,
+    MemoryCacheStore,
+    MemoryCacheStoreDep,
 )
+from .lru import LRUCache
 from .parameterized import (
+    CacheEntry,
     Parameterizable,
     ParameterizedCache,
 )
+from .single_flight import (
+    SingleFlight,
+    SingleFlightDep,
+)
+from .versions import (
+    CacheVersions,
+    CacheVersionsDep,
+)
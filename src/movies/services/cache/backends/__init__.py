@@ -2,4 +2,11 @@ from .base import (
     AbstractCache,
     AbstractCacheService,
 )
-from .dependencies import CacheServiceDep
+from .dependencies import (
+    CacheServiceDep,
+    create_cache_service,
+)
+from .tiered import (
+    MemoryCacheStore,
+    MemoryCacheStoreDep,
+)
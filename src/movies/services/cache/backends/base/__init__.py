@@ -1,4 +1,5 @@
 from .cache import (
+    DEFAULT_TIMEOUT,
     AbstractCache,
     BaseCache,
 )
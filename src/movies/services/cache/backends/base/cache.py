@@ -1,6 +1,12 @@
 from __future__ import annotations
 
 import abc
+import json
+from typing import Any
+
+from .....core.config import settings
+
+DEFAULT_TIMEOUT = -1
 
 
 class AbstractCache(abc.ABC):
@@ -8,7 +14,22 @@ class AbstractCache(abc.ABC):
     async def get(self, key: str) -> str | None: ...
 
     @abc.abstractmethod
-    async def set(self, key: str, value: str) -> None: ...
+    async def set(self, key: str, value: str, *, timeout: int | None = DEFAULT_TIMEOUT) -> None: ...
+
+    @abc.abstractmethod
+    async def get_object(self, key: str) -> Any | None: ...
+
+    @abc.abstractmethod
+    async def set_object(self, key: str, value: Any, *, timeout: int | None = DEFAULT_TIMEOUT) -> None: ...
+
+    @abc.abstractmethod
+    async def get_objects(self, keys: list[str]) -> list[Any | None]: ...
+
+    @abc.abstractmethod
+    async def set_objects(self, values: dict[str, Any], *, timeout: int | None = DEFAULT_TIMEOUT) -> None: ...
+
+    @abc.abstractmethod
+    async def delete_objects(self, keys: list[str]) -> None: ...
 
 
 class BaseCache(AbstractCache):
@@ -29,12 +50,66 @@ class BaseCache(AbstractCache):
     @abc.abstractmethod
     async def _get_value(self, key: str) -> str | None: ...
 
-    async def set(self, key: str, value: str) -> None:
+    async def set(self, key: str, value: str, *, timeout: int | None = DEFAULT_TIMEOUT) -> None:
         cache_key = self._create_cache_key(key)
-        await self._set_value(cache_key, value)
+
+        if timeout == DEFAULT_TIMEOUT:
+            timeout = settings.redis.cache_expire_in_seconds
+
+        await self._set_value(cache_key, value, timeout=timeout)
+
+    @abc.abstractmethod
+    async def _set_value(self, key: str, value: str, *, timeout: int | None) -> None: ...
+
+    async def get_object(self, key: str) -> Any | None:
+        value_json = await self.get(key)
+
+        if value_json is None:
+            return None
+
+        return json.loads(value_json)
+
+    async def set_object(self, key: str, value: Any, *, timeout: int | None = DEFAULT_TIMEOUT) -> None:
+        await self.set(key, json.dumps(value), timeout=timeout)
+
+    async def get_objects(self, keys: list[str]) -> list[Any | None]:
+        if not keys:
+            return []
+
+        cache_keys = [self._create_cache_key(key) for key in keys]
+        values_json = await self._get_values(cache_keys)
+
+        return [
+            json.loads(value_json) if value_json is not None else None
+            for value_json in values_json
+        ]
+
+    @abc.abstractmethod
+    async def _get_values(self, keys: list[str]) -> list[str | None]: ...
+
+    async def set_objects(self, values: dict[str, Any], *, timeout: int | None = DEFAULT_TIMEOUT) -> None:
+        if not values:
+            return
+
+        if timeout == DEFAULT_TIMEOUT:
+            timeout = settings.redis.cache_expire_in_seconds
+
+        await self._set_values({
+            self._create_cache_key(key): json.dumps(value)
+            for key, value in values.items()
+        }, timeout=timeout)
+
+    @abc.abstractmethod
+    async def _set_values(self, values: dict[str, str], *, timeout: int | None) -> None: ...
+
+    async def delete_objects(self, keys: list[str]) -> None:
+        if not keys:
+            return
+
+        await self._delete_values([self._create_cache_key(key) for key in keys])
 
     @abc.abstractmethod
-    async def _set_value(self, key: str, value: str) -> None: ...
+    async def _delete_values(self, keys: list[str]) -> None: ...
 
     def _create_cache_key(self, key: str) -> str:
         return f'{self.key_prefix}:{self.key_version}:{key}'
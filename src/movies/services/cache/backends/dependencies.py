@@ -2,14 +2,39 @@ from __future__ import annotations
 
 from typing import Annotated
 
+import redis.asyncio as redis
 from fastapi import Depends
 
 from .base import AbstractCacheService
-from .redis import RedisCacheServiceDep
+from .redis import (
+    RedisCacheService,
+    RedisCacheServiceDep,
+)
+from .tiered import (
+    MemoryCacheStore,
+    TieredCacheService,
+    TieredCacheServiceDep,
+)
+from ....core import settings
 
 
-async def get_cache_service(cache_service: RedisCacheServiceDep) -> AbstractCacheService:
-    return cache_service
+def create_cache_service(*,
+                         redis_client: redis.Redis,
+                         memory_cache_store: MemoryCacheStore) -> AbstractCacheService:
+    redis_cache_service = RedisCacheService(redis_client=redis_client)
+
+    if settings.cache.memory_enabled:
+        return TieredCacheService(cache_service=redis_cache_service, memory_cache_store=memory_cache_store)
+
+    return redis_cache_service
+
+
+async def get_cache_service(redis_cache_service: RedisCacheServiceDep,
+                            tiered_cache_service: TieredCacheServiceDep) -> AbstractCacheService:
+    if settings.cache.memory_enabled:
+        return tiered_cache_service
+
+    return redis_cache_service
 
 
 CacheServiceDep = Annotated[AbstractCacheService, Depends(get_cache_service)]
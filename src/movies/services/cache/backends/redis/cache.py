@@ -7,7 +7,6 @@ import redis.asyncio as async_redis
 import redis.exceptions
 
 from ..base import BaseCache
-from .....core.config import settings
 
 
 class RedisCache(BaseCache):
@@ -28,5 +27,30 @@ class RedisCache(BaseCache):
             redis.exceptions.ConnectionError,
             redis.exceptions.TimeoutError,
     ))
-    async def _set_value(self, key: str, value: str) -> None:
-        await self.redis_client.set(key, value, ex=settings.redis.cache_expire_in_seconds)
+    async def _set_value(self, key: str, value: str, *, timeout: int | None) -> None:
+        await self.redis_client.set(key, value, ex=timeout)
+
+    @backoff.on_exception(backoff.expo, (
+            redis.exceptions.ConnectionError,
+            redis.exceptions.TimeoutError,
+    ))
+    async def _get_values(self, keys: list[str]) -> list[str | None]:
+        return await self.redis_client.mget(keys)
+
+    @backoff.on_exception(backoff.expo, (
+            redis.exceptions.ConnectionError,
+            redis.exceptions.TimeoutError,
+    ))
+    async def _set_values(self, values: dict[str, str], *, timeout: int | None) -> None:
+        async with self.redis_client.pipeline(transaction=False) as pipeline:
+            for key, value in values.items():
+                pipeline.set(key, value, ex=timeout)
+
+            await pipeline.execute()
+
+    @backoff.on_exception(backoff.expo, (
+            redis.exceptions.ConnectionError,
+            redis.exceptions.TimeoutError,
+    ))
+    async def _delete_values(self, keys: list[str]) -> None:
+        await self.redis_client.delete(*keys)
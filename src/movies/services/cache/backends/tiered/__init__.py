@@ -0,0 +1,7 @@
+from .cache import TieredCache
+from .service import (
+    MemoryCacheStore,
+    MemoryCacheStoreDep,
+    TieredCacheService,
+    TieredCacheServiceDep,
+)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ..base import (
+    DEFAULT_TIMEOUT,
+    AbstractCache,
+)
+from ...lru import LRUCache
+from ...stats import CacheStats
+
+
+class TieredCache(AbstractCache):
+    cache: AbstractCache
+    memory_cache: LRUCache[tuple[str, Any]]
+    memory_timeout: int | None
+    stats: CacheStats
+    namespace: str
+
+    def __init__(self,
+                 *,
+                 cache: AbstractCache,
+                 memory_cache: LRUCache[tuple[str, Any]],
+                 memory_timeout: int | None = None,
+                 stats: CacheStats,
+                 key_prefix: str | None = None,
+                 key_version: str | None = None) -> None:
+        self.cache = cache
+        self.memory_cache = memory_cache
+        self.memory_timeout = memory_timeout
+        self.stats = stats
+        self.namespace = f'{key_prefix or "cache"}:{key_version or "1.0"}'
+
+    async def get(self, key: str) -> str | None:
+        return await self.cache.get(key)
+
+    async def set(self, key: str, value: str, *, timeout: int | None = DEFAULT_TIMEOUT) -> None:
+        await self.cache.set(key, value, timeout=timeout)
+
+    async def get_object(self, key: str) -> Any | None:
+        memory_key = self._create_memory_key(key)
+        stats_prefix = self._create_stats_prefix(key)
+        entry = self.memory_cache.get(memory_key)
+
+        if entry is not None:
+            self.stats.hit(stats_prefix)
+            return entry[1]
+
+        value = await self.cache.get_object(key)
+
+        if value is None:
+            self.stats.miss(stats_prefix)
+            return None
+
+        self.stats.remote_hit(stats_prefix)
+        self.memory_cache.set(memory_key, (stats_prefix, value), timeout=self.memory_timeout)
+
+        return value
+
+    async def set_object(self, key: str, value: Any, *, timeout: int | None = DEFAULT_TIMEOUT) -> None:
+        self._set_memory_object(key, value, timeout=timeout)
+        await self.cache.set_object(key, value, timeout=timeout)
+
+    async def get_objects(self, keys: list[str]) -> list[Any | None]:
+        values: list[Any | None] = []
+        missing_keys: list[str] = []
+
+        for key in keys:
+            entry = self.memory_cache.get(self._create_memory_key(key))
+
+            if entry is None:
+                values.append(None)
+                missing_keys.append(key)
+                continue
+
+            self.stats.hit(self._create_stats_prefix(key))
+            values.append(entry[1])
+
+        if not missing_keys:
+            return values
+
+        missing_values = iter(await self.cache.get_objects(missing_keys))
+
+        for index, key in enumerate(keys):
+            if values[index] is not None:
+                continue
+
+            value = next(missing_values)
+            stats_prefix = self._create_stats_prefix(key)
+
+            if value is None:
+                self.stats.miss(stats_prefix)
+                continue
+
+            self.stats.remote_hit(stats_prefix)
+            self.memory_cache.set(self._create_memory_key(key), (stats_prefix, value), timeout=self.memory_timeout)
+            values[index] = value
+
+        return values
+
+    async def set_objects(self, values: dict[str, Any], *, timeout: int | None = DEFAULT_TIMEOUT) -> None:
+        for key, value in values.items():
+            self._set_memory_object(key, value, timeout=timeout)
+
+        await self.cache.set_objects(values, timeout=timeout)
+
+    async def delete_objects(self, keys: list[str]) -> None:
+        for key in keys:
+            self.memory_cache.delete(self._create_memory_key(key))
+
+        await self.cache.delete_objects(keys)
+
+    def _set_memory_object(self, key: str, value: Any, *, timeout: int | None = DEFAULT_TIMEOUT) -> None:
+        memory_timeout = self.memory_timeout
+
+        if timeout != DEFAULT_TIMEOUT and timeout is not None:
+            memory_timeout = timeout if memory_timeout is None else min(memory_timeout, timeout)
+
+        stats_prefix = self._create_stats_prefix(key)
+        self.memory_cache.set(self._create_memory_key(key), (stats_prefix, value), timeout=memory_timeout)
+
+    def _create_memory_key(self, key: str) -> str:
+        return f'{self.namespace}:{key}'
+
+    def _create_stats_prefix(self, key: str) -> str:
+        key_prefix, separator, _ = key.partition(':')
+        return f'{self.namespace}:{key_prefix if separator else key}'
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Annotated, Any
+
+from fastapi import Depends, Request
+
+from .cache import TieredCache
+from ..base import AbstractCacheService
+from ..redis import RedisCacheServiceDep
+from ...lru import LRUCache
+from ...stats import CacheStats
+from .....core import settings
+
+
+class MemoryCacheStore:
+    memory_cache: LRUCache[tuple[str, Any]]
+    stats: CacheStats
+
+    def __init__(self, *, max_size: int, timeout: int | None = None) -> None:
+        self.stats = CacheStats()
+        self.memory_cache = LRUCache[tuple[str, Any]](
+            max_size=max_size,
+            timeout=timeout,
+            on_evict=self._on_evict,
+        )
+
+    def get_stats(self) -> dict:
+        return {
+            'size': len(self.memory_cache),
+            'max_size': self.memory_cache.max_size,
+            'prefixes': self.stats.as_dict(),
+        }
+
+    def _on_evict(self, _key: str, entry: tuple[str, Any]) -> None:
+        self.stats.evict(entry[0])
+
+
+def create_memory_cache_store() -> MemoryCacheStore:
+    return MemoryCacheStore(
+        max_size=settings.cache.memory_max_size,
+        timeout=settings.cache.memory_expire_in_seconds,
+    )
+
+
+async def get_memory_cache_store(request: Request) -> MemoryCacheStore:
+    return request.state.memory_cache_store
+
+
+MemoryCacheStoreDep = Annotated[MemoryCacheStore, Depends(get_memory_cache_store)]
+
+
+class TieredCacheService(AbstractCacheService):
+    cache_service: AbstractCacheService
+    memory_cache_store: MemoryCacheStore
+
+    def __init__(self, *, cache_service: AbstractCacheService, memory_cache_store: MemoryCacheStore) -> None:
+        self.cache_service = cache_service
+        self.memory_cache_store = memory_cache_store
+
+    def get_cache(self,
+                  *,
+                  key_prefix: str | None = None,
+                  key_version: str | None = None) -> TieredCache:
+        return TieredCache(
+            cache=self.cache_service.get_cache(key_prefix=key_prefix, key_version=key_version),
+            memory_cache=self.memory_cache_store.memory_cache,
+            memory_timeout=settings.cache.memory_expire_in_seconds,
+            stats=self.memory_cache_store.stats,
+            key_prefix=key_prefix,
+            key_version=key_version,
+        )
+
+
+async def get_cache_service(redis_cache_service: RedisCacheServiceDep,
+                            memory_cache_store: MemoryCacheStoreDep) -> TieredCacheService:
+    return TieredCacheService(
+        cache_service=redis_cache_service,
+        memory_cache_store=memory_cache_store,
+    )
+
+
+TieredCacheServiceDep = Annotated[TieredCacheService, Depends(get_cache_service)]
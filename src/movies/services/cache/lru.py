@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+DEFAULT_TIMEOUT = -1
+
+
+class LRUCache[TValue]:
+    max_size: int
+    timeout: float | None
+    on_evict: Callable[[str, TValue], None] | None
+
+    hits: int
+    misses: int
+    evictions: int
+
+    _entries: OrderedDict[str, tuple[float | None, TValue]]
+
+    def __init__(self,
+                 *,
+                 max_size: int,
+                 timeout: float | None = None,
+                 on_evict: Callable[[str, TValue], None] | None = None) -> None:
+        self.max_size = max_size
+        self.timeout = timeout
+        self.on_evict = on_evict
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+
+    def get(self, key: str) -> TValue | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def set(self, key: str, value: TValue, *, timeout: float | None = DEFAULT_TIMEOUT) -> None:
+        if timeout == DEFAULT_TIMEOUT:
+            timeout = self.timeout
+
+        if timeout is not None and timeout <= 0:
+            self.delete(key)
+            return
+
+        expires_at = time.monotonic() + timeout if timeout is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            evicted_key, (_, evicted_value) = self._entries.popitem(last=False)
+            self.evictions += 1
+
+            if self.on_evict is not None:
+                self.on_evict(evicted_key, evicted_value)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import abc
+import dataclasses
+import functools
 import hashlib
-import json
+import math
+import random
+import time
+
+import pydantic_core
 
 from .backends import AbstractCache
+from .versions import CacheVersions
+from ...core import settings
 
 
 class Parameterizable(abc.ABC):
@@ -14,36 +22,103 @@ class Parameterizable(abc.ABC):
     @abc.abstractmethod
     def get_cache_params(self) -> dict: ...
 
+    def get_cache_key(self) -> str:
+        return self._cache_params_hash
+
+    def get_cache_version_key(self) -> str | None:
+        return None
+
+    @functools.cached_property
+    def _cache_params_hash(self) -> str:
+        cache_params_json = pydantic_core.to_json(self.get_cache_params())
+
+        return hashlib.blake2b(cache_params_json, digest_size=16).hexdigest()
+
+
+@dataclasses.dataclass(kw_only=True)
+class CacheEntry[TValue]:
+    value: TValue
+    created_at: float
+    expires_at: float
+    delta: float = 0.0
+
+    def should_refresh(self, *, beta: float = 1.0, now: float | None = None) -> bool:
+        if now is None:
+            now = time.time()
+
+        return now - self.delta * beta * math.log(1.0 - random.random()) >= self.expires_at
+
 
 class ParameterizedCache[TParams: Parameterizable, TValue]:
     cache: AbstractCache
-
-    def __init__(self, *, cache: AbstractCache) -> None:
+    soft_timeout: int
+    versions: CacheVersions | None
+
+    def __init__(self,
+                 *,
+                 cache: AbstractCache,
+                 soft_timeout: int | None = None,
+                 versions: CacheVersions | None = None) -> None:
         self.cache = cache
+        self.soft_timeout = settings.cache.soft_expire_in_seconds if soft_timeout is None else soft_timeout
+        self.versions = versions
 
     async def get(self, *, params: TParams) -> TValue | None:
-        cache_key = self._create_cache_key(params=params)
-        value_json: str | None = await self.cache.get(cache_key)
+        entry = await self.get_entry(params=params)
 
-        if value_json is None:
+        if entry is None:
             return None
 
-        return json.loads(value_json)
+        return entry.value
+
+    async def get_entry(self, *, params: TParams) -> CacheEntry[TValue] | None:
+        cache_key = self.create_cache_key(params=params)
+        entry_data = await self.cache.get_object(cache_key)
 
-    async def set(self, *, params: TParams, value: TValue) -> None:
-        cache_key = self._create_cache_key(params=params)
-        value_json = json.dumps(value)
+        return self._load_entry(entry_data)
 
-        await self.cache.set(cache_key, value_json)
+    async def get_entries(self, *, params_list: list[TParams]) -> list[CacheEntry[TValue] | None]:
+        cache_keys = [self.create_cache_key(params=params) for params in params_list]
+        entries_data = await self.cache.get_objects(cache_keys)
 
-    def _create_cache_key(self, *, params: TParams) -> str:
-        cache_prefix = params.get_cache_prefix()
-        cache_params = params.get_cache_params()
+        return [self._load_entry(entry_data) for entry_data in entries_data]
 
-        key_dict = {
-            'params': cache_params,
+    async def set(self, *, params: TParams, value: TValue, delta: float = 0.0) -> None:
+        cache_key = self.create_cache_key(params=params)
+        await self.cache.set_object(cache_key, self._dump_entry(value, delta=delta))
+
+    async def set_many(self, *, items: list[tuple[TParams, TValue]], delta: float = 0.0) -> None:
+        await self.cache.set_objects({
+            self.create_cache_key(params=params): self._dump_entry(value, delta=delta)
+            for params, value in items
+        })
+
+    async def delete_many(self, *, params_list: list[TParams]) -> None:
+        await self.cache.delete_objects([self.create_cache_key(params=params) for params in params_list])
+
+    def _load_entry(self, entry_data: dict | None) -> CacheEntry[TValue] | None:
+        if entry_data is None:
+            return None
+
+        try:
+            return CacheEntry[TValue](**entry_data)
+        except TypeError:
+            return None
+
+    def _dump_entry(self, value: TValue, *, delta: float) -> dict:
+        now = time.time()
+
+        return {
+            'value': value,
+            'created_at': now,
+            'expires_at': now + self.soft_timeout,
+            'delta': delta,
         }
-        key_json = json.dumps(key_dict, sort_keys=True)
-        key_hash = hashlib.sha256(key_json.encode()).hexdigest()
 
-        return f'{cache_prefix}-{key_hash}'
+    def create_cache_key(self, *, params: TParams) -> str:
+        version_key = params.get_cache_version_key()
+
+        if self.versions is None or version_key is None:
+            return f'{params.get_cache_prefix()}:{params.get_cache_key()}'
+
+        return f'{params.get_cache_prefix()}:{self.versions.get(version_key)}:{params.get_cache_key()}'
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any
+
+from fastapi import Depends, Request
+
+
+class SingleFlight:
+    tasks: dict[str, asyncio.Future[Any]]
+
+    def __init__(self) -> None:
+        self.tasks = {}
+
+    async def do[TResult](self, key: str, func: Callable[[], Awaitable[TResult]]) -> TResult:
+        task = self.schedule(key, func)
+        return await asyncio.shield(task)
+
+    def schedule[TResult](self, key: str, func: Callable[[], Awaitable[TResult]]) -> asyncio.Future[TResult]:
+        task = self.tasks.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self.tasks[key] = task
+            task.add_done_callback(functools.partial(self._on_done, key))
+
+        return task
+
+    def _on_done(self, key: str, task: asyncio.Future[Any]) -> None:
+        if self.tasks.get(key) is task:
+            del self.tasks[key]
+
+        if not task.cancelled():
+            task.exception()
+
+
+async def get_single_flight(request: Request) -> SingleFlight:
+    return request.state.single_flight
+
+
+SingleFlightDep = Annotated[SingleFlight, Depends(get_single_flight)]
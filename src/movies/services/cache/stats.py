@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import dataclasses
+from collections import defaultdict
+
+
+@dataclasses.dataclass(kw_only=True)
+class CacheCounters:
+    hits: int = 0
+    remote_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class CacheStats:
+    counters: defaultdict[str, CacheCounters]
+
+    def __init__(self) -> None:
+        self.counters = defaultdict(CacheCounters)
+
+    def hit(self, prefix: str) -> None:
+        self.counters[prefix].hits += 1
+
+    def remote_hit(self, prefix: str) -> None:
+        self.counters[prefix].remote_hits += 1
+
+    def miss(self, prefix: str) -> None:
+        self.counters[prefix].misses += 1
+
+    def evict(self, prefix: str) -> None:
+        self.counters[prefix].evictions += 1
+
+    def as_dict(self) -> dict[str, dict[str, int]]:
+        return {
+            prefix: dataclasses.asdict(counters)
+            for prefix, counters in sorted(self.counters.items())
+        }
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+
+class CacheVersions:
+    versions: dict[str, str]
+
+    def __init__(self) -> None:
+        self.versions = {}
+
+    def get(self, name: str) -> str:
+        return self.versions.get(name, '0')
+
+    def set(self, name: str, version: str) -> None:
+        self.versions[name] = version
+
+    def update(self, versions: dict[str, str]) -> None:
+        self.versions.update(versions)
+
+
+async def get_cache_versions(request: Request) -> CacheVersions:
+    return request.state.cache_versions
+
+
+CacheVersionsDep = Annotated[CacheVersions, Depends(get_cache_versions)]
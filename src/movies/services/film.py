@@ -4,6 +4,7 @@ import uuid
 from typing import Annotated
 
 from fastapi import Depends
+from pydantic import TypeAdapter
 
 from .search import (
     AbstractSearchService,
@@ -11,6 +12,8 @@ from .search import (
 )
 from ..models import Film
 
+film_list_adapter = TypeAdapter(list[Film])
+
 
 class FilmService:
     search_service: AbstractSearchService
@@ -25,7 +28,7 @@ class FilmService:
         if result is None:
             return []
 
-        return [Film(**data) for data in result]
+        return film_list_adapter.validate_python(result)
 
     async def get_list(
             self,
@@ -45,7 +48,29 @@ class FilmService:
         if result is None:
             return []
 
-        return [Film(**data) for data in result]
+        return film_list_adapter.validate_python(result)
+
+    async def get_list_cursor(
+            self,
+            sort: dict[str, str],
+            page_size: int,
+            genre_uuid: uuid.UUID | None = None,
+            cursor: dict | None = None,
+            snapshot: bool = False,
+    ) -> tuple[list[Film], dict | None]:
+        cursor_query = self.search_service.create_query().films_list_cursor(
+            sort=sort,
+            page_size=page_size,
+            genre_id=genre_uuid,
+            cursor=cursor,
+            snapshot=snapshot,
+        )
+        result = await self.search_service.search_cursor(query=cursor_query)
+
+        if result is None:
+            return [], None
+
+        return film_list_adapter.validate_python(result['results']), result['cursor']
 
     async def search(
             self,
@@ -63,7 +88,27 @@ class FilmService:
         if result is None:
             return []
 
-        return [Film(**data) for data in result]
+        return film_list_adapter.validate_python(result)
+
+    async def search_cursor(
+            self,
+            query: str,
+            page_size: int,
+            cursor: dict | None = None,
+            snapshot: bool = False,
+    ) -> tuple[list[Film], dict | None]:
+        cursor_query = self.search_service.create_query().search_films_cursor(
+            query=query,
+            page_size=page_size,
+            cursor=cursor,
+            snapshot=snapshot,
+        )
+        result = await self.search_service.search_cursor(query=cursor_query)
+
+        if result is None:
+            return [], None
+
+        return film_list_adapter.validate_python(result['results']), result['cursor']
 
     async def get_by_id(
             self,
@@ -75,7 +120,17 @@ class FilmService:
         if not data:
             return None
 
-        return Film(**data)
+        return Film.model_validate(data)
+
+    async def get_by_ids(
+            self,
+            ids: list[uuid.UUID],
+    ) -> list[Film]:
+        query_factory = self.search_service.create_query()
+        get_queries = [query_factory.get_film(film_id=film_id) for film_id in ids]
+        result = await self.search_service.get_many(queries=get_queries)
+
+        return film_list_adapter.validate_python([data for data in result if data])
 
 
 async def get_film_service(search_service: SearchServiceDep) -> FilmService:
@@ -4,6 +4,7 @@ import uuid
 from typing import Annotated
 
 from fastapi import Depends
+from pydantic import TypeAdapter
 
 from .search import (
     AbstractSearchService,
@@ -11,6 +12,8 @@ from .search import (
 )
 from ..models import Genre
 
+genre_list_adapter = TypeAdapter(list[Genre])
+
 
 class GenreService:
     search_service: AbstractSearchService
@@ -32,7 +35,7 @@ class GenreService:
         if result is None:
             return []
 
-        return [Genre(**data) for data in result]
+        return genre_list_adapter.validate_python(result)
 
     async def get_by_id(
             self,
@@ -44,7 +47,7 @@ class GenreService:
         if not data:
             return None
 
-        return Genre(**data)
+        return Genre.model_validate(data)
 
 
 async def get_genre_service(search_service: SearchServiceDep) -> GenreService:
@@ -4,6 +4,7 @@ import uuid
 from typing import Annotated
 
 from fastapi import Depends
+from pydantic import TypeAdapter
 
 from .search import (
     AbstractSearchService,
@@ -11,6 +12,8 @@ from .search import (
 )
 from ..models import Person
 
+person_list_adapter = TypeAdapter(list[Person])
+
 
 class PersonService:
     search_service: AbstractSearchService
@@ -34,7 +37,7 @@ class PersonService:
         if result is None:
             return []
 
-        return [Person(**data) for data in result]
+        return person_list_adapter.validate_python(result)
 
     async def get_by_id(
             self,
@@ -46,7 +49,17 @@ class PersonService:
         if not data:
             return None
 
-        return Person(**data)
+        return Person.model_validate(data)
+
+    async def get_by_ids(
+            self,
+            ids: list[uuid.UUID],
+    ) -> list[Person]:
+        query_factory = self.search_service.create_query()
+        get_queries = [query_factory.get_person(person_id=person_id) for person_id in ids]
+        result = await self.search_service.get_many(queries=get_queries)
+
+        return person_list_adapter.validate_python([data for data in result if data])
 
 
 async def get_person_service(search_service: SearchServiceDep) -> PersonService:
@@ -2,3 +2,7 @@ from .service import (
     AbstractSearchService,
     SearchServiceDep,
 )
+from .backends import (
+    CursorExpiredError,
+    InvalidCursorError,
+)
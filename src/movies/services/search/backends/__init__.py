@@ -1,9 +1,13 @@
 from .base import (
     AbstractSearchBackend,
+    CursorExpiredError,
+    InvalidCursorError,
     AbstractQuery,
     AbstractCompiledQuery,
     AbstractGetQuery,
+    AbstractCompiledGetQuery,
     AbstractSearchQuery,
+    AbstractCursorQuery,
     AbstractQueryFactory,
 )
 from .dependencies import SearchBackendDep
@@ -1,4 +1,8 @@
-from .backend import AbstractSearchBackend
+from .backend import (
+    AbstractSearchBackend,
+    CursorExpiredError,
+    InvalidCursorError,
+)
 from .query import (
     AbstractQuery,
     AbstractCompiledQuery,
@@ -6,5 +10,7 @@ from .query import (
     AbstractCompiledGetQuery,
     AbstractSearchQuery,
     AbstractCompiledSearchQuery,
+    AbstractCursorQuery,
+    AbstractCompiledCursorQuery,
     AbstractQueryFactory,
 )
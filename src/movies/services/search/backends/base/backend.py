@@ -5,16 +5,31 @@ import abc
 from .query import (
     AbstractCompiledGetQuery,
     AbstractCompiledSearchQuery,
+    AbstractCompiledCursorQuery,
     AbstractQueryFactory,
 )
 
 
+class CursorExpiredError(Exception):
+    pass
+
+
+class InvalidCursorError(Exception):
+    pass
+
+
 class AbstractSearchBackend(abc.ABC):
     @abc.abstractmethod
     async def get(self, *, query: AbstractCompiledGetQuery) -> dict | None: ...
 
+    @abc.abstractmethod
+    async def mget(self, *, queries: list[AbstractCompiledGetQuery]) -> list[dict | None]: ...
+
     @abc.abstractmethod
     async def search(self, *, query: AbstractCompiledSearchQuery) -> list[dict] | None: ...
 
+    @abc.abstractmethod
+    async def search_cursor(self, *, query: AbstractCompiledCursorQuery) -> dict | None: ...
+
     @abc.abstractmethod
     def create_query(self) -> AbstractQueryFactory: ...
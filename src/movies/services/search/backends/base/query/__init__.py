@@ -6,4 +6,6 @@ from .query import (
     AbstractCompiledGetQuery,
     AbstractSearchQuery,
     AbstractCompiledSearchQuery,
+    AbstractCursorQuery,
+    AbstractCompiledCursorQuery,
 )
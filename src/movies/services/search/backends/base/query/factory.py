@@ -6,6 +6,7 @@ import uuid
 from .query import (
     AbstractGetQuery,
     AbstractSearchQuery,
+    AbstractCursorQuery,
 )
 
 
@@ -24,9 +25,26 @@ class AbstractQueryFactory(abc.ABC):
                    page_size: int,
                    genre_id: uuid.UUID | None = None) -> AbstractSearchQuery: ...
 
+    @abc.abstractmethod
+    def films_list_cursor(self,
+                          *,
+                          sort: dict,
+                          page_size: int,
+                          genre_id: uuid.UUID | None = None,
+                          cursor: dict | None = None,
+                          snapshot: bool = False) -> AbstractCursorQuery: ...
+
     @abc.abstractmethod
     def search_films(self, *, query: str, page_number: int, page_size: int) -> AbstractSearchQuery: ...
 
+    @abc.abstractmethod
+    def search_films_cursor(self,
+                            *,
+                            query: str,
+                            page_size: int,
+                            cursor: dict | None = None,
+                            snapshot: bool = False) -> AbstractCursorQuery: ...
+
     @abc.abstractmethod
     def get_genre(self, *, genre_id: uuid.UUID) -> AbstractGetQuery: ...
 
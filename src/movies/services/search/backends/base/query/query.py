@@ -18,6 +18,9 @@ class AbstractCompiledQuery[TResult](Parameterizable):
     @abc.abstractmethod
     async def execute(self, *, backend: AbstractSearchBackend) -> TResult: ...
 
+    def is_cacheable(self) -> bool:
+        return True
+
 
 class AbstractGetQuery(AbstractQuery[dict | None]):
     @abc.abstractmethod
@@ -37,3 +40,13 @@ class AbstractSearchQuery(AbstractQuery[list[dict] | None]):
 class AbstractCompiledSearchQuery(AbstractCompiledQuery[list[dict] | None], abc.ABC):
     async def execute(self, *, backend: AbstractSearchBackend) -> list[dict] | None:
         return await backend.search(query=self)
+
+
+class AbstractCursorQuery(AbstractQuery[dict | None]):
+    @abc.abstractmethod
+    def compile(self) -> AbstractCompiledCursorQuery: ...
+
+
+class AbstractCompiledCursorQuery(AbstractCompiledQuery[dict | None], abc.ABC):
+    async def execute(self, *, backend: AbstractSearchBackend) -> dict | None:
+        return await backend.search_cursor(query=self)
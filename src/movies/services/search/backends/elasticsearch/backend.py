@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 from typing import Annotated
 
 import backoff
@@ -9,9 +10,15 @@ from fastapi import Depends
 from .query import (
     CompiledElasticsearchGetQuery,
     CompiledElasticsearchSearchQuery,
+    CompiledElasticsearchCursorQuery,
     ElasticsearchQueryFactory,
 )
-from ..base import AbstractSearchBackend
+from ..base import (
+    AbstractSearchBackend,
+    CursorExpiredError,
+    InvalidCursorError,
+)
+from .....core import settings
 from .....db import ElasticsearchClientDep
 
 
@@ -35,6 +42,24 @@ class ElasticsearchSearchBackend(AbstractSearchBackend):
 
         return response['_source']
 
+    @backoff.on_exception(backoff.expo, (
+            elasticsearch.exceptions.ConnectionError,
+            elasticsearch.exceptions.ConnectionTimeout,
+    ))
+    async def mget(self, *, queries: list[CompiledElasticsearchGetQuery]) -> list[dict | None]:  # type: ignore[override]
+        if not queries:
+            return []
+
+        response = await self.elasticsearch_client.mget(docs=[
+            {'_index': query.index, '_id': query.id}
+            for query in queries
+        ])
+
+        return [
+            document['_source'] if document.get('found') else None
+            for document in response['docs']
+        ]
+
     @backoff.on_exception(backoff.expo, (
             elasticsearch.exceptions.ConnectionError,
             elasticsearch.exceptions.ConnectionTimeout,
@@ -52,6 +77,61 @@ class ElasticsearchSearchBackend(AbstractSearchBackend):
 
         return [result['_source'] for result in results]
 
+    @backoff.on_exception(backoff.expo, (
+            elasticsearch.exceptions.ConnectionError,
+            elasticsearch.exceptions.ConnectionTimeout,
+    ))
+    async def search_cursor(self, *, query: CompiledElasticsearchCursorQuery) -> dict | None:  # type: ignore[override]
+        keep_alive = settings.elasticsearch.point_in_time_keep_alive
+        pit_id = query.pit_id
+
+        if query.snapshot and pit_id is None:
+            response = await self.elasticsearch_client.open_point_in_time(index=query.index, keep_alive=keep_alive)
+            pit_id = response['id']
+
+        try:
+            if pit_id is None:
+                response = await self.elasticsearch_client.search(index=query.index, body=query.body)
+            else:
+                response = await self.elasticsearch_client.search(body={
+                    **query.body,
+                    'pit': {'id': pit_id, 'keep_alive': keep_alive},
+                })
+        except elasticsearch.NotFoundError:
+            if pit_id is not None:
+                raise CursorExpiredError
+
+            return None
+        except elasticsearch.BadRequestError:
+            # The position comes from the client cursor, Elasticsearch rejects a malformed one.
+            if query.pit_id is not None or 'search_after' in query.body:
+                raise InvalidCursorError
+
+            raise
+
+        results = response['hits']['hits']
+        pit_id = response.get('pit_id', pit_id)
+
+        if len(results) < query.body['size']:
+            if pit_id is not None:
+                await self._close_point_in_time(pit_id)
+
+            if not results:
+                return None
+
+            return {'results': [result['_source'] for result in results], 'cursor': None}
+
+        cursor = {'search_after': results[-1]['sort']}
+
+        if pit_id is not None:
+            cursor['pit_id'] = pit_id
+
+        return {'results': [result['_source'] for result in results], 'cursor': cursor}
+
+    async def _close_point_in_time(self, pit_id: str) -> None:
+        with contextlib.suppress(elasticsearch.NotFoundError):
+            await self.elasticsearch_client.close_point_in_time(id=pit_id)
+
     def create_query(self) -> ElasticsearchQueryFactory:
         return self.query_factory
 
@@ -4,4 +4,6 @@ from .query import (
     CompiledElasticsearchGetQuery,
     ElasticsearchSearchQuery,
     CompiledElasticsearchSearchQuery,
+    ElasticsearchCursorQuery,
+    CompiledElasticsearchCursorQuery,
 )
@@ -10,6 +10,7 @@ from .indices import (
 from .query import (
     ElasticsearchGetQuery,
     ElasticsearchSearchQuery,
+    ElasticsearchCursorQuery,
 )
 from ...base import (
     AbstractGetQuery,
@@ -38,9 +39,37 @@ class ElasticsearchQueryFactory(AbstractQueryFactory):
             genre_id=genre_id,
         )
 
+    def films_list_cursor(self,
+                          *,
+                          sort: dict,
+                          page_size: int,
+                          genre_id: uuid.UUID | None = None,
+                          cursor: dict | None = None,
+                          snapshot: bool = False) -> ElasticsearchCursorQuery:
+        return films.FilmsListCursorQuery(
+            sort=sort,
+            page_size=page_size,
+            genre_id=genre_id,
+            cursor=cursor,
+            snapshot=snapshot,
+        )
+
     def search_films(self, *, query: str, page_number: int, page_size: int) -> AbstractSearchQuery:
         return films.SearchFilmsQuery(query=query, page_number=page_number, page_size=page_size)
 
+    def search_films_cursor(self,
+                            *,
+                            query: str,
+                            page_size: int,
+                            cursor: dict | None = None,
+                            snapshot: bool = False) -> ElasticsearchCursorQuery:
+        return films.SearchFilmsCursorQuery(
+            query=query,
+            page_size=page_size,
+            cursor=cursor,
+            snapshot=snapshot,
+        )
+
     def get_genre(self, *, genre_id: uuid.UUID) -> AbstractGetQuery:
         return genres.GetGenreQuery(genre_id=genre_id)
 
@@ -6,6 +6,8 @@ import uuid
 from ..query import (
     ElasticsearchGetQuery,
     ElasticsearchSearchQuery,
+    ElasticsearchCursorQuery,
+    add_sort_tiebreaker,
 )
 from .......core.config import settings
 
@@ -28,6 +30,11 @@ class BaseSearchFilmsQuery(ElasticsearchSearchQuery, abc.ABC):
         return settings.elasticsearch.index_name_films
 
 
+class BaseCursorFilmsQuery(ElasticsearchCursorQuery, abc.ABC):
+    def get_index(self) -> str:
+        return settings.elasticsearch.index_name_films
+
+
 class FilmsByPersonQuery(BaseSearchFilmsQuery):
     person_id: uuid.UUID
 
@@ -95,29 +102,55 @@ class FilmsListQuery(BaseSearchFilmsQuery):
 
     def get_body(self) -> dict:
         body = {
-            'sort': {
-                self.sort['field']: {
-                    'order': self.sort['order'],
+            'sort': add_sort_tiebreaker([
+                {
+                    self.sort['field']: {
+                        'order': self.sort['order'],
+                    },
                 },
-            },
+            ]),
             'size': self.page_size,
             'from': (self.page_number - 1) * self.page_size,
         }
 
         if self.genre_id is not None:
-            body['query'] = {
-                'nested': {
-                    'path': 'genres',
-                    'query': {
-                        'term': {
-                            'genres.id': str(self.genre_id),
-                        },
-                    },
-                },
-            }
+            body['query'] = create_genre_filter(self.genre_id)
+
+        return body
+
+
+class FilmsListCursorQuery(BaseCursorFilmsQuery):
+    sort: dict
+    genre_id: uuid.UUID | None
+
+    def __init__(self,
+                 *,
+                 sort: dict,
+                 page_size: int,
+                 genre_id: uuid.UUID | None = None,
+                 cursor: dict | None = None,
+                 snapshot: bool = False) -> None:
+        super().__init__(page_size=page_size, cursor=cursor, snapshot=snapshot)
+        self.sort = sort
+        self.genre_id = genre_id
+
+    def get_body(self) -> dict:
+        body = {}
+
+        if self.genre_id is not None:
+            body['query'] = create_genre_filter(self.genre_id)
 
         return body
 
+    def get_sort(self) -> list[dict]:
+        return [
+            {
+                self.sort['field']: {
+                    'order': self.sort['order'],
+                },
+            },
+        ]
+
 
 class SearchFilmsQuery(BaseSearchFilmsQuery):
     query: str
@@ -136,6 +169,57 @@ class SearchFilmsQuery(BaseSearchFilmsQuery):
                     'title': self.query,
                 },
             },
+            'sort': add_sort_tiebreaker([
+                {
+                    '_score': {
+                        'order': 'desc',
+                    },
+                },
+            ]),
             'size': self.page_size,
             'from': (self.page_number - 1) * self.page_size,
         }
+
+
+class SearchFilmsCursorQuery(BaseCursorFilmsQuery):
+    query: str
+
+    def __init__(self,
+                 *,
+                 query: str,
+                 page_size: int,
+                 cursor: dict | None = None,
+                 snapshot: bool = False) -> None:
+        super().__init__(page_size=page_size, cursor=cursor, snapshot=snapshot)
+        self.query = query
+
+    def get_body(self) -> dict:
+        return {
+            'query': {
+                'match': {
+                    'title': self.query,
+                },
+            },
+        }
+
+    def get_sort(self) -> list[dict]:
+        return [
+            {
+                '_score': {
+                    'order': 'desc',
+                },
+            },
+        ]
+
+
+def create_genre_filter(genre_id: uuid.UUID) -> dict:
+    return {
+        'nested': {
+            'path': 'genres',
+            'query': {
+                'term': {
+                    'genres.id': str(genre_id),
+                },
+            },
+        },
+    }
@@ -8,6 +8,8 @@ from ...base import (
     AbstractCompiledGetQuery,
     AbstractSearchQuery,
     AbstractCompiledSearchQuery,
+    AbstractCursorQuery,
+    AbstractCompiledCursorQuery,
 )
 
 
@@ -40,6 +42,9 @@ class CompiledElasticsearchGetQuery(AbstractCompiledGetQuery):
             'id': self.id,
         }
 
+    def get_cache_key(self) -> str:
+        return self.id
+
 
 class ElasticsearchSearchQuery(AbstractSearchQuery):
     def compile(self) -> CompiledElasticsearchSearchQuery:
@@ -69,3 +74,76 @@ class CompiledElasticsearchSearchQuery(AbstractCompiledSearchQuery):
             'index': self.index,
             'body': self.body,
         }
+
+    def get_cache_version_key(self) -> str:
+        return self.index
+
+
+class ElasticsearchCursorQuery(AbstractCursorQuery):
+    page_size: int
+    cursor: dict | None
+    snapshot: bool
+
+    def __init__(self, *, page_size: int, cursor: dict | None = None, snapshot: bool = False) -> None:
+        self.page_size = page_size
+        self.cursor = cursor
+        self.snapshot = snapshot
+
+    def compile(self) -> CompiledElasticsearchCursorQuery:
+        cursor = self.cursor or {}
+        pit_id = cursor.get('pit_id')
+
+        body = self.get_body()
+        body['sort'] = add_sort_tiebreaker(self.get_sort())
+        body['size'] = self.page_size
+
+        if cursor.get('search_after') is not None:
+            body['search_after'] = cursor['search_after']
+
+        return CompiledElasticsearchCursorQuery(
+            index=self.get_index(),
+            body=body,
+            pit_id=pit_id,
+            snapshot=self.snapshot or pit_id is not None,
+        )
+
+    @abc.abstractmethod
+    def get_index(self) -> str: ...
+
+    @abc.abstractmethod
+    def get_body(self) -> dict: ...
+
+    @abc.abstractmethod
+    def get_sort(self) -> list[dict]: ...
+
+
+@dataclasses.dataclass(kw_only=True)
+class CompiledElasticsearchCursorQuery(AbstractCompiledCursorQuery):
+    index: str
+    body: dict
+    pit_id: str | None = None
+    snapshot: bool = False
+
+    def get_cache_prefix(self) -> str:
+        return f'search-{self.index}'
+
+    def get_cache_params(self) -> dict:
+        return {
+            'command': 'search_cursor',
+            'index': self.index,
+            'body': self.body,
+        }
+
+    def get_cache_version_key(self) -> str:
+        return self.index
+
+    def is_cacheable(self) -> bool:
+        return not self.snapshot
+
+
+def add_sort_tiebreaker(sort: list[dict]) -> list[dict]:
+    # Documents with equal sort values keep one order across pages.
+    if not any('id' in item for item in sort):
+        sort.append({'id': {'order': 'asc'}})
+
+    return sort
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import AsyncGenerator, Awaitable
+from typing import cast
+
+import redis.asyncio as async_redis
+import redis.exceptions
+
+from .backends.elasticsearch.query import CompiledElasticsearchGetQuery
+from .service import get_search_cache
+from ..cache import (
+    AbstractCacheService,
+    CacheVersions,
+    ParameterizedCache,
+)
+from ...core import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SearchCacheInvalidator:
+    redis_client: async_redis.Redis
+    cache: ParameterizedCache[CompiledElasticsearchGetQuery, dict]
+    cache_versions: CacheVersions
+    stream_name: str
+    versions_key: str
+    block_timeout: int
+
+    def __init__(self,
+                 *,
+                 redis_client: async_redis.Redis,
+                 cache_service: AbstractCacheService,
+                 cache_versions: CacheVersions,
+                 stream_name: str,
+                 versions_key: str,
+                 block_timeout: int = 5000) -> None:
+        self.redis_client = redis_client
+        self.cache = ParameterizedCache[CompiledElasticsearchGetQuery, dict](cache=get_search_cache(cache_service))
+        self.cache_versions = cache_versions
+        self.stream_name = stream_name
+        self.versions_key = versions_key
+        self.block_timeout = block_timeout
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError):
+                logger.exception('Search cache invalidation stream is unavailable')
+                await asyncio.sleep(1)
+
+    async def load_versions(self) -> None:
+        # The client is typed for both the sync and the async API.
+        versions = await cast(Awaitable[dict[bytes, bytes]], self.redis_client.hgetall(self.versions_key))
+
+        self.cache_versions.update({
+            index.decode(): version.decode()
+            for index, version in versions.items()
+        })
+
+    async def _listen(self) -> None:
+        last_change_id = await self._get_last_change_id()
+        await self.load_versions()
+
+        while True:
+            response = await self.redis_client.xread(
+                {self.stream_name: last_change_id},
+                count=100,
+                block=self.block_timeout,
+            )
+
+            for _stream_name, changes in response:
+                for change_id, change in changes:
+                    await self._invalidate(change)
+                    last_change_id = change_id
+
+    async def _get_last_change_id(self) -> bytes | str:
+        changes = await self.redis_client.xrevrange(self.stream_name, count=1)
+
+        if not changes:
+            return '0-0'
+
+        return changes[0][0]
+
+    async def _invalidate(self, change: dict[bytes, bytes]) -> None:
+        try:
+            index = change[b'index'].decode()
+            ids = json.loads(change[b'ids'])
+        except (KeyError, ValueError):
+            logger.warning('Skip malformed search cache change: %s', change)
+            return
+
+        await self.cache.delete_many(params_list=[
+            CompiledElasticsearchGetQuery(index=index, id=str(id))
+            for id in ids
+        ])
+
+        version = await cast(Awaitable[bytes | None], self.redis_client.hget(self.versions_key, index))
+
+        if version is not None:
+            self.cache_versions.set(index, version.decode())
+
+
+@contextlib.asynccontextmanager
+async def run_search_cache_invalidator(*,
+                                       redis_client: async_redis.Redis,
+                                       cache_service: AbstractCacheService,
+                                       cache_versions: CacheVersions) -> AsyncGenerator[None]:
+    if not settings.cache.invalidation_enabled:
+        yield
+        return
+
+    invalidator = SearchCacheInvalidator(
+        redis_client=redis_client,
+        cache_service=cache_service,
+        cache_versions=cache_versions,
+        stream_name=settings.redis.changes_stream,
+        versions_key=settings.redis.versions_key,
+    )
+
+    try:
+        await invalidator.load_versions()
+    except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError):
+        logger.exception('Failed to load search cache versions')
+
+    task = asyncio.create_task(invalidator.run())
+
+    try:
+        yield
+    finally:
+        task.cancel()
+
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import abc
-from typing import Annotated
+import time
+from typing import Annotated, Any
 
 from fastapi import Depends
 
@@ -11,24 +12,37 @@ from .backends import (
     AbstractQuery,
     AbstractCompiledQuery,
     AbstractGetQuery,
+    AbstractCompiledGetQuery,
     AbstractSearchQuery,
+    AbstractCursorQuery,
     AbstractQueryFactory,
 )
 from ..cache import (
     AbstractCache,
     AbstractCacheService,
     CacheServiceDep,
+    CacheVersions,
+    CacheVersionsDep,
     ParameterizedCache,
+    SingleFlight,
+    SingleFlightDep,
 )
+from ...core import settings
 
 
 class AbstractSearchService(abc.ABC):
     @abc.abstractmethod
     async def get(self, *, query: AbstractGetQuery) -> dict | None: ...
 
+    @abc.abstractmethod
+    async def get_many(self, *, queries: list[AbstractGetQuery]) -> list[dict | None]: ...
+
     @abc.abstractmethod
     async def search(self, *, query: AbstractSearchQuery) -> list[dict] | None: ...
 
+    @abc.abstractmethod
+    async def search_cursor(self, *, query: AbstractCursorQuery) -> dict | None: ...
+
     @abc.abstractmethod
     def create_query(self) -> AbstractQueryFactory: ...
 
@@ -36,31 +50,120 @@ class AbstractSearchService(abc.ABC):
 class SearchService(AbstractSearchService):
     backend: AbstractSearchBackend
     cache: AbstractCache
-
-    def __init__(self, *, backend: AbstractSearchBackend, cache_service: AbstractCacheService) -> None:
+    single_flight: SingleFlight | None
+    cache_versions: CacheVersions | None
+
+    def __init__(self,
+                 *,
+                 backend: AbstractSearchBackend,
+                 cache_service: AbstractCacheService,
+                 single_flight: SingleFlight | None = None,
+                 cache_versions: CacheVersions | None = None) -> None:
         self.backend = backend
-        self.cache = cache_service.get_cache(key_prefix='search')
+        self.cache = get_search_cache(cache_service)
+        self.single_flight = single_flight
+        self.cache_versions = cache_versions
 
     async def get(self, *, query: AbstractGetQuery) -> dict | None:
         return await self._execute_query(query=query)
 
+    async def get_many(self, *, queries: list[AbstractGetQuery]) -> list[dict | None]:
+        cache = ParameterizedCache[AbstractCompiledGetQuery, dict | None](
+            cache=self.cache,
+            versions=self.cache_versions,
+        )
+        compiled_queries = [query.compile() for query in queries]
+        cache_entries = await cache.get_entries(params_list=compiled_queries)
+        results: list[dict | None] = [None] * len(compiled_queries)
+        missing_indexes: list[int] = []
+
+        for index, (compiled_query, cache_entry) in enumerate(zip(compiled_queries, cache_entries)):
+            if cache_entry is None:
+                missing_indexes.append(index)
+                continue
+
+            if cache_entry.should_refresh(beta=settings.cache.early_expire_beta):
+                self._refresh_query(cache=cache, compiled_query=compiled_query)
+
+            results[index] = cache_entry.value
+
+        if not missing_indexes:
+            return results
+
+        started_at = time.monotonic()
+        missing_results = await self.backend.mget(queries=[compiled_queries[index] for index in missing_indexes])
+        delta = time.monotonic() - started_at
+        loaded_items: list[tuple[AbstractCompiledGetQuery, dict | None]] = []
+
+        for index, result in zip(missing_indexes, missing_results):
+            if result is None:
+                continue
+
+            results[index] = result
+            loaded_items.append((compiled_queries[index], result))
+
+        await cache.set_many(items=loaded_items, delta=delta)
+
+        return results
+
     async def search(self, *, query: AbstractSearchQuery) -> list[dict] | None:
         return await self._execute_query(query=query)
 
-    async def _execute_query[TResult](self, *, query: AbstractQuery[TResult]) -> TResult | None:
-        cache = ParameterizedCache[AbstractCompiledQuery[TResult], TResult](cache=self.cache)
+    async def search_cursor(self, *, query: AbstractCursorQuery) -> dict | None:
+        return await self._execute_query(query=query)
+
+    async def _execute_query[TResult](self, *, query: AbstractQuery[TResult]) -> TResult:
+        cache = ParameterizedCache[AbstractCompiledQuery[TResult], TResult](
+            cache=self.cache,
+            versions=self.cache_versions,
+        )
         compiled_query = query.compile()
-        result = await cache.get(params=compiled_query)
 
+        if not compiled_query.is_cacheable():
+            return await compiled_query.execute(backend=self.backend)
+
+        cache_entry = await cache.get_entry(params=compiled_query)
+
+        if cache_entry is not None:
+            if cache_entry.should_refresh(beta=settings.cache.early_expire_beta):
+                self._refresh_query(cache=cache, compiled_query=compiled_query)
+
+            return cache_entry.value
+
+        if self.single_flight is None:
+            return await self._load_query(cache=cache, compiled_query=compiled_query)
+
+        return await self.single_flight.do(
+            cache.create_cache_key(params=compiled_query),
+            lambda: self._load_query(cache=cache, compiled_query=compiled_query),
+        )
+
+    def _refresh_query[TCompiledQuery: AbstractCompiledQuery[Any], TResult](
+            self,
+            *,
+            cache: ParameterizedCache[TCompiledQuery, TResult],
+            compiled_query: TCompiledQuery,
+    ) -> None:
+        if self.single_flight is None:
+            return
+
+        self.single_flight.schedule(
+            cache.create_cache_key(params=compiled_query),
+            lambda: self._load_query(cache=cache, compiled_query=compiled_query),
+        )
+
+    async def _load_query[TCompiledQuery: AbstractCompiledQuery[Any], TResult](
+            self,
+            *,
+            cache: ParameterizedCache[TCompiledQuery, TResult],
+            compiled_query: TCompiledQuery,
+    ) -> TResult:
+        started_at = time.monotonic()
+        result: TResult = await compiled_query.execute(backend=self.backend)
+
+        # Missing documents are not cached.
         if result is not None:
-            return result
-
-        result = await compiled_query.execute(backend=self.backend)
-
-        if result is None:
-            return None
-
-        await cache.set(params=compiled_query, value=result)
+            await cache.set(params=compiled_query, value=result, delta=time.monotonic() - started_at)
 
         return result
 
@@ -68,8 +171,20 @@ class SearchService(AbstractSearchService):
         return self.backend.create_query()
 
 
-async def get_search_service(backend: SearchBackendDep, cache_service: CacheServiceDep) -> AbstractSearchService:
-    return SearchService(backend=backend, cache_service=cache_service)
+def get_search_cache(cache_service: AbstractCacheService) -> AbstractCache:
+    return cache_service.get_cache(key_prefix='search', key_version='2.0')
+
+
+async def get_search_service(backend: SearchBackendDep,
+                             cache_service: CacheServiceDep,
+                             single_flight: SingleFlightDep,
+                             cache_versions: CacheVersionsDep) -> AbstractSearchService:
+    return SearchService(
+        backend=backend,
+        cache_service=cache_service,
+        single_flight=single_flight,
+        cache_versions=cache_versions,
+    )
 
 
 SearchServiceDep = Annotated[AbstractSearchService, Depends(get_search_service)]
@@ -65,3 +65,62 @@ async def test_get_login_history(
         history_response_data = await login_history_response.json()
 
     assert len(history_response_data) == expected_data['count_login']
+
+
+@pytest.mark.asyncio(loop_scope='session')
+async def test_get_login_history_pages(
+        aiohttp_session,
+        clean_all_tables_before,
+):
+    user_create_data = {
+        'login': 'test_user_pages',
+        'password': '123456',
+        'email': 'test_user_pages@test.loc',
+    }
+    register_url = urljoin(settings.auth_api_v1_url, 'register')
+
+    async with aiohttp_session.post(register_url, json=user_create_data) as register_response:
+        assert register_response.status == http.HTTPStatus.CREATED
+
+    user_login_data = {
+        'grant_type': 'password',
+        'username': user_create_data['login'],
+        'password': user_create_data['password'],
+    }
+    login_url = urljoin(settings.auth_api_v1_url, 'jwt/login')
+
+    for _ in range(3):
+        async with aiohttp_session.post(login_url, data=user_login_data) as login_response:
+            assert login_response.status == http.HTTPStatus.OK
+            login_response_data = await login_response.json()
+
+    headers = {
+        'Accept': 'application/json',
+        'Authorization': f'{login_response_data["token_type"].title()} {login_response_data["access_token"]}',
+    }
+    login_history_url = urljoin(settings.auth_api_v1_url, 'users/me/login-history')
+    params = {'page_size': 2}
+    pages = []
+
+    while True:
+        async with aiohttp_session.get(login_history_url, headers=headers, params=params) as login_history_response:
+            assert login_history_response.status == http.HTTPStatus.OK
+            page = await login_history_response.json()
+
+        pages.append(page)
+
+        if page['next_cursor'] is None:
+            break
+
+        params['cursor'] = page['next_cursor']
+
+    assert [len(page['items']) for page in pages] == [2, 1]
+
+    items = [item for page in pages for item in page['items']]
+    assert len({item['id'] for item in items}) == 3
+    assert [item['created'] for item in items] == sorted((item['created'] for item in items), reverse=True)
+
+    params['cursor'] = 'invalid'
+
+    async with aiohttp_session.get(login_history_url, headers=headers, params=params) as login_history_response:
+        assert login_history_response.status == http.HTTPStatus.BAD_REQUEST
@@ -0,0 +1,81 @@
+import http
+import uuid
+from urllib.parse import urljoin
+
+import pytest
+
+from ....settings import settings
+from ....utils.elasticsearch.models import (
+    Person,
+    PersonFilmRelation,
+)
+
+INDEX_NAME_PERSON = 'persons'
+
+
+# Collected before test_person_by_id, so the persons are serialized by a service that has not returned a person yet.
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        (
+            {'found': 3, 'missing': 1},
+            {'status': http.HTTPStatus.OK, 'length': 3}
+        ),
+        (
+            {'found': 0, 'missing': 0},
+            {'status': http.HTTPStatus.UNPROCESSABLE_ENTITY, 'length': None}
+        )
+    ]
+)
+@pytest.mark.asyncio(loop_scope='session')
+async def test_get_batch(
+        create_elasticsearch_index,
+        aiohttp_session,
+        auth_headers,
+        input,
+        expected
+):
+    persons = [
+        Person(
+            full_name=f'Person {i}',
+            films=[PersonFilmRelation(roles=['actor', 'writer'])],
+        )
+        for i in range(input['found'])
+    ]
+
+    elastic = await create_elasticsearch_index(index_name=INDEX_NAME_PERSON)
+    await elastic.load_documents(documents=persons)
+
+    ids = [str(person.id) for person in persons] + [str(uuid.uuid4()) for _ in range(input['missing'])]
+
+    url = urljoin(settings.movies_api_v1_url, 'persons/batch')
+    async with aiohttp_session.post(url, json={'ids': ids}, headers=auth_headers) as response:
+        status = response.status
+        data = await response.json()
+
+        assert status == expected['status']
+
+        if expected['length'] is not None:
+            assert [person['uuid'] for person in data] == ids[:expected['length']]
+            assert all(person['films'][0]['roles'] == ['actor', 'writer'] for person in data)
+
+
+@pytest.mark.asyncio(loop_scope='session')
+async def test_search(
+        create_elasticsearch_index,
+        aiohttp_session,
+        auth_headers,
+):
+    person = Person(full_name='Jeffry Jones', films=[PersonFilmRelation(roles=['director'])])
+
+    elastic = await create_elasticsearch_index(index_name=INDEX_NAME_PERSON)
+    await elastic.load_documents(documents=[person])
+
+    url = urljoin(settings.movies_api_v1_url, 'persons/search/')
+    async with aiohttp_session.get(url, params={'query': 'jones'}, headers=auth_headers) as response:
+        status = response.status
+        data = await response.json()
+
+        assert status == http.HTTPStatus.OK
+        assert [item['uuid'] for item in data] == [str(person.id)]
+        assert data[0]['films'][0]['roles'] == ['director']
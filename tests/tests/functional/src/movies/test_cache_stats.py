@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import uuid
+from urllib.parse import urljoin
+
+import http
+import pytest
+
+from ...settings import settings
+
+
+@pytest.mark.asyncio(loop_scope='session')
+async def test_cache_stats_unauthorized(aiohttp_session) -> None:
+    url = urljoin(settings.movies_api_url, '_cache')
+
+    async with aiohttp_session.get(url, headers={'X-Request-Id': str(uuid.uuid4())}) as response:
+        assert response.status == http.HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.asyncio(loop_scope='session')
+async def test_cache_stats_superuser(aiohttp_session, auth_headers) -> None:
+    url = urljoin(settings.movies_api_url, '_cache')
+
+    async with aiohttp_session.get(url, headers=auth_headers) as response:
+        assert response.status == http.HTTPStatus.OK
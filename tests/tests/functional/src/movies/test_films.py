@@ -1,3 +1,5 @@
+import base64
+import json
 import random
 import uuid
 from urllib.parse import urljoin
@@ -267,3 +269,155 @@ async def test_get_by_id_from_redis(
         data = await response.json()
 
         assert data['uuid'] == expected['uuid']
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        (
+            {'found': 3, 'missing': 1},
+            {'status': http.HTTPStatus.OK, 'length': 3}
+        ),
+        (
+            {'found': 0, 'missing': 0},
+            {'status': http.HTTPStatus.UNPROCESSABLE_ENTITY, 'length': None}
+        )
+    ]
+)
+@pytest.mark.asyncio(loop_scope='session')
+async def test_get_batch(
+        create_elasticsearch_index,
+        aiohttp_session,
+        auth_headers,
+        input,
+        expected
+):
+    films = [
+        Film(
+            title=f'The star. Episode {i}',
+            description=f'Description {i}',
+            rating=round(random.uniform(1.0, 10.0), 1),
+        )
+        for i in range(input['found'])
+    ]
+
+    elastic = await create_elasticsearch_index(index_name=INDEX_NAME_FILM)
+    await elastic.load_documents(documents=films)
+
+    ids = [str(film.id) for film in films] + [str(uuid.uuid4()) for _ in range(input['missing'])]
+
+    url = urljoin(settings.movies_api_v1_url, 'films/batch')
+    async with aiohttp_session.post(url, json={'ids': ids}, headers=auth_headers) as response:
+        status = response.status
+        data = await response.json()
+
+        assert status == expected['status']
+
+        if expected['length'] is not None:
+            assert [film['uuid'] for film in data] == ids[:expected['length']]
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        (
+            {'count': 25, 'page_size': 10, 'snapshot': 'false'},
+            {'status': http.HTTPStatus.OK, 'pages': 3, 'length': 25}
+        ),
+        (
+            {'count': 25, 'page_size': 10, 'snapshot': 'true'},
+            {'status': http.HTTPStatus.OK, 'pages': 3, 'length': 25}
+        ),
+        (
+            {'count': 10, 'page_size': 50, 'snapshot': 'false'},
+            {'status': http.HTTPStatus.OK, 'pages': 1, 'length': 10}
+        )
+    ]
+)
+@pytest.mark.asyncio(loop_scope='session')
+async def test_get_list_cursor(
+        create_elasticsearch_index,
+        aiohttp_session,
+        auth_headers,
+        input,
+        expected
+):
+    films = [
+        Film(
+            title=f'The star. Episode {i}',
+            description=f'Description {i}',
+            rating=round(random.uniform(1.0, 10.0), 1),
+        )
+        for i in range(input['count'])
+    ]
+
+    elastic = await create_elasticsearch_index(index_name=INDEX_NAME_FILM)
+    await elastic.load_documents(documents=films)
+
+    url = urljoin(settings.movies_api_v1_url, 'films/')
+    params = {'page_size': input['page_size'], 'snapshot': input['snapshot']}
+    film_uuids = []
+    pages = 0
+
+    while True:
+        async with aiohttp_session.get(url, params=params, headers=auth_headers) as response:
+            status = response.status
+            data = await response.json()
+            cursor = response.headers.get('X-Next-Cursor')
+
+        assert status == expected['status']
+
+        film_uuids.extend(film['uuid'] for film in data)
+        pages += 1
+
+        if cursor is None:
+            break
+
+        params = {'page_size': input['page_size'], 'cursor': cursor}
+
+    assert pages == expected['pages']
+    assert len(film_uuids) == len(set(film_uuids)) == expected['length']
+
+
+@pytest.mark.asyncio(loop_scope='session')
+async def test_get_list_invalid_cursor(
+        aiohttp_session,
+        auth_headers,
+):
+    url = urljoin(settings.movies_api_v1_url, 'films/')
+    async with aiohttp_session.get(url, params={'cursor': 'invalid'}, headers=auth_headers) as response:
+        assert response.status == http.HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    "state",
+    [
+        {'search_after': ['not a rating', 'not an id']},
+        {'search_after': [1.0], 'pit_id': 'not a point in time'},
+        {'search_after': 'not a list'},
+    ]
+)
+@pytest.mark.asyncio(loop_scope='session')
+async def test_get_list_edited_cursor(
+        create_elasticsearch_index,
+        aiohttp_session,
+        auth_headers,
+        state
+):
+    films = [Film(title=f'The star. Episode {i}', rating=5.0) for i in range(3)]
+
+    elastic = await create_elasticsearch_index(index_name=INDEX_NAME_FILM)
+    await elastic.load_documents(documents=films)
+
+    url = urljoin(settings.movies_api_v1_url, 'films/')
+    params = {'sort': '-imdb_rating', 'page_size': 2}
+
+    async with aiohttp_session.get(url, params=params, headers=auth_headers) as response:
+        cursor = response.headers['X-Next-Cursor']
+
+    data = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    data['state'] = state
+    cursor = base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip('=')
+
+    async with aiohttp_session.get(url, params={**params, 'cursor': cursor}, headers=auth_headers) as response:
+        assert response.status == http.HTTPStatus.BAD_REQUEST